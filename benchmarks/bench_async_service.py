@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: concurrent request throughput through AsyncStudentService
+
+Simulates an asyncio gateway serving a mix of requests (80% get_student,
+15% update_student, 5% search_students_by_prefix) against a loaded
+roster. Each request also awaits io_ms of simulated network/database
+latency, which is what concurrency hides. Throughput and latency are
+reported at several concurrency levels, next to plain synchronous calls
+on the same mix without the I/O. Usage:
+
+    python benchmarks/bench_async_service.py [requests] [io_ms]
+"""
+import sys
+import os
+import time
+import random
+import asyncio
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsaproject.src.services.async_service import AsyncStudentService
+from dsaproject.src.services.student_service import StudentService
+
+ROSTER = 100_000
+
+def make_requests(count):
+    requests = []
+    for _ in range(count):
+        roll = random.random()
+        student_id = random.randint(1, ROSTER)
+        if roll < 0.80:
+            requests.append(('get', student_id))
+        elif roll < 0.95:
+            requests.append(('update', student_id))
+        else:
+            requests.append(('prefix', f"Student{random.randint(1, 99)}"))
+    return requests
+
+def run_sync(service, requests):
+    for kind, arg in requests:
+        if kind == 'get':
+            service.get_student(arg)
+        elif kind == 'update':
+            service.update_student(arg, age=random.randint(18, 30))
+        else:
+            service.search_students_by_prefix(arg, limit=10)
+
+async def run_async(service, requests, concurrency, io_ms):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def handle(kind, arg):
+        async with semaphore:
+            start = time.perf_counter()
+            if io_ms:
+                await asyncio.sleep(io_ms / 1000)
+            if kind == 'get':
+                await service.get_student(arg)
+            elif kind == 'update':
+                await service.update_student(arg, age=random.randint(18, 30))
+            else:
+                await service.search_students_by_prefix(arg, limit=10)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(handle(kind, arg) for kind, arg in requests))
+    latencies.sort()
+    return latencies
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    io_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    random.seed(42)
+
+    service = StudentService(concurrent=True)
+    service.bulk_load((f"Student{i}", 18 + i % 12) for i in range(1, ROSTER + 1))
+    requests = make_requests(count)
+    print(f"{count:,} requests against {ROSTER:,} students, {io_ms:g}ms simulated I/O each")
+
+    start = time.perf_counter()
+    run_sync(service, requests)
+    elapsed = time.perf_counter() - start
+    print(f"   Sync, no I/O:        {count / elapsed:>10,.0f} req/s")
+
+    async_service = AsyncStudentService(service, max_workers=8)
+    for concurrency in (1, 16, 64, 256):
+        if concurrency == 1 and io_ms:
+            # Serial requests spend io_ms each, so use a sample
+            sample = requests[:max(1, min(count, int(2000 / io_ms)))]
+        else:
+            sample = requests
+        start = time.perf_counter()
+        latencies = asyncio.run(run_async(async_service, sample, concurrency, io_ms))
+        elapsed = time.perf_counter() - start
+        p50 = latencies[len(latencies) // 2] * 1000
+        p95 = latencies[int(len(latencies) * 0.95)] * 1000
+        print(f"   Async x{concurrency:<4}          {len(sample) / elapsed:>10,.0f} req/s   p50 {p50:.2f}ms  p95 {p95:.2f}ms")
+    async_service.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Benchmark: load sequential student IDs into the BinarySearchTree
+
+Sequential IDs are what StudentService hands out from next_id, which is the
+worst case for an unbalanced BST. Usage:
+
+    python benchmarks/bench_bst.py [count]
+"""
+import sys
+import os
+import time
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsaproject.src.datastructures.bst import BinarySearchTree
+from dsaproject.src.models.student import Student
+
+def load_sequential(count: int) -> BinarySearchTree:
+    """Insert students with IDs 1..count into a balanced tree."""
+    bst = BinarySearchTree(balanced=True)
+    for student_id in range(1, count + 1):
+        bst.insert(Student(id=student_id, name=f"Student {student_id}", age=18 + student_id % 10))
+    return bst
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print(f"Loading {count:,} sequential IDs into a balanced BST...")
+    start = time.perf_counter()
+    bst = load_sequential(count)
+    elapsed = time.perf_counter() - start
+    print(f"   Insert: {elapsed:.2f}s ({count / elapsed:,.0f} inserts/s)")
+    print(f"   Height: {bst.height()}")
+
+    start = time.perf_counter()
+    for student_id in range(1, count + 1, max(1, count // 100_000)):
+        bst.search(student_id)
+    elapsed = time.perf_counter() - start
+    print(f"   Search (100k lookups): {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Benchmark: restore a roster with StudentService.bulk_load
+
+Usage:
+
+    python benchmarks/bench_bulk_load.py [count]
+"""
+import sys
+import os
+import time
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsaproject.src.services.student_service import StudentService
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    records = [(f"Student {i}", 18 + i % 10, i) for i in range(1, count + 1)]
+
+    print(f"Bulk loading {count:,} records...")
+    service = StudentService()
+    start = time.perf_counter()
+    loaded = service.bulk_load(records)
+    elapsed = time.perf_counter() - start
+    print(f"   Loaded: {loaded} in {elapsed:.2f}s ({count / elapsed:,.0f} records/s)")
+    print(f"   Students: {service.get_student_count():,}, tree height: {service.bst.height()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory and lookup cost of the primary index implementations
+
+Measures the bytes each index allocates on top of the Student objects it
+stores (via tracemalloc), plus random lookup throughput. Usage:
+
+    python benchmarks/bench_index_memory.py [count ...]
+
+Defaults to 1,000,000 and 10,000,000 students. The 10M run needs several
+GB of RAM for the Student objects alone.
+"""
+import sys
+import os
+import gc
+import time
+import random
+import tracemalloc
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsaproject.src.datastructures.bst import BinarySearchTree
+from dsaproject.src.datastructures.sortedarray import SortedArrayIndex
+from dsaproject.src.models.student import Student
+
+def measure(index_class, students):
+    """Return (index, bytes allocated while building it)."""
+    gc.collect()
+    tracemalloc.start()
+    index = index_class.from_sorted(students)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return index, allocated
+
+def time_lookups(index, count, lookups=200_000):
+    keys = [random.randint(1, count) for _ in range(lookups)]
+    start = time.perf_counter()
+    for key in keys:
+        index.search(key)
+    return time.perf_counter() - start
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [1_000_000, 10_000_000]
+    for count in counts:
+        print(f"\n{count:,} students")
+        print("-" * 60)
+        # Share one name string so the Student objects stay as small as possible
+        students = [Student(id=i, name="Student", age=20) for i in range(1, count + 1)]
+        for index_class in (BinarySearchTree, SortedArrayIndex):
+            index, allocated = measure(index_class, students)
+            elapsed = time_lookups(index, count)
+            print(f"{index_class.__name__:<18} {allocated / 2**20:>9.1f} MiB "
+                  f"({allocated / count:5.1f} B/student)   200k lookups: {elapsed:.2f}s")
+            del index
+        del students
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fill and drain the task PriorityQueue
+
+StudentService enqueues a task for every add, update and delete, so the
+queue grows with the roster. Tasks use the service's priorities (add=1,
+update=2, delete=3) in a random mix. Usage:
+
+    python benchmarks/bench_priority_queue.py [count]
+"""
+import sys
+import os
+import time
+import random
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsaproject.src.datastructures.queue import PriorityQueue
+from dsaproject.src.models.student import Student
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(42)
+    student = Student(id=1, name="Student", age=20)
+    tasks = [random.choice((('add', 1), ('update', 2), ('delete', 3))) for _ in range(count)]
+
+    print(f"Enqueuing {count:,} tasks...")
+    pq = PriorityQueue()
+    start = time.perf_counter()
+    for task_type, priority in tasks:
+        pq.enqueue_task(task_type, student, priority=priority)
+    elapsed = time.perf_counter() - start
+    print(f"   Enqueue: {elapsed:.2f}s ({count / elapsed:,.0f} tasks/s)")
+
+    start = time.perf_counter()
+    pending = pq.get_all_tasks()
+    elapsed = time.perf_counter() - start
+    print(f"   get_all_tasks: {elapsed:.2f}s ({len(pending):,} tasks)")
+
+    start = time.perf_counter()
+    last_priority = None
+    while not pq.is_empty():
+        task = pq.process_next_task()
+        assert last_priority is None or task.priority <= last_priority
+        last_priority = task.priority
+    elapsed = time.perf_counter() - start
+    print(f"   Drain: {elapsed:.2f}s ({count / elapsed:,.0f} tasks/s)")
+
+if __name__ == "__main__":
+    main()
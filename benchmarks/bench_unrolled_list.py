@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: insertion-order list backends
+
+Compares the Node-per-student LinkedList with the chunked
+UnrolledLinkedList: append time, memory allocated on top of the Student
+objects (via tracemalloc), full iteration time, and deleting half of the
+students through the handles returned by append. Usage:
+
+    python benchmarks/bench_unrolled_list.py [count ...]
+
+Defaults to 100,000 and 1,000,000 students.
+"""
+import sys
+import os
+import gc
+import time
+import tracemalloc
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsaproject.src.datastructures.linkedlist import LinkedList
+from dsaproject.src.datastructures.unrolledlist import UnrolledLinkedList
+from dsaproject.src.models.student import Student
+
+def run(list_class, students):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    container = list_class()
+    handles = [container.append(student) for student in students]
+    append_time = time.perf_counter() - start
+    # Count only the container, not the handle list kept for the delete pass
+    allocated = tracemalloc.get_traced_memory()[0] - sys.getsizeof(handles)
+    tracemalloc.stop()
+    
+    start = time.perf_counter()
+    for _ in range(5):
+        for _ in container:
+            pass
+    iterate_time = (time.perf_counter() - start) / 5
+    
+    start = time.perf_counter()
+    for i in range(0, len(students), 2):
+        container.delete_by_id(students[i].id, handles[i])
+    delete_time = time.perf_counter() - start
+    assert len(container) == len(students) // 2
+    return append_time, allocated, iterate_time, delete_time
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    for count in counts:
+        print(f"\n{count:,} students")
+        print("-" * 78)
+        # Share one name string so the Student objects stay as small as possible
+        students = [Student(id=i, name="Student", age=20) for i in range(1, count + 1)]
+        for list_class in (LinkedList, UnrolledLinkedList):
+            append_time, allocated, iterate_time, delete_time = run(list_class, students)
+            print(f"{list_class.__name__:<20} append {append_time:6.2f}s  "
+                  f"{allocated / count:5.1f} B/student  iterate {iterate_time * 1000:7.1f}ms  "
+                  f"delete half {delete_time:6.2f}s")
+        del students
+
+if __name__ == "__main__":
+    main()
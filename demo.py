@@ -71,8 +71,8 @@ def demo_data_structures():
     
     # Show operation history
     print("\n📋 Operation History:")
-    history = service.get_operation_history()
-    for i, op in enumerate(history[-5:], 1):  # Show last 5 operations
+    history = service.get_operation_history(limit=5)
+    for i, op in enumerate(history, 1):  # Show last 5 operations
         print(f"   {i}. {op}")
     
     # Show pending tasks
@@ -1,92 +1,273 @@
-from typing import Optional, List
+from typing import Iterable, Iterator, Optional, List
 from ..models.student import Student
+from ..tracing import tracer, DEBUG, ERROR
 
 class BSTNode:
+    __slots__ = ('student', 'left', 'right', 'height', 'size')
+
     def __init__(self, student: Student):
         self.student = student
         self.left: Optional['BSTNode'] = None
         self.right: Optional['BSTNode'] = None
+        self.height = 1
+        self.size = 1  # Number of nodes in the subtree rooted here
+
+def _height(node: Optional[BSTNode]) -> int:
+    return node.height if node is not None else 0
+
+def _size(node: Optional[BSTNode]) -> int:
+    return node.size if node is not None else 0
+
+def _update(node: BSTNode) -> None:
+    """Recompute a node's height and subtree size from its children."""
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+def _rotate_right(node: BSTNode) -> BSTNode:
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+def _rotate_left(node: BSTNode) -> BSTNode:
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+def _rebalance(node: BSTNode) -> BSTNode:
+    """Restore the AVL invariant at node and return the new subtree root."""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+def _copy(node: BSTNode) -> BSTNode:
+    clone = BSTNode(node.student)
+    clone.left = node.left
+    clone.right = node.right
+    clone.height = node.height
+    clone.size = node.size
+    return clone
+
+def _rebalance_copy(node: BSTNode) -> BSTNode:
+    """Like _rebalance, but for a freshly copied node whose children may be
+    shared with older versions: any child a rotation would modify is copied
+    first, so existing nodes are never mutated."""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        node.left = _copy(node.left)
+        if _height(node.left.left) < _height(node.left.right):
+            node.left.right = _copy(node.left.right)
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        node.right = _copy(node.right)
+        if _height(node.right.right) < _height(node.right.left):
+            node.right.left = _copy(node.right.left)
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+def _build_balanced(students: List[Student], lo: int, hi: int) -> Optional[BSTNode]:
+    """Build a height-balanced subtree from students[lo:hi] (sorted by ID)."""
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    node = BSTNode(students[mid])
+    node.left = _build_balanced(students, lo, mid)
+    node.right = _build_balanced(students, mid + 1, hi)
+    _update(node)
+    return node
 
 class BinarySearchTree:
-    def __init__(self):
+    def __init__(self, balanced: bool = True):
+        """Create an empty tree. With balanced=True (the default) the tree
+        rebalances itself as an AVL tree so its height stays O(log n) even
+        for sequential IDs; balanced=False gives a plain, unbalanced BST."""
         self.root: Optional[BSTNode] = None
+        self.balanced = balanced
+
+    @classmethod
+    def from_sorted(cls, students: Iterable[Student], balanced: bool = True) -> 'BinarySearchTree':
+        """Build a height-balanced tree in O(n) from students sorted by
+        strictly increasing ID. Raises ValueError if the input is unsorted
+        or contains duplicate IDs."""
+        students = list(students)
+        for i in range(1, len(students)):
+            if students[i - 1].id >= students[i].id:
+                raise ValueError(f"Students must be sorted by unique ID (got {students[i - 1].id} before {students[i].id})")
+        tree = cls(balanced=balanced)
+        tree.root = _build_balanced(students, 0, len(students))
+        return tree
 
     def insert(self, student: Student) -> bool:
         """Insert a student into the BST. Returns True if successful."""
         try:
-            self.root = self._insert(self.root, student)
-            print(f"Inserted {student}")
+            self._insert(student)
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'bst.insert', f"Inserted {student}", student_id=student.id)
             return True
         except Exception as e:
-            print(f"Error inserting student: {e}")
+            tracer.emit(ERROR, 'bst.insert_failed', f"Error inserting student: {e}")
             return False
 
-    def _insert(self, node: Optional[BSTNode], student: Student) -> BSTNode:
-        if node is None:
-            return BSTNode(student)
-        
-        if student.id == node.student.id:
-            # Update existing student
-            node.student = student
-            return node
-        
-        if student.id < node.student.id:
-            node.left = self._insert(node.left, student)
+    def _insert(self, student: Student) -> None:
+        if self.root is None:
+            self.root = BSTNode(student)
+            return
+
+        # Walk down recording the path so we can rebalance on the way back up
+        path = []
+        node = self.root
+        while node is not None:
+            if student.id == node.student.id:
+                # Update existing student
+                node.student = student
+                return
+            path.append(node)
+            node = node.left if student.id < node.student.id else node.right
+
+        parent = path[-1]
+        if student.id < parent.student.id:
+            parent.left = BSTNode(student)
         else:
-            node.right = self._insert(node.right, student)
-        return node
+            parent.right = BSTNode(student)
+        self._retrace(path)
+
+    def _retrace(self, path: List[BSTNode]) -> None:
+        """Refresh heights and sizes on a root-to-leaf path, deepest first,
+        rebalancing along the way in balanced mode."""
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            if not self.balanced:
+                _update(node)
+                continue
+            subtree = _rebalance(node)
+            if subtree is not node:
+                self._replace_child(path[i - 1] if i > 0 else None, node, subtree)
+
+    def _replace_child(self, parent: Optional[BSTNode], old: BSTNode, new: Optional[BSTNode]) -> None:
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
 
     def search(self, student_id: int) -> Optional[Student]:
         """Search for a student by ID."""
         result = self._search(self.root, student_id)
         if result:
-            print(f"Found student with ID {student_id}")
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'bst.search', f"Found student with ID {student_id}", student_id=student_id, found=True)
             return result.student
         else:
-            print(f"Student with ID {student_id} not found")
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'bst.search', f"Student with ID {student_id} not found", student_id=student_id, found=False)
             return None
 
     def _search(self, node: Optional[BSTNode], student_id: int) -> Optional[BSTNode]:
-        if node is None or node.student.id == student_id:
-            return node
-        if student_id < node.student.id:
-            return self._search(node.left, student_id)
-        return self._search(node.right, student_id)
+        while node is not None and node.student.id != student_id:
+            node = node.left if student_id < node.student.id else node.right
+        return node
 
     def delete(self, student_id: int) -> bool:
         """Delete a student by ID. Returns True if successful."""
-        old_size = self.size()
-        self.root, deleted = self._delete(self.root, student_id)
+        deleted = self._delete(student_id)
         if deleted:
-            print(f"Deleted student with ID {student_id}")
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'bst.delete', f"Deleted student with ID {student_id}", student_id=student_id, deleted=True)
         else:
-            print(f"Student with ID {student_id} not found for deletion")
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'bst.delete', f"Student with ID {student_id} not found for deletion", student_id=student_id, deleted=False)
         return deleted
 
-    def _delete(self, node: Optional[BSTNode], student_id: int) -> tuple[Optional[BSTNode], bool]:
+    def _delete(self, student_id: int) -> bool:
+        path = []
+        node = self.root
+        while node is not None and node.student.id != student_id:
+            path.append(node)
+            node = node.left if student_id < node.student.id else node.right
         if node is None:
-            return node, False
-        
-        if student_id < node.student.id:
-            node.left, deleted = self._delete(node.left, student_id)
-            return node, deleted
-        elif student_id > node.student.id:
-            node.right, deleted = self._delete(node.right, student_id)
-            return node, deleted
-        else:
-            # Found the node to delete
-            if node.left is None:
-                return node.right, True
-            elif node.right is None:
-                return node.left, True
-            else:
-                # Node has two children: get inorder successor
-                succ = node.right
-                while succ.left:
-                    succ = succ.left
-                node.student = succ.student
-                node.right, _ = self._delete(node.right, succ.student.id)
-                return node, True
+            return False
+
+        if node.left is not None and node.right is not None:
+            # Node has two children: move the inorder successor's student up
+            # and unlink the successor instead
+            path.append(node)
+            succ = node.right
+            while succ.left is not None:
+                path.append(succ)
+                succ = succ.left
+            node.student = succ.student
+            node = succ
+
+        child = node.left if node.left is not None else node.right
+        self._replace_child(path[-1] if path else None, node, child)
+        self._retrace(path)
+        return True
+
+    def iter_inorder(self, start: int = 0) -> Iterator[Student]:
+        """Lazily yield students in sorted order (by ID), beginning with the
+        student at position start (0-based)."""
+        stack = []
+        node = self.root
+        if start > 0:
+            # Descend to the start position using subtree sizes, keeping the
+            # ancestors whose right-hand side still has to be visited
+            while node is not None:
+                left_size = _size(node.left)
+                if start < left_size:
+                    stack.append(node)
+                    node = node.left
+                elif start == left_size:
+                    stack.append(node)
+                    break
+                else:
+                    start -= left_size + 1
+                    node = node.right
+            node = None
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.student
+            node = node.right
+
+    def iter_reverse(self) -> Iterator[Student]:
+        """Lazily yield students in descending ID order."""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield node.student
+            node = node.left
+
+    def __iter__(self) -> Iterator[Student]:
+        return self.iter_inorder()
+
+    def __reversed__(self) -> Iterator[Student]:
+        return self.iter_reverse()
+
+    def __len__(self):
+        return _size(self.root)
 
     def get_all_students(self) -> List[Student]:
         """Get all students in sorted order (by ID)."""
@@ -95,19 +276,117 @@ class BinarySearchTree:
         return students
 
     def _inorder_traversal(self, node: Optional[BSTNode], students: List[Student]) -> None:
-        if node is not None:
-            self._inorder_traversal(node.left, students)
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
             students.append(node.student)
-            self._inorder_traversal(node.right, students)
+            node = node.right
 
     def size(self) -> int:
         """Get the number of students in the BST."""
-        return self._size(self.root)
+        return _size(self.root)
 
-    def _size(self, node: Optional[BSTNode]) -> int:
-        if node is None:
+    def height(self) -> int:
+        """Get the height of the tree (0 for an empty tree)."""
+        return _height(self.root)
+
+    def select(self, k: int) -> Optional[Student]:
+        """Get the student at position k (0-based) in ID order, or None."""
+        if k < 0 or k >= _size(self.root):
+            return None
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.student
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def rank(self, student_id: int) -> int:
+        """Get the number of students with an ID smaller than student_id."""
+        rank = 0
+        node = self.root
+        while node is not None:
+            if student_id <= node.student.id:
+                node = node.left
+            else:
+                rank += _size(node.left) + 1
+                node = node.right
+        return rank
+
+    def iter_range(self, lo_id: int, hi_id: int) -> Iterator[Student]:
+        """Lazily yield students with lo_id <= ID <= hi_id in ID order.
+        Subtrees outside the window are never visited: O(log n + k)."""
+        stack = []
+        node = self.root
+        # Seed the stack with the path to lo_id, skipping subtrees below it
+        while node is not None:
+            if node.student.id < lo_id:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if node.student.id > hi_id:
+                return
+            yield node.student
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    def range(self, lo_id: int, hi_id: int) -> List[Student]:
+        """Get all students with lo_id <= ID <= hi_id, sorted by ID."""
+        return list(self.iter_range(lo_id, hi_id))
+
+    def count_range(self, lo_id: int, hi_id: int) -> int:
+        """Count students with lo_id <= ID <= hi_id in O(log n)."""
+        if hi_id < lo_id:
             return 0
-        return 1 + self._size(node.left) + self._size(node.right)
+        return self.rank(hi_id + 1) - self.rank(lo_id)
+
+    def floor(self, student_id: int) -> Optional[Student]:
+        """Get the student with the largest ID <= student_id."""
+        best = None
+        node = self.root
+        while node is not None:
+            if node.student.id == student_id:
+                return node.student
+            if node.student.id < student_id:
+                best = node
+                node = node.right
+            else:
+                node = node.left
+        return best.student if best is not None else None
+
+    def ceiling(self, student_id: int) -> Optional[Student]:
+        """Get the student with the smallest ID >= student_id."""
+        best = None
+        node = self.root
+        while node is not None:
+            if node.student.id == student_id:
+                return node.student
+            if node.student.id > student_id:
+                best = node
+                node = node.left
+            else:
+                node = node.right
+        return best.student if best is not None else None
+
+    def successor(self, student_id: int) -> Optional[Student]:
+        """Get the student with the smallest ID strictly greater than student_id."""
+        return self.ceiling(student_id + 1)
+
+    def predecessor(self, student_id: int) -> Optional[Student]:
+        """Get the student with the largest ID strictly smaller than student_id."""
+        return self.floor(student_id - 1)
 
     def get_min_student(self) -> Optional[Student]:
         """Get student with minimum ID."""
@@ -125,4 +404,98 @@ class BinarySearchTree:
         node = self.root
         while node.right:
             node = node.right
-        return node.student
\ No newline at end of file
+        return node.student
+
+class PersistentBinarySearchTree(BinarySearchTree):
+    """Path-copying (persistent) variant of BinarySearchTree.
+
+    Writes never modify an existing node: insert and delete copy the
+    O(log n) nodes on the root-to-target path and then swap in the new
+    root, sharing every other subtree with the previous version. A
+    snapshot() is therefore O(1) and stays unchanged no matter what is
+    written afterwards, so readers can scan it without locks.
+    """
+
+    def snapshot(self) -> 'BSTSnapshot':
+        """Get an immutable view of the current version in O(1)."""
+        return BSTSnapshot(self.root, balanced=self.balanced)
+
+    def _insert(self, student: Student) -> None:
+        path = []
+        node = self.root
+        while node is not None:
+            if student.id == node.student.id:
+                # Update existing student in a copy of the node
+                subtree = _copy(node)
+                subtree.student = student
+                break
+            path.append(node)
+            node = node.left if student.id < node.student.id else node.right
+        else:
+            subtree = BSTNode(student)
+        self.root = self._rebuild(path, [student.id < n.student.id for n in path], subtree)
+
+    def _delete(self, student_id: int) -> bool:
+        path = []
+        went_left = []
+        node = self.root
+        while node is not None and node.student.id != student_id:
+            path.append(node)
+            went_left.append(student_id < node.student.id)
+            node = node.left if student_id < node.student.id else node.right
+        if node is None:
+            return False
+
+        target, replacement_student = node, None
+        if node.left is not None and node.right is not None:
+            # Node has two children: its copy takes the inorder successor's
+            # student and the successor is unlinked instead
+            path.append(node)
+            went_left.append(False)
+            succ = node.right
+            while succ.left is not None:
+                path.append(succ)
+                went_left.append(True)
+                succ = succ.left
+            replacement_student = succ.student
+            node = succ
+
+        child = node.left if node.left is not None else node.right
+        self.root = self._rebuild(path, went_left, child, target, replacement_student)
+        return True
+
+    def _rebuild(self, path: List[BSTNode], went_left: List[bool], subtree: Optional[BSTNode],
+                 target: Optional[BSTNode] = None, replacement_student: Optional[Student] = None) -> Optional[BSTNode]:
+        """Copy the nodes on path bottom-up, hanging subtree below the last
+        one, and return the new root."""
+        for i in range(len(path) - 1, -1, -1):
+            clone = _copy(path[i])
+            if path[i] is target:
+                clone.student = replacement_student
+            if went_left[i]:
+                clone.left = subtree
+            else:
+                clone.right = subtree
+            if self.balanced:
+                subtree = _rebalance_copy(clone)
+            else:
+                _update(clone)
+                subtree = clone
+        return subtree
+
+class BSTSnapshot(BinarySearchTree):
+    """Read-only view of a tree version. Supports every read method of
+    BinarySearchTree; insert and delete raise TypeError."""
+
+    def __init__(self, root: Optional[BSTNode] = None, balanced: bool = True):
+        super().__init__(balanced=balanced)
+        self.root = root
+
+    def snapshot(self) -> 'BSTSnapshot':
+        return self
+
+    def insert(self, student: Student) -> bool:
+        raise TypeError("BSTSnapshot is read-only")
+
+    def delete(self, student_id: int) -> bool:
+        raise TypeError("BSTSnapshot is read-only")
@@ -1,14 +1,26 @@
-from typing import Optional, List
+from typing import Iterable, Iterator, Optional, List
 from ..models.student import Student
+from ..tracing import tracer, DEBUG, ERROR
 
 class Node:
+    __slots__ = ('student', 'next', 'prev')
+
     def __init__(self, student: Student):
         self.student = student
         self.next: Optional['Node'] = None
+        self.prev: Optional['Node'] = None
 
 class LinkedList:
+    """Doubly linked list of students in insertion order.
+
+    The list keeps a tail pointer, so appending is O(1). append() returns
+    the new node; handing that node back to replace_student or
+    delete_by_id skips the linear scan.
+    """
+
     def __init__(self):
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None
         self.size_count = 0
 
     def insert_at_head(self, student: Student) -> bool:
@@ -16,41 +28,73 @@ class LinkedList:
         try:
             new_node = Node(student)
             new_node.next = self.head
+            if self.head:
+                self.head.prev = new_node
+            else:
+                self.tail = new_node
             self.head = new_node
             self.size_count += 1
-            print(f"Inserted {student} at head")
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'linkedlist.insert_at_head', f"Inserted {student} at head", student_id=student.id)
             return True
         except Exception as e:
-            print(f"Error inserting student: {e}")
+            tracer.emit(ERROR, 'linkedlist.insert_failed', f"Error inserting student: {e}")
             return False
 
     def insert_at_tail(self, student: Student) -> bool:
         """Insert a student at the tail of the linked list."""
+        return self.append(student) is not None
+
+    def append(self, student: Student) -> Optional[Node]:
+        """Insert a student at the tail and return its node, which can be
+        passed back to replace_student or delete_by_id as a handle.
+        Returns None on error."""
         try:
             new_node = Node(student)
-            if not self.head:
+            if not self.tail:
                 self.head = new_node
             else:
-                current = self.head
-                while current.next:
-                    current = current.next
-                current.next = new_node
+                new_node.prev = self.tail
+                self.tail.next = new_node
+            self.tail = new_node
             self.size_count += 1
-            print(f"Inserted {student} at tail")
-            return True
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'linkedlist.insert_at_tail', f"Inserted {student} at tail", student_id=student.id)
+            return new_node
         except Exception as e:
-            print(f"Error inserting student: {e}")
-            return False
+            tracer.emit(ERROR, 'linkedlist.insert_failed', f"Error inserting student: {e}")
+            return None
+
+    def extend(self, students: Iterable[Student]) -> List[Node]:
+        """Append students at the tail in one pass. Returns the new nodes."""
+        tail = self.tail
+        nodes = []
+        for student in students:
+            new_node = Node(student)
+            if tail is None:
+                self.head = new_node
+            else:
+                new_node.prev = tail
+                tail.next = new_node
+            tail = new_node
+            nodes.append(new_node)
+        self.tail = tail
+        self.size_count += len(nodes)
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'linkedlist.extend', f"Inserted {len(nodes)} students at tail", count=len(nodes))
+        return nodes
 
     def search_by_id(self, student_id: int) -> Optional[Student]:
         """Search for a student by ID."""
         current = self.head
         while current:
             if current.student.id == student_id:
-                print(f"Found student with ID {student_id}")
+                if tracer.debug_enabled:
+                    tracer.emit(DEBUG, 'linkedlist.search_by_id', f"Found student with ID {student_id}", student_id=student_id, found=True)
                 return current.student
             current = current.next
-        print(f"Student with ID {student_id} not found")
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'linkedlist.search_by_id', f"Student with ID {student_id} not found", student_id=student_id, found=False)
         return None
 
     def search_by_name(self, name: str) -> List[Student]:
@@ -62,37 +106,71 @@ class LinkedList:
                 matches.append(current.student)
             current = current.next
         if matches:
-            print(f"Found {len(matches)} student(s) with name '{name}'")
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'linkedlist.search_by_name', f"Found {len(matches)} student(s) with name '{name}'", name=name, matches=len(matches))
         else:
-            print(f"No students found with name '{name}'")
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'linkedlist.search_by_name', f"No students found with name '{name}'", name=name, matches=0)
         return matches
 
-    def delete_by_id(self, student_id: int) -> bool:
-        """Delete a student by ID."""
+    def _is_linked(self, node: Node) -> bool:
+        # Unlinked nodes have both links cleared and are not the head
+        return node.prev is not None or node is self.head
+
+    def _unlink(self, node: Node) -> None:
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        self.size_count -= 1
+
+    def delete_by_id(self, student_id: int, node: Optional[Node] = None) -> bool:
+        """Delete a student by ID. Passing the student's node (from append)
+        unlinks it in O(1) instead of scanning the list."""
         if not self.head:
-            print(f"List is empty, cannot delete student with ID {student_id}")
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'linkedlist.delete', f"List is empty, cannot delete student with ID {student_id}", student_id=student_id, deleted=False)
             return False
 
-        # If head node contains the student to delete
-        if self.head.student.id == student_id:
-            self.head = self.head.next
-            self.size_count -= 1
-            print(f"Deleted student with ID {student_id}")
-            return True
-
-        # Search for the student to delete
-        current = self.head
-        while current.next:
-            if current.next.student.id == student_id:
-                current.next = current.next.next
-                self.size_count -= 1
-                print(f"Deleted student with ID {student_id}")
+        current = node if node is not None and node.student.id == student_id and self._is_linked(node) else self.head
+        while current:
+            if current.student.id == student_id:
+                self._unlink(current)
+                if tracer.debug_enabled:
+                    tracer.emit(DEBUG, 'linkedlist.delete', f"Deleted student with ID {student_id}", student_id=student_id, deleted=True)
                 return True
             current = current.next
 
-        print(f"Student with ID {student_id} not found for deletion")
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'linkedlist.delete', f"Student with ID {student_id} not found for deletion", student_id=student_id, deleted=False)
         return False
 
+    def __iter__(self) -> Iterator[Student]:
+        """Lazily yield students in insertion order."""
+        node = self.head
+        while node:
+            # Read the link before yielding, so the caller may delete the
+            # current student without ending the iteration
+            next_node = node.next
+            yield node.student
+            node = next_node
+
+    def __reversed__(self) -> Iterator[Student]:
+        """Lazily yield students from the most recently inserted backwards."""
+        node = self.tail
+        while node:
+            prev_node = node.prev
+            yield node.student
+            node = prev_node
+
+    def __len__(self):
+        return self.size_count
+
     def get_all_students(self) -> List[Student]:
         """Get all students in insertion order."""
         students = []
@@ -113,8 +191,10 @@ class LinkedList:
     def clear(self):
         """Clear all students from the linked list."""
         self.head = None
+        self.tail = None
         self.size_count = 0
-        print("Cleared all students from linked list")
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'linkedlist.clear', "Cleared all students from linked list")
 
     def update_student(self, student_id: int, new_name: str = None, new_age: int = None) -> bool:
         """Update student information."""
@@ -125,8 +205,27 @@ class LinkedList:
                     current.student.name = new_name
                 if new_age is not None:
                     current.student.age = new_age
-                print(f"Updated student with ID {student_id}")
+                if tracer.debug_enabled:
+                    tracer.emit(DEBUG, 'linkedlist.update', f"Updated student with ID {student_id}", student_id=student_id, updated=True)
                 return True
             current = current.next
-        print(f"Student with ID {student_id} not found for update")
-        return False
\ No newline at end of file
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'linkedlist.update', f"Student with ID {student_id} not found for update", student_id=student_id, updated=False)
+        return False
+
+    def replace_student(self, student: Student, node: Optional[Node] = None) -> bool:
+        """Replace the stored student that has the same ID with student.
+        Unlike update_student this never mutates the old Student object, so
+        anyone still holding it (e.g. a tree snapshot) keeps seeing old data.
+        Passing the student's node (from append) makes this O(1)."""
+        current = node if node is not None and node.student.id == student.id and self._is_linked(node) else self.head
+        while current:
+            if current.student.id == student.id:
+                current.student = student
+                if tracer.debug_enabled:
+                    tracer.emit(DEBUG, 'linkedlist.replace', f"Replaced student with ID {student.id}", student_id=student.id, replaced=True)
+                return True
+            current = current.next
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'linkedlist.replace', f"Student with ID {student.id} not found for update", student_id=student.id, replaced=False)
+        return False
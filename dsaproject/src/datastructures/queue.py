@@ -1,48 +1,109 @@
-from typing import Optional, Any
+import threading
+import time
+from collections import deque
+from heapq import heapify, heappush, heappop
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from ..models.student import Student
+from ..tracing import tracer, DEBUG, ERROR
+
+_task_seq = count(1)
 
 class ProcessingTask:
     """Represents a task to be processed"""
-    def __init__(self, task_type: str, student: Student, priority: int = 0):
+    def __init__(self, task_type: str, student: Student, priority: int = 0, run_at: Optional[float] = None):
         self.task_type = task_type  # 'add', 'update', 'delete', 'search'
         self.student = student
         self.priority = priority
+        self.run_at = run_at  # time.monotonic() before which the task is held back
+        self.attempts = 0  # Failed runs so far, for retries
+        self.enqueued_at = time.monotonic()  # For queue-wait metrics
+        # Creation order, kept across delays and retries, so coalescing can
+        # tell which of two tasks for a student describes the older change
+        self.seq = next(_task_seq)
+
+# Task types that coalescing merges per student; others are always queued
+COALESCED_TYPES = ('add', 'update', 'delete')
+
+# Placeholder left in the heap for an entry that coalescing cancelled or
+# superseded; it is discarded when it reaches the top
+_REMOVED = object()
+
+def _merge_tasks(pending: ProcessingTask, task: ProcessingTask) -> Optional[ProcessingTask]:
+    """Get the single task equivalent to pending followed by task for the
+    same student, or None if the two cancel out. The result carries the
+    latest student data, the higher of the two priorities and the pending
+    task's enqueue time and sequence number."""
+    if pending.task_type == 'add':
+        if task.task_type == 'delete':
+            return None  # Added and deleted before anyone saw it
+        task_type = 'add'  # add + update is an add of the new data
+    elif pending.task_type == 'delete' and task.task_type == 'add':
+        task_type = 'update'  # Deleted and re-added: the record changed
+    else:
+        task_type = task.task_type  # update + update, update + delete
+    merged = ProcessingTask(task_type, task.student, max(pending.priority, task.priority))
+    merged.enqueued_at = pending.enqueued_at
+    merged.seq = pending.seq
+    return merged
 
 class Queue:
+    """FIFO queue backed by collections.deque: O(1) at both ends."""
+
     def __init__(self):
-        self._container = []
+        self._container = deque()
 
     def enqueue(self, item: Any) -> bool:
         """Add an item to the rear of the queue."""
         try:
-            self._container.insert(0, item)
-            if isinstance(item, ProcessingTask):
-                print(f"Enqueued task: {item.task_type} for student ID {item.student.id}")
-            else:
-                print(f"Enqueued {item}")
+            self._container.append(item)
+            if tracer.debug_enabled:
+                if isinstance(item, ProcessingTask):
+                    tracer.emit(DEBUG, 'queue.enqueue', f"Enqueued task: {item.task_type} for student ID {item.student.id}", task_type=item.task_type, student_id=item.student.id)
+                else:
+                    tracer.emit(DEBUG, 'queue.enqueue', f"Enqueued {item}")
             return True
         except Exception as e:
-            print(f"Error enqueuing item: {e}")
+            tracer.emit(ERROR, 'queue.enqueue_failed', f"Error enqueuing item: {e}")
             return False
 
     def dequeue(self) -> Optional[Any]:
         """Remove and return an item from the front of the queue."""
         if not self._container:
-            print("Cannot dequeue from empty queue")
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'queue.dequeue_empty', "Cannot dequeue from empty queue")
             return None
         
-        item = self._container.pop()  # Regular queue uses FIFO
-        if isinstance(item, ProcessingTask):
-            print(f"Dequeued task: {item.task_type} for student ID {item.student.id}")
-        else:
-            print(f"Dequeued {item}")
+        item = self._container.popleft()
+        if tracer.debug_enabled:
+            if isinstance(item, ProcessingTask):
+                tracer.emit(DEBUG, 'queue.dequeue', f"Dequeued task: {item.task_type} for student ID {item.student.id}", task_type=item.task_type, student_id=item.student.id)
+            else:
+                tracer.emit(DEBUG, 'queue.dequeue', f"Dequeued {item}")
         return item
 
     def front(self) -> Optional[Any]:
         """Peek at the front item without removing it."""
         if not self._container:
             return None
-        return self._container[-1]  # Regular queue: front is at the end
+        return self._container[0]
+
+    def enqueue_many(self, items: Iterable[Any]) -> int:
+        """Add items to the rear of the queue in order. Returns how many were added."""
+        before = len(self._container)
+        self._container.extend(items)
+        added = len(self._container) - before
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'queue.enqueue_many', f"Enqueued {added} items", count=added)
+        return added
+
+    def dequeue_many(self, max_items: int) -> List[Any]:
+        """Remove and return up to max_items items from the front, in order."""
+        container = self._container
+        items = [container.popleft() for _ in range(min(max_items, len(container)))]
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'queue.dequeue_many', f"Dequeued {len(items)} items", count=len(items))
+        return items
 
     def is_empty(self) -> bool:
         """Check if the queue is empty."""
@@ -55,61 +116,215 @@ class Queue:
     def clear(self):
         """Clear all items from the queue."""
         self._container.clear()
-        print("Cleared all items from queue")
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'queue.clear', "Cleared all items from queue")
 
 class PriorityQueue(Queue):
-    """A priority queue implementation for processing tasks"""
+    """A priority queue implementation for processing tasks.
+    
+    Backed by a binary heap (heapq) of [-priority, sequence, item] entries,
+    so enqueue and dequeue are O(log n). The sequence number keeps items of
+    equal priority in FIFO order and means items are never compared.
+    Items that are not ProcessingTasks get priority 0.
+    
+    A task whose run_at is in the future waits in a second heap ordered by
+    deadline and joins the priority heap once it is due, so it never
+    blocks ready tasks behind it. Delayed tasks count towards size().
+    
+    With coalesce=True at most one add/update/delete task is pending per
+    student: a new task for a student with a pending one is merged into it
+    (see _merge_tasks), found in O(1) through a student ID -> heap entry
+    dict. A merge that keeps the priority rewrites the entry in place, so
+    the task keeps its place in line; otherwise the old entry is marked
+    removed and a new one is pushed. Queue length then grows with the
+    number of distinct students rather than the number of writes.
+    """
+    
+    def __init__(self, coalesce: bool = False):
+        super().__init__()
+        self._container = []  # Heap of [-priority, sequence, item] entries
+        self._counter = count()
+        self.coalesce = coalesce
+        self._pending: Dict[int, list] = {}  # Student ID -> live coalesced entry
+        self._removed = 0  # Removed entries still in the heap
+        self._delayed = []  # Heap of [run_at, sequence, task] entries not yet due
+    
+    def _push(self, priority: int, item: Any) -> list:
+        entry = [-priority, next(self._counter), item]
+        heappush(self._container, entry)
+        return entry
+    
+    def _pop(self) -> Any:
+        """Pop the highest priority live item; the caller checks size() first."""
+        container = self._container
+        item = heappop(container)[2]
+        while item is _REMOVED:
+            self._removed -= 1
+            item = heappop(container)[2]
+        if self._pending and isinstance(item, ProcessingTask) and item.task_type in COALESCED_TYPES:
+            self._pending.pop(item.student.id, None)
+        return item
+    
+    def _ready_count(self) -> int:
+        return len(self._container) - self._removed
+    
+    def ready_size(self) -> int:
+        """Get the number of tasks that can be dequeued now, i.e. excluding
+        delayed tasks that are not yet due."""
+        self._promote_due()
+        return self._ready_count()
+    
+    def _promote_due(self) -> None:
+        """Move the delayed tasks that are now due onto the priority heap."""
+        delayed = self._delayed
+        if delayed:
+            now = time.monotonic()
+            while delayed and delayed[0][0] <= now:
+                self._enqueue_ready(heappop(delayed)[2])
+    
+    def next_due(self) -> Optional[float]:
+        """Get the seconds until the earliest delayed task is due (0 if one
+        is overdue), or None when no task is delayed."""
+        if not self._delayed:
+            return None
+        return max(0.0, self._delayed[0][0] - time.monotonic())
+    
+    def _coalesces(self, item: Any) -> bool:
+        """Whether enqueuing item would merge into a pending task instead of
+        adding one. A task that is not yet due waits in the delayed heap
+        without merging, so it never does."""
+        return (self.coalesce and isinstance(item, ProcessingTask)
+                and item.task_type in COALESCED_TYPES and item.student.id in self._pending
+                and (item.run_at is None or item.run_at <= time.monotonic()))
+    
+    def _merge_pending(self, task: ProcessingTask) -> None:
+        """Fold task into the pending task for the same student, in the
+        order the two were created: a delayed or retried task can fall due
+        after a newer task for the same student was queued."""
+        student_id = task.student.id
+        entry = self._pending[student_id]
+        pending = entry[2]
+        if task.seq < pending.seq:
+            merged = _merge_tasks(task, pending)
+        else:
+            merged = _merge_tasks(pending, task)
+        if merged is not None and merged.priority == -entry[0]:
+            entry[2] = merged
+        else:
+            entry[2] = _REMOVED
+            self._removed += 1
+            if merged is None:
+                del self._pending[student_id]
+            else:
+                self._pending[student_id] = self._push(merged.priority, merged)
+            if self._removed * 2 > len(self._container):
+                # Mostly placeholders: rebuild so the heap stays proportional
+                # to the live tasks
+                self._container[:] = [live for live in self._container if live[2] is not _REMOVED]
+                heapify(self._container)
+                self._removed = 0
+        if tracer.debug_enabled:
+            result = merged.task_type if merged else 'nothing'
+            tracer.emit(DEBUG, 'queue.coalesce', f"Coalesced {pending.task_type} + {task.task_type} into {result} for student ID {student_id}",
+                        student_id=student_id, pending=pending.task_type, task_type=task.task_type, result=result)
     
     def dequeue(self) -> Optional[Any]:
-        """Remove and return the highest priority item."""
-        if not self._container:
-            print("Cannot dequeue from empty queue")
+        """Remove and return the highest priority item that is due."""
+        self._promote_due()
+        if not self._ready_count():
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'queue.dequeue_empty', "Cannot dequeue from empty queue")
             return None
         
-        # For priority queue, highest priority is at index 0
-        item = self._container.pop(0)
-        if isinstance(item, ProcessingTask):
-            print(f"Dequeued task: {item.task_type} for student ID {item.student.id}")
-        else:
-            print(f"Dequeued {item}")
+        item = self._pop()
+        if tracer.debug_enabled:
+            if isinstance(item, ProcessingTask):
+                tracer.emit(DEBUG, 'queue.dequeue', f"Dequeued task: {item.task_type} for student ID {item.student.id}", task_type=item.task_type, student_id=item.student.id)
+            else:
+                tracer.emit(DEBUG, 'queue.dequeue', f"Dequeued {item}")
         return item
     
     def front(self) -> Optional[Any]:
-        """Peek at the highest priority item without removing it."""
-        if not self._container:
+        """Peek at the highest priority item that is due without removing it."""
+        self._promote_due()
+        container = self._container
+        while container and container[0][2] is _REMOVED:
+            heappop(container)
+            self._removed -= 1
+        if not container:
             return None
-        return self._container[0]
+        return container[0][2]
     
-    def enqueue_task(self, task_type: str, student: Student, priority: int = 0) -> bool:
-        """Add a processing task with priority."""
-        task = ProcessingTask(task_type, student, priority)
+    def enqueue_task(self, task_type: str, student: Student, priority: int = 0, delay: Optional[float] = None) -> bool:
+        """Add a processing task with priority, optionally held back for
+        delay seconds."""
+        run_at = time.monotonic() + delay if delay is not None else None
+        task = ProcessingTask(task_type, student, priority, run_at)
         return self.enqueue(task)
 
     def enqueue(self, item: Any) -> bool:
-        """Add an item maintaining priority order (higher priority first)."""
+        """Add an item maintaining priority order (higher priority first).
+        A task with a future run_at is held back until then. With
+        coalescing on, add/update/delete tasks are merged with the
+        student's pending task, if any."""
         try:
-            if isinstance(item, ProcessingTask):
-                # Find the correct position based on priority (higher priority comes first)
-                inserted = False
-                for i, existing_item in enumerate(self._container):
-                    if (isinstance(existing_item, ProcessingTask) and 
-                        item.priority > existing_item.priority):
-                        self._container.insert(i, item)
-                        inserted = True
-                        break
-                
-                if not inserted:
-                    self._container.append(item)
-                
-                print(f"Enqueued priority task: {item.task_type} for student ID {item.student.id} (priority: {item.priority})")
+            if isinstance(item, ProcessingTask) and item.run_at is not None and item.run_at > time.monotonic():
+                heappush(self._delayed, [item.run_at, next(self._counter), item])
+                if tracer.debug_enabled:
+                    tracer.emit(DEBUG, 'queue.schedule', f"Scheduled task: {item.task_type} for student ID {item.student.id} in {item.run_at - time.monotonic():.3f}s",
+                                task_type=item.task_type, student_id=item.student.id, run_at=item.run_at)
             else:
-                self._container.insert(0, item)
-                print(f"Enqueued {item}")
+                self._enqueue_ready(item)
             return True
         except Exception as e:
-            print(f"Error enqueuing item: {e}")
+            tracer.emit(ERROR, 'queue.enqueue_failed', f"Error enqueuing item: {e}")
             return False
 
+    def _enqueue_ready(self, item: Any) -> None:
+        if self._coalesces(item):
+            self._merge_pending(item)
+        elif isinstance(item, ProcessingTask):
+            entry = self._push(item.priority, item)
+            if self.coalesce and item.task_type in COALESCED_TYPES:
+                self._pending[item.student.id] = entry
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'queue.enqueue', f"Enqueued priority task: {item.task_type} for student ID {item.student.id} (priority: {item.priority})", task_type=item.task_type, student_id=item.student.id, priority=item.priority)
+        else:
+            self._push(0, item)
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'queue.enqueue', f"Enqueued {item}")
+
+    def enqueue_many(self, items: Iterable[Any]) -> int:
+        """Add items in order, each at its own priority. Returns how many were added."""
+        added = 0
+        for item in items:
+            if self.enqueue(item):
+                added += 1
+        return added
+
+    def dequeue_many(self, max_items: int) -> List[Any]:
+        """Remove and return up to max_items due items, highest priority first."""
+        self._promote_due()
+        items = [self._pop() for _ in range(min(max_items, self._ready_count()))]
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'queue.dequeue_many', f"Dequeued {len(items)} items", count=len(items))
+        return items
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty (including delayed tasks)."""
+        return self.size() == 0
+
+    def size(self) -> int:
+        """Get the number of items in the queue, including delayed tasks."""
+        return len(self._container) - self._removed + len(self._delayed)
+
+    def clear(self):
+        """Clear all items from the queue."""
+        super().clear()
+        self._pending.clear()
+        self._removed = 0
+        self._delayed.clear()
+
     def get_next_task(self) -> Optional[ProcessingTask]:
         """Get the next task to process without removing it."""
         if self.is_empty():
@@ -131,5 +346,150 @@ class PriorityQueue(Queue):
         return None
 
     def get_all_tasks(self) -> list:
-        """Get all tasks in the queue."""
-        return [item for item in self._container if isinstance(item, ProcessingTask)]
\ No newline at end of file
+        """Get all tasks in the queue, in the order they will be processed:
+        the due tasks by priority, then the delayed tasks by deadline."""
+        self._promote_due()
+        entries = sorted(self._container) + sorted(self._delayed)
+        return [entry[2] for entry in entries if isinstance(entry[2], ProcessingTask)]
+
+class BlockingPriorityQueue(PriorityQueue):
+    """Thread-safe PriorityQueue that consumers can wait on.
+    
+    With max_size set, enqueue blocks while the queue is full, which pushes
+    back on producers when the consumers fall behind. A task that coalesces
+    into a pending one takes no room, so it never waits. get and get_batch
+    block until a task is due (or a timeout expires): with only delayed
+    tasks queued they sleep until the earliest deadline rather than
+    polling, and an earlier task arriving wakes them to re-check.
+    """
+    
+    def __init__(self, max_size: Optional[int] = None, coalesce: bool = False):
+        super().__init__(coalesce)
+        self.max_size = max_size
+        self._mutex = threading.RLock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+    
+    def _full(self) -> bool:
+        return self.max_size is not None and PriorityQueue.size(self) >= self.max_size
+    
+    def _promote_due(self) -> None:
+        # A task falling due can cancel a pending one, making room for
+        # producers waiting in enqueue
+        before = PriorityQueue.size(self)
+        super()._promote_due()
+        if PriorityQueue.size(self) < before:
+            self._not_full.notify_all()
+    
+    def enqueue(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> bool:
+        """Add an item by priority. If the queue is full, wait for room
+        (up to timeout seconds) or, with block=False, return False at once."""
+        with self._not_full:
+            self._promote_due()
+            if self._full() and not self._coalesces(item):
+                if not block or not self._not_full.wait_for(lambda: not self._full(), timeout):
+                    if tracer.debug_enabled:
+                        tracer.emit(DEBUG, 'queue.full', f"Queue is full ({self.max_size} items)", max_size=self.max_size)
+                    return False
+            before = PriorityQueue.size(self)
+            if not super().enqueue(item):
+                return False
+            after = PriorityQueue.size(self)
+            if after > before:
+                self._not_empty.notify()
+            elif after < before:
+                self._not_full.notify()  # Coalescing cancelled a pending task
+            return True
+    
+    def dequeue(self) -> Optional[Any]:
+        """Remove and return the highest priority item without waiting."""
+        with self._mutex:
+            item = super().dequeue()
+            self._not_full.notify()
+            return item
+    
+    def dequeue_many(self, max_items: int) -> List[Any]:
+        """Remove and return up to max_items items without waiting."""
+        with self._mutex:
+            items = super().dequeue_many(max_items)
+            self._not_full.notify_all()
+            return items
+    
+    def _wait_ready(self, timeout: Optional[float], cancel: Optional[Callable[[], bool]]) -> bool:
+        """Wait (holding the mutex) until an item is due. Returns False if
+        timeout expires or cancel() returns true first."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            self._promote_due()
+            if self._ready_count():
+                return True
+            if cancel is not None and cancel():
+                return False
+            wait = self.next_due()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = remaining if wait is None else min(wait, remaining)
+            self._not_empty.wait(wait)
+    
+    def get(self, timeout: Optional[float] = None, cancel: Optional[Callable[[], bool]] = None) -> Optional[Any]:
+        """Remove and return the highest priority item, waiting up to
+        timeout seconds for one to be due. Returns None on timeout, or once
+        cancel() is true after a wake()."""
+        with self._not_empty:
+            if not self._wait_ready(timeout, cancel):
+                return None
+            return self.dequeue()
+    
+    def get_batch(self, max_items: int, timeout: Optional[float] = None,
+                  cancel: Optional[Callable[[], bool]] = None) -> List[Any]:
+        """Wait up to timeout seconds for a due item, then remove and return
+        up to max_items due items, highest priority first. Returns [] on
+        timeout, or once cancel() is true after a wake()."""
+        with self._not_empty:
+            if not self._wait_ready(timeout, cancel):
+                return []
+            return self.dequeue_many(max_items)
+    
+    def wake(self) -> None:
+        """Wake every waiting consumer so it re-checks its cancel condition."""
+        with self._not_empty:
+            self._not_empty.notify_all()
+    
+    def next_due(self) -> Optional[float]:
+        with self._mutex:
+            return super().next_due()
+    
+    def front(self) -> Optional[Any]:
+        with self._mutex:
+            return super().front()
+    
+    def is_empty(self) -> bool:
+        with self._mutex:
+            return super().is_empty()
+    
+    def size(self) -> int:
+        with self._mutex:
+            return super().size()
+    
+    def ready_size(self) -> int:
+        with self._mutex:
+            return super().ready_size()
+    
+    def get_all_tasks(self) -> list:
+        with self._mutex:
+            return super().get_all_tasks()
+    
+    def get_next_task(self) -> Optional[ProcessingTask]:
+        with self._mutex:
+            return super().get_next_task()
+    
+    def process_next_task(self) -> Optional[ProcessingTask]:
+        with self._mutex:
+            return super().process_next_task()
+    
+    def clear(self):
+        with self._mutex:
+            super().clear()
+            self._not_full.notify_all()
@@ -0,0 +1,149 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterator, List, Optional
+from ..models.student import Student
+from ..tracing import tracer, DEBUG
+
+class SecondaryIndex(ABC):
+    """Base class for indexes over a Student attribute other than the ID.
+
+    StudentService calls add, remove and replace as students are stored,
+    changed and deleted (including by undo and bulk_load), so a registered
+    index always reflects the current roster. Subclasses implement add,
+    remove and clear (an index missing one cannot be created); replace
+    defaults to remove followed by add.
+    """
+
+    def __init__(self, attribute: str):
+        self.attribute = attribute
+
+    def key(self, student: Student) -> Any:
+        return getattr(student, self.attribute)
+
+    @abstractmethod
+    def add(self, student: Student) -> None:
+        ...
+
+    @abstractmethod
+    def remove(self, student: Student) -> None:
+        ...
+
+    def replace(self, old_student: Student, new_student: Student) -> None:
+        self.remove(old_student)
+        self.add(new_student)
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+class OrderedIndex(SecondaryIndex):
+    """Ordered secondary index: one bucket of students per distinct key,
+    plus the distinct keys in a sorted list.
+
+    Range queries bisect the key list and walk only the buckets in range,
+    per-key counts are bucket sizes, and min/max are the ends of the key
+    list, so none of them touch students outside the answer. Updates cost
+    O(1) except when a key appears or disappears, which inserts into or
+    deletes from the sorted key list.
+    """
+
+    def __init__(self, attribute: str):
+        super().__init__(attribute)
+        self._buckets: Dict[Any, Dict[int, Student]] = {}
+        self._keys: List[Any] = []
+        self._count = 0
+
+    def add(self, student: Student) -> None:
+        key = self.key(student)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = {}
+            insort(self._keys, key)
+        bucket[student.id] = student
+        self._count += 1
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'index.add', f"Indexed {self.attribute}={key} for ID {student.id}", attribute=self.attribute, student_id=student.id)
+
+    def remove(self, student: Student) -> None:
+        key = self.key(student)
+        bucket = self._buckets[key]
+        del bucket[student.id]
+        if not bucket:
+            del self._buckets[key]
+            del self._keys[bisect_left(self._keys, key)]
+        self._count -= 1
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'index.remove', f"Unindexed {self.attribute}={key} for ID {student.id}", attribute=self.attribute, student_id=student.id)
+
+    def replace(self, old_student: Student, new_student: Student) -> None:
+        if self.key(old_student) == self.key(new_student):
+            # Same bucket: swap the record in place and keep its position
+            self._buckets[self.key(new_student)][new_student.id] = new_student
+        else:
+            super().replace(old_student, new_student)
+
+    def clear(self) -> None:
+        self._buckets = {}
+        self._keys = []
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def get(self, key: Any) -> List[Student]:
+        """Get the students whose key equals key."""
+        bucket = self._buckets.get(key)
+        return list(bucket.values()) if bucket else []
+
+    def count(self, key: Any) -> int:
+        """Count the students whose key equals key."""
+        bucket = self._buckets.get(key)
+        return len(bucket) if bucket else 0
+
+    def iter_range(self, lo: Any, hi: Any) -> Iterator[Student]:
+        """Lazily yield students with lo <= key <= hi, ordered by key."""
+        keys = self._keys
+        for i in range(bisect_left(keys, lo), bisect_right(keys, hi)):
+            yield from self._buckets[keys[i]].values()
+
+    def range(self, lo: Any, hi: Any) -> List[Student]:
+        """Get all students with lo <= key <= hi, ordered by key."""
+        return list(self.iter_range(lo, hi))
+
+    def count_range(self, lo: Any, hi: Any) -> int:
+        """Count students with lo <= key <= hi."""
+        keys = self._keys
+        return sum(len(self._buckets[keys[i]]) for i in range(bisect_left(keys, lo), bisect_right(keys, hi)))
+
+    def counts(self) -> Dict[Any, int]:
+        """Get the number of students per distinct key, ordered by key."""
+        return {key: len(self._buckets[key]) for key in self._keys}
+
+    def min_key(self) -> Optional[Any]:
+        return self._keys[0] if self._keys else None
+
+    def max_key(self) -> Optional[Any]:
+        return self._keys[-1] if self._keys else None
+
+class AgeIndex(OrderedIndex):
+    """Ordered index over Student.age with a running sum for the average."""
+
+    def __init__(self):
+        super().__init__('age')
+        self._sum = 0
+
+    def add(self, student: Student) -> None:
+        super().add(student)
+        self._sum += student.age
+
+    def remove(self, student: Student) -> None:
+        super().remove(student)
+        self._sum -= student.age
+
+    def clear(self) -> None:
+        super().clear()
+        self._sum = 0
+
+    def average(self) -> Optional[float]:
+        """Get the average age, or None when the index is empty."""
+        return self._sum / self._count if self._count else None
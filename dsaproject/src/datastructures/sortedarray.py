@@ -0,0 +1,280 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Optional
+from ..models.student import Student
+from ..tracing import tracer, DEBUG, ERROR
+
+DEFAULT_LOAD = 512
+
+class SortedArrayIndex:
+    """Compact primary index: students sorted by ID in fixed fan-out blocks.
+
+    This is a two-level B+tree. The top level is an array('q') holding the
+    largest ID of each block; each block keeps its IDs in an array('q')
+    with the students in a parallel list. Per student that costs 16 bytes
+    (one 8-byte key plus one list slot) instead of a BSTNode object, and a
+    lookup is two binary searches over contiguous memory rather than a
+    pointer chase per tree level. Blocks split when they grow past twice
+    the load factor and merge with a neighbour when they fall below half.
+
+    The public API mirrors BinarySearchTree, so it can be passed to
+    StudentService(index_class=SortedArrayIndex). IDs must fit in a signed
+    64-bit integer.
+    """
+
+    def __init__(self, load: int = DEFAULT_LOAD):
+        self._load = load
+        self._keys: List[array] = []
+        self._values: List[List[Student]] = []
+        self._maxes = array('q')
+        self._size = 0
+        # Cumulative block sizes for positional lookups, rebuilt lazily
+        self._offsets: Optional[array] = None
+
+    @classmethod
+    def from_sorted(cls, students: Iterable[Student], load: int = DEFAULT_LOAD) -> 'SortedArrayIndex':
+        """Build an index in O(n) from students sorted by strictly
+        increasing ID. Raises ValueError on unsorted or duplicate input."""
+        students = list(students)
+        keys = array('q', (student.id for student in students))
+        for i in range(1, len(keys)):
+            if keys[i - 1] >= keys[i]:
+                raise ValueError(f"Students must be sorted by unique ID (got {keys[i - 1]} before {keys[i]})")
+        index = cls(load=load)
+        for start in range(0, len(students), load):
+            block_keys = keys[start:start + load]
+            index._keys.append(block_keys)
+            index._values.append(students[start:start + load])
+            index._maxes.append(block_keys[-1])
+        index._size = len(students)
+        return index
+
+    def _locate(self, student_id: int) -> tuple[int, int]:
+        """Return (block, position) where student_id is or would be stored."""
+        block = bisect_left(self._maxes, student_id)
+        if block == len(self._maxes):
+            block -= 1
+        return block, bisect_left(self._keys[block], student_id)
+
+    def insert(self, student: Student) -> bool:
+        """Insert a student. Inserting an existing ID replaces the student."""
+        try:
+            if not self._keys:
+                self._keys.append(array('q', [student.id]))
+                self._values.append([student])
+                self._maxes.append(student.id)
+                self._size = 1
+                self._offsets = None
+                if tracer.debug_enabled:
+                    tracer.emit(DEBUG, 'sortedarray.insert', f"Inserted {student}", student_id=student.id)
+                return True
+
+            block, pos = self._locate(student.id)
+            keys = self._keys[block]
+            if pos < len(keys) and keys[pos] == student.id:
+                # Update existing student
+                self._values[block][pos] = student
+                if tracer.debug_enabled:
+                    tracer.emit(DEBUG, 'sortedarray.insert', f"Inserted {student}", student_id=student.id)
+                return True
+
+            keys.insert(pos, student.id)
+            self._values[block].insert(pos, student)
+            self._maxes[block] = keys[-1]
+            self._size += 1
+            self._offsets = None
+            if len(keys) > 2 * self._load:
+                self._split(block)
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'sortedarray.insert', f"Inserted {student}", student_id=student.id)
+            return True
+        except Exception as e:
+            tracer.emit(ERROR, 'sortedarray.insert_failed', f"Error inserting student: {e}")
+            return False
+
+    def _split(self, block: int) -> None:
+        keys = self._keys[block]
+        values = self._values[block]
+        half = len(keys) // 2
+        self._keys[block:block + 1] = [keys[:half], keys[half:]]
+        self._values[block:block + 1] = [values[:half], values[half:]]
+        self._maxes[block:block + 1] = array('q', [keys[half - 1], keys[-1]])
+
+    def search(self, student_id: int) -> Optional[Student]:
+        """Search for a student by ID."""
+        block = bisect_left(self._maxes, student_id)
+        if block < len(self._maxes):
+            keys = self._keys[block]
+            pos = bisect_left(keys, student_id)
+            if keys[pos] == student_id:
+                if tracer.debug_enabled:
+                    tracer.emit(DEBUG, 'sortedarray.search', f"Found student with ID {student_id}", student_id=student_id, found=True)
+                return self._values[block][pos]
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'sortedarray.search', f"Student with ID {student_id} not found", student_id=student_id, found=False)
+        return None
+
+    def delete(self, student_id: int) -> bool:
+        """Delete a student by ID. Returns True if successful."""
+        block = bisect_left(self._maxes, student_id)
+        if block < len(self._maxes):
+            keys = self._keys[block]
+            pos = bisect_left(keys, student_id)
+            if keys[pos] == student_id:
+                del keys[pos]
+                del self._values[block][pos]
+                self._size -= 1
+                self._offsets = None
+                if not keys:
+                    del self._keys[block]
+                    del self._values[block]
+                    del self._maxes[block]
+                else:
+                    self._maxes[block] = keys[-1]
+                    if len(keys) < self._load // 2 and len(self._keys) > 1:
+                        self._merge(block)
+                if tracer.debug_enabled:
+                    tracer.emit(DEBUG, 'sortedarray.delete', f"Deleted student with ID {student_id}", student_id=student_id, deleted=True)
+                return True
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'sortedarray.delete', f"Student with ID {student_id} not found for deletion", student_id=student_id, deleted=False)
+        return False
+
+    def _merge(self, block: int) -> None:
+        """Fold an underfull block into its neighbour, re-splitting if needed."""
+        left = block - 1 if block > 0 else block
+        self._keys[left] += self._keys[left + 1]
+        self._values[left] += self._values[left + 1]
+        self._maxes[left] = self._keys[left][-1]
+        del self._keys[left + 1]
+        del self._values[left + 1]
+        del self._maxes[left + 1]
+        if len(self._keys[left]) > 2 * self._load:
+            self._split(left)
+
+    def _block_offsets(self) -> array:
+        if self._offsets is None:
+            offsets = array('q', [0])
+            total = 0
+            for keys in self._keys:
+                total += len(keys)
+                offsets.append(total)
+            self._offsets = offsets
+        return self._offsets
+
+    def iter_inorder(self, start: int = 0) -> Iterator[Student]:
+        """Lazily yield students in ID order, beginning at position start."""
+        if start >= self._size:
+            return
+        block, pos = 0, 0
+        if start > 0:
+            offsets = self._block_offsets()
+            block = bisect_right(offsets, start) - 1
+            pos = start - offsets[block]
+        for values in self._values[block:]:
+            if pos:
+                yield from values[pos:]
+                pos = 0
+            else:
+                yield from values
+
+    def iter_reverse(self) -> Iterator[Student]:
+        """Lazily yield students in descending ID order."""
+        for values in reversed(self._values):
+            yield from reversed(values)
+
+    def __iter__(self) -> Iterator[Student]:
+        return self.iter_inorder()
+
+    def __reversed__(self) -> Iterator[Student]:
+        return self.iter_reverse()
+
+    def __len__(self):
+        return self._size
+
+    def get_all_students(self) -> List[Student]:
+        """Get all students in sorted order (by ID)."""
+        students = []
+        for values in self._values:
+            students.extend(values)
+        return students
+
+    def size(self) -> int:
+        """Get the number of students in the index."""
+        return self._size
+
+    def height(self) -> int:
+        """Get the number of levels (0 when empty, otherwise 2)."""
+        return 2 if self._size else 0
+
+    def select(self, k: int) -> Optional[Student]:
+        """Get the student at position k (0-based) in ID order, or None."""
+        if k < 0 or k >= self._size:
+            return None
+        offsets = self._block_offsets()
+        block = bisect_right(offsets, k) - 1
+        return self._values[block][k - offsets[block]]
+
+    def rank(self, student_id: int) -> int:
+        """Get the number of students with an ID smaller than student_id."""
+        block = bisect_left(self._maxes, student_id)
+        if block == len(self._maxes):
+            return self._size
+        return self._block_offsets()[block] + bisect_left(self._keys[block], student_id)
+
+    def iter_range(self, lo_id: int, hi_id: int) -> Iterator[Student]:
+        """Lazily yield students with lo_id <= ID <= hi_id in ID order."""
+        block = bisect_left(self._maxes, lo_id)
+        pos = bisect_left(self._keys[block], lo_id) if block < len(self._keys) else 0
+        while block < len(self._keys):
+            keys = self._keys[block]
+            end = bisect_right(keys, hi_id)
+            yield from self._values[block][pos:end]
+            if end < len(keys):
+                return
+            block += 1
+            pos = 0
+
+    def range(self, lo_id: int, hi_id: int) -> List[Student]:
+        """Get all students with lo_id <= ID <= hi_id, sorted by ID."""
+        return list(self.iter_range(lo_id, hi_id))
+
+    def count_range(self, lo_id: int, hi_id: int) -> int:
+        """Count students with lo_id <= ID <= hi_id."""
+        if hi_id < lo_id:
+            return 0
+        return self.rank(hi_id + 1) - self.rank(lo_id)
+
+    def floor(self, student_id: int) -> Optional[Student]:
+        """Get the student with the largest ID <= student_id."""
+        if not self._keys:
+            return None
+        block = bisect_left(self._maxes, student_id)
+        if block < len(self._keys):
+            pos = bisect_right(self._keys[block], student_id) - 1
+            if pos >= 0:
+                return self._values[block][pos]
+        return self._values[block - 1][-1] if block > 0 else None
+
+    def ceiling(self, student_id: int) -> Optional[Student]:
+        """Get the student with the smallest ID >= student_id."""
+        block = bisect_left(self._maxes, student_id)
+        if block == len(self._maxes):
+            return None
+        return self._values[block][bisect_left(self._keys[block], student_id)]
+
+    def successor(self, student_id: int) -> Optional[Student]:
+        """Get the student with the smallest ID strictly greater than student_id."""
+        return self.ceiling(student_id + 1)
+
+    def predecessor(self, student_id: int) -> Optional[Student]:
+        """Get the student with the largest ID strictly smaller than student_id."""
+        return self.floor(student_id - 1)
+
+    def get_min_student(self) -> Optional[Student]:
+        """Get student with minimum ID."""
+        return self._values[0][0] if self._values else None
+
+    def get_max_student(self) -> Optional[Student]:
+        """Get student with maximum ID."""
+        return self._values[-1][-1] if self._values else None
@@ -1,12 +1,26 @@
-from typing import Optional, Any
+from typing import Optional, Any, List
 from ..models.student import Student
+from ..tracing import tracer, DEBUG, ERROR
 
 class Operation:
     """Represents an operation that can be undone"""
-    def __init__(self, operation_type: str, student: Student, old_data: Any = None):
+    def __init__(self, operation_type: str, student: Student, old_data: Any = None, seq: int = 0):
         self.operation_type = operation_type  # 'add', 'update', 'delete'
         self.student = student
         self.old_data = old_data  # For update operations, stores the old student data
+        self.seq = seq  # Position in the UndoStack's history, increasing from 1
+
+    def state_before(self) -> Optional[Student]:
+        """The student's record before this operation (None if absent)."""
+        if self.operation_type == 'add':
+            return None
+        if self.operation_type == 'update':
+            return self.old_data
+        return self.student
+
+    def state_after(self) -> Optional[Student]:
+        """The student's record after this operation (None if absent)."""
+        return None if self.operation_type == 'delete' else self.student
 
 class Stack:
     def __init__(self):
@@ -15,29 +29,38 @@ class Stack:
     def push(self, item: Any) -> bool:
         """Push an item onto the stack."""
         try:
-            self._container.append(item)
-            if isinstance(item, Operation):
-                print(f"Pushed operation: {item.operation_type} for student ID {item.student.id}")
-            else:
-                print(f"Pushed {item}")
+            self._push(item)
+            if tracer.debug_enabled:
+                if isinstance(item, Operation):
+                    tracer.emit(DEBUG, 'stack.push', f"Pushed operation: {item.operation_type} for student ID {item.student.id}", operation=item.operation_type, student_id=item.student.id)
+                else:
+                    tracer.emit(DEBUG, 'stack.push', f"Pushed {item}")
             return True
         except Exception as e:
-            print(f"Error pushing item: {e}")
+            tracer.emit(ERROR, 'stack.push_failed', f"Error pushing item: {e}")
             return False
 
     def pop(self) -> Optional[Any]:
         """Pop an item from the stack."""
-        if not self._container:
-            print("Cannot pop from empty stack")
+        if self.is_empty():
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'stack.pop_empty', "Cannot pop from empty stack")
             return None
         
-        item = self._container.pop()
-        if isinstance(item, Operation):
-            print(f"Popped operation: {item.operation_type} for student ID {item.student.id}")
-        else:
-            print(f"Popped {item}")
+        item = self._pop()
+        if tracer.debug_enabled:
+            if isinstance(item, Operation):
+                tracer.emit(DEBUG, 'stack.pop', f"Popped operation: {item.operation_type} for student ID {item.student.id}", operation=item.operation_type, student_id=item.student.id)
+            else:
+                tracer.emit(DEBUG, 'stack.pop', f"Popped {item}")
         return item
 
+    def _push(self, item: Any) -> None:
+        self._container.append(item)
+
+    def _pop(self) -> Any:
+        return self._container.pop()
+
     def peek(self) -> Optional[Any]:
         """Peek at the top item without removing it."""
         if not self._container:
@@ -55,24 +78,79 @@ class Stack:
     def clear(self):
         """Clear all items from the stack."""
         self._container.clear()
-        print("Cleared all items from stack")
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'stack.clear', "Cleared all items from stack")
 
 class UndoStack(Stack):
-    """Specialized stack for managing undo operations"""
+    """Specialized stack for managing undo operations.
+    
+    Backed by a fixed-capacity circular buffer of max_size slots: push,
+    pop and evicting the oldest operation once full are all O(1), with no
+    shifting of the remaining entries.
+    
+    Undone operations move to a redo list, which a new operation clears.
+    Every operation gets the next sequence number, so position() names the
+    current point in the history; count_since() tells how many undos lead
+    back to an earlier position, or None once that point was evicted.
+    """
     
     def __init__(self, max_size: int = 50):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1 (got {max_size})")
         super().__init__()
         self.max_size = max_size
+        self._container: List[Optional[Operation]] = [None] * max_size
+        self._start = 0  # Slot of the oldest operation
+        self._count = 0
+        self._redo: List[Operation] = []  # Undone operations, most recent last
+        self._next_seq = 1
+        self._floor = 0  # Sequence number of the last evicted operation
+
+    def _push(self, item: Any) -> None:
+        slot = (self._start + self._count) % self.max_size
+        if self._count == self.max_size:
+            # Full: the new operation takes the oldest one's slot
+            self._floor = self._container[slot].seq
+            self._start = (self._start + 1) % self.max_size
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'undo.evict', f"Removed oldest operation to maintain max size of {self.max_size}", max_size=self.max_size)
+        else:
+            self._count += 1
+        self._container[slot] = item
+
+    def _pop(self) -> Any:
+        self._count -= 1
+        slot = (self._start + self._count) % self.max_size
+        item = self._container[slot]
+        self._container[slot] = None
+        return item
+
+    def peek(self) -> Optional[Any]:
+        if not self._count:
+            return None
+        return self._container[(self._start + self._count - 1) % self.max_size]
+
+    def is_empty(self) -> bool:
+        return self._count == 0
+
+    def size(self) -> int:
+        return self._count
+
+    def clear(self):
+        self._container = [None] * self.max_size
+        self._start = 0
+        self._count = 0
+        self._redo = []
+        self._floor = self._next_seq - 1  # Nothing before now can be undone
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'stack.clear', "Cleared all items from stack")
 
     def push_operation(self, operation_type: str, student: Student, old_data: Any = None) -> bool:
-        """Push an operation that can be undone."""
-        operation = Operation(operation_type, student, old_data)
-        
-        # Remove oldest operation if we exceed max size
-        if len(self._container) >= self.max_size:
-            self._container.pop(0)
-            print(f"Removed oldest operation to maintain max size of {self.max_size}")
-        
+        """Push an operation that can be undone, evicting the oldest one
+        once max_size operations are stored. Clears the redo list."""
+        operation = Operation(operation_type, student, old_data, self._next_seq)
+        self._next_seq += 1
+        self._redo.clear()
         return self.push(operation)
 
     def get_last_operation(self) -> Optional[Operation]:
@@ -82,12 +160,55 @@ class UndoStack(Stack):
         return self.peek()
 
     def undo_last_operation(self) -> Optional[Operation]:
-        """Remove and return the last operation for undo."""
+        """Remove and return the last operation for undo, keeping it for redo."""
+        operations = self.undo_operations(1)
+        return operations[0] if operations else None
+
+    def undo_operations(self, n: int) -> List[Operation]:
+        """Remove up to n operations for undo, most recent first, and move
+        them to the redo list."""
         if self.is_empty():
-            print("No operations to undo")
-            return None
-        return self.pop()
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'undo.empty', "No operations to undo")
+            return []
+        operations = [self.pop() for _ in range(min(n, self._count))]
+        self._redo.extend(operations)
+        return operations
+
+    def redo_operations(self, n: int) -> List[Operation]:
+        """Take up to n operations back from the redo list, oldest first,
+        and push them onto the stack again."""
+        redo = self._redo
+        operations = [redo.pop() for _ in range(min(n, len(redo)))]
+        for operation in operations:
+            self.push(operation)
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'undo.redo', f"Redid {len(operations)} operations", count=len(operations))
+        return operations
+
+    def redo_size(self) -> int:
+        """Get the number of operations that can be redone."""
+        return len(self._redo)
+
+    def position(self) -> int:
+        """Get the sequence number of the newest operation in effect."""
+        return self.peek().seq if self._count else self._floor
+
+    def count_since(self, seq: int) -> Optional[int]:
+        """Count the undos that return to position seq, or None if seq is not
+        behind the current position in the stored history (evicted, or on a
+        branch that a new operation replaced)."""
+        for i in range(self._count):
+            operation_seq = self._container[(self._start + self._count - 1 - i) % self.max_size].seq
+            if operation_seq == seq:
+                return i
+            if operation_seq < seq:
+                return None
+        return self._count if seq == self._floor else None
 
-    def get_operation_history(self) -> list:
-        """Get a copy of all operations in the stack."""
-        return self._container.copy()
\ No newline at end of file
+    def get_operation_history(self, limit: Optional[int] = None) -> List[Operation]:
+        """Get the stored operations from oldest to newest. With limit, only
+        the most recent limit operations are copied."""
+        count = self._count if limit is None else max(0, min(limit, self._count))
+        first = self._start + self._count - count
+        return [self._container[(first + i) % self.max_size] for i in range(count)]
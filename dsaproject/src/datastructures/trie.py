@@ -0,0 +1,189 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+from ..tracing import tracer, DEBUG
+
+GRAM_SIZE = 3  # Longest substring kept in the n-gram index
+
+def _grams(key: str) -> set:
+    """Get the distinct substrings of key of length 1 to GRAM_SIZE."""
+    return {key[i:i + size] for size in range(1, GRAM_SIZE + 1) for i in range(len(key) - size + 1)}
+
+class TrieNode:
+    __slots__ = ('children', 'ids', 'count')
+
+    def __init__(self):
+        self.children: Dict[str, 'TrieNode'] = {}
+        self.ids: Optional[Dict[int, None]] = None  # IDs whose name ends here
+        self.count = 0  # Number of IDs stored in this subtree
+
+class NameTrie:
+    """Character trie mapping casefolded student names to student IDs.
+
+    Every node counts the IDs below it, so counting the names under a
+    prefix costs O(len(prefix)). The search methods are generators that
+    walk the trie lazily in alphabetical order, so a caller that only
+    needs the first few matches (e.g. with itertools.islice) never visits
+    the rest of the trie.
+
+    Substring search uses an n-gram index alongside the trie: every
+    substring of up to GRAM_SIZE characters maps to the distinct names
+    containing it, so it only looks at names that can match.
+    """
+
+    def __init__(self):
+        self.root = TrieNode()
+        # n-gram -> casefolded names containing it (a dict as ordered set)
+        self._grams: Dict[str, Dict[str, None]] = {}
+
+    def insert(self, name: str, student_id: int) -> None:
+        """Index student_id under name."""
+        key = name.casefold()
+        path = [self.root]
+        node = self.root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = TrieNode()
+            node = child
+            path.append(node)
+        if node.ids is None:
+            node.ids = {}
+            self._index_grams(key)
+        elif student_id in node.ids:
+            return
+        node.ids[student_id] = None
+        for visited in path:
+            visited.count += 1
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'trie.insert', f"Indexed name '{name}' for ID {student_id}", student_id=student_id)
+
+    def remove(self, name: str, student_id: int) -> bool:
+        """Remove student_id from under name, pruning empty branches."""
+        key = name.casefold()
+        path = [self.root]
+        node = self.root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return False
+            path.append(node)
+        if not node.ids or student_id not in node.ids:
+            return False
+        del node.ids[student_id]
+        if not node.ids:
+            node.ids = None
+            self._unindex_grams(key)
+        for visited in path:
+            visited.count -= 1
+        # Drop the nodes that no longer lead to any name
+        for depth in range(len(key), 0, -1):
+            if path[depth].count:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'trie.remove', f"Removed name '{name}' for ID {student_id}", student_id=student_id)
+        return True
+
+    def _index_grams(self, key: str) -> None:
+        for gram in _grams(key):
+            self._grams.setdefault(gram, {})[key] = None
+
+    def _unindex_grams(self, key: str) -> None:
+        for gram in _grams(key):
+            names = self._grams[gram]
+            del names[key]
+            if not names:
+                del self._grams[gram]
+
+    def __len__(self):
+        return self.root.count
+
+    def _find(self, key: str) -> Optional[TrieNode]:
+        node = self.root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _walk(self, node: TrieNode, prefix: str) -> Iterator[Tuple[str, TrieNode]]:
+        """Yield (name, node) for every name at or below node, alphabetically."""
+        stack = [(prefix, node)]
+        while stack:
+            name, node = stack.pop()
+            if node.ids:
+                yield name, node
+            for char in sorted(node.children, reverse=True):
+                stack.append((name + char, node.children[char]))
+
+    def get(self, name: str) -> List[int]:
+        """Get the IDs indexed under exactly name (case-insensitive)."""
+        node = self._find(name.casefold())
+        return list(node.ids) if node and node.ids else []
+
+    def count_prefix(self, prefix: str) -> int:
+        """Count the IDs whose name starts with prefix."""
+        node = self._find(prefix.casefold())
+        return node.count if node else 0
+
+    def iter_prefix(self, prefix: str) -> Iterator[int]:
+        """Lazily yield the IDs whose name starts with prefix."""
+        key = prefix.casefold()
+        node = self._find(key)
+        if node is None:
+            return
+        for _, match in self._walk(node, key):
+            yield from match.ids
+
+    def iter_contains(self, text: str) -> Iterator[int]:
+        """Lazily yield the IDs whose name contains text anywhere, in
+        alphabetical order of name.
+
+        Text of up to GRAM_SIZE characters is a single n-gram lookup. Longer
+        text checks only the names sharing its rarest n-gram, so the cost
+        is O(k log k) in those k candidate names rather than a scan of the
+        whole trie.
+        """
+        key = text.casefold()
+        if not key:
+            for _, match in self._walk(self.root, ''):
+                yield from match.ids
+            return
+        if len(key) <= GRAM_SIZE:
+            candidates = self._grams.get(key, ())
+        else:
+            rarest = None
+            for i in range(len(key) - GRAM_SIZE + 1):
+                names = self._grams.get(key[i:i + GRAM_SIZE])
+                if not names:
+                    return
+                if rarest is None or len(names) < len(rarest):
+                    rarest = names
+            candidates = [name for name in rarest if key in name]
+        for name in sorted(candidates):
+            match = self._find(name)
+            if match is not None and match.ids:
+                yield from match.ids
+
+    def iter_fuzzy(self, name: str, max_distance: int = 2) -> Iterator[Tuple[int, int]]:
+        """Lazily yield (student_id, distance) for names within max_distance
+        edits (Levenshtein) of name, closest matches first.
+
+        Each distance is a separate depth-first pass that prunes every
+        subtree whose best possible distance is already too large, so exact
+        matches cost almost nothing and the caller can stop early.
+        """
+        key = name.casefold()
+        first_row = list(range(len(key) + 1))
+        for distance in range(max_distance + 1):
+            stack = [(self.root, first_row)]
+            while stack:
+                node, row = stack.pop()
+                if node.ids and row[-1] == distance:
+                    for student_id in node.ids:
+                        yield student_id, distance
+                for char in sorted(node.children, reverse=True):
+                    next_row = [row[0] + 1]
+                    for j in range(1, len(row)):
+                        next_row.append(min(next_row[j - 1] + 1, row[j] + 1, row[j - 1] + (key[j - 1] != char)))
+                    if min(next_row) <= distance:
+                        stack.append((node.children[char], next_row))
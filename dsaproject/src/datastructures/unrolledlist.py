@@ -0,0 +1,275 @@
+from typing import Iterable, Iterator, Optional, List
+from ..models.student import Student
+from ..tracing import tracer, DEBUG, ERROR
+
+DEFAULT_CHUNK_SIZE = 64
+
+class Chunk:
+    __slots__ = ('students', 'ids', 'live', 'next', 'prev')
+
+    def __init__(self):
+        # Slots hold a Student or None for a deleted student (tombstone).
+        # ids mirrors the slots so find() can use list.index, which scans in C.
+        self.students: List[Optional[Student]] = []
+        self.ids: List[Optional[int]] = []
+        self.live = 0
+        self.next: Optional['Chunk'] = None
+        self.prev: Optional['Chunk'] = None
+
+    def add(self, student: Student) -> None:
+        self.students.append(student)
+        self.ids.append(student.id)
+        self.live += 1
+
+    def find(self, student_id: int) -> int:
+        try:
+            return self.ids.index(student_id)
+        except ValueError:
+            return -1
+
+    def remove(self, slot: int) -> None:
+        self.students[slot] = None
+        self.ids[slot] = None
+        self.live -= 1
+
+    def compact(self) -> None:
+        self.students = [student for student in self.students if student is not None]
+        self.ids = [student.id for student in self.students]
+
+class UnrolledLinkedList:
+    """Insertion-ordered list of students stored in fixed-capacity chunks.
+
+    Each chunk is a doubly linked node holding up to chunk_size students in
+    a plain Python list, so iteration walks contiguous slots and follows
+    one link per chunk instead of one per student, and there is no
+    per-student node object. Deleting a student leaves a tombstone; a chunk
+    is compacted once more than half of it is tombstones and unlinked when
+    it becomes empty. Students never move between chunks, so the chunk
+    returned by append() stays a valid handle for replace_student and
+    delete_by_id until the student is deleted.
+
+    The API mirrors LinkedList, so it can be passed to
+    StudentService(list_class=UnrolledLinkedList).
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.head: Optional[Chunk] = None
+        self.tail: Optional[Chunk] = None
+        self.size_count = 0
+
+    def _link_tail(self, chunk: Chunk) -> None:
+        if self.tail:
+            chunk.prev = self.tail
+            self.tail.next = chunk
+        else:
+            self.head = chunk
+        self.tail = chunk
+
+    def insert_at_head(self, student: Student) -> bool:
+        """Insert a student at the head of the list."""
+        try:
+            head = self.head
+            if head and len(head.students) < self.chunk_size:
+                head.students.insert(0, student)
+                head.ids.insert(0, student.id)
+                head.live += 1
+            else:
+                chunk = Chunk()
+                chunk.add(student)
+                chunk.next = head
+                if head:
+                    head.prev = chunk
+                else:
+                    self.tail = chunk
+                self.head = chunk
+            self.size_count += 1
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'unrolledlist.insert_at_head', f"Inserted {student} at head", student_id=student.id)
+            return True
+        except Exception as e:
+            tracer.emit(ERROR, 'unrolledlist.insert_failed', f"Error inserting student: {e}")
+            return False
+
+    def insert_at_tail(self, student: Student) -> bool:
+        """Insert a student at the tail of the list."""
+        return self.append(student) is not None
+
+    def append(self, student: Student) -> Optional[Chunk]:
+        """Insert a student at the tail and return its chunk, which can be
+        passed back to replace_student or delete_by_id as a handle.
+        Returns None on error."""
+        try:
+            tail = self.tail
+            if tail is None or len(tail.students) >= self.chunk_size:
+                if tail is not None and tail.live < len(tail.students):
+                    # Reuse the tail's tombstoned slots before growing
+                    tail.compact()
+                else:
+                    tail = Chunk()
+                    self._link_tail(tail)
+            tail.add(student)
+            self.size_count += 1
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'unrolledlist.insert_at_tail', f"Inserted {student} at tail", student_id=student.id)
+            return tail
+        except Exception as e:
+            tracer.emit(ERROR, 'unrolledlist.insert_failed', f"Error inserting student: {e}")
+            return None
+
+    def extend(self, students: Iterable[Student]) -> List[Chunk]:
+        """Append students at the tail in one pass. Returns each student's chunk."""
+        handles = []
+        tail = self.tail
+        room = self.chunk_size - len(tail.students) if tail else 0
+        for student in students:
+            if not room:
+                tail = Chunk()
+                self._link_tail(tail)
+                room = self.chunk_size
+            tail.add(student)
+            room -= 1
+            handles.append(tail)
+        self.size_count += len(handles)
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'unrolledlist.extend', f"Inserted {len(handles)} students at tail", count=len(handles))
+        return handles
+
+    def _is_linked(self, chunk: Chunk) -> bool:
+        # Unlinked chunks have both links cleared and are not the head
+        return chunk.prev is not None or chunk is self.head
+
+    def _locate(self, student_id: int, chunk: Optional[Chunk]) -> tuple[Optional[Chunk], int]:
+        """Find (chunk, slot) for student_id, trying the handle first."""
+        if chunk is not None and self._is_linked(chunk):
+            slot = chunk.find(student_id)
+            if slot >= 0:
+                return chunk, slot
+        chunk = self.head
+        while chunk:
+            slot = chunk.find(student_id)
+            if slot >= 0:
+                return chunk, slot
+            chunk = chunk.next
+        return None, -1
+
+    def _unlink(self, chunk: Chunk) -> None:
+        if chunk.prev:
+            chunk.prev.next = chunk.next
+        else:
+            self.head = chunk.next
+        if chunk.next:
+            chunk.next.prev = chunk.prev
+        else:
+            self.tail = chunk.prev
+        chunk.prev = chunk.next = None
+
+    def search_by_id(self, student_id: int) -> Optional[Student]:
+        """Search for a student by ID."""
+        chunk, slot = self._locate(student_id, None)
+        if chunk is not None:
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'unrolledlist.search_by_id', f"Found student with ID {student_id}", student_id=student_id, found=True)
+            return chunk.students[slot]
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'unrolledlist.search_by_id', f"Student with ID {student_id} not found", student_id=student_id, found=False)
+        return None
+
+    def search_by_name(self, name: str) -> List[Student]:
+        """Search for students by name (returns all matches)."""
+        key = name.lower()
+        matches = [student for student in self if student.name.lower() == key]
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'unrolledlist.search_by_name', f"Found {len(matches)} student(s) with name '{name}'", name=name, matches=len(matches))
+        return matches
+
+    def delete_by_id(self, student_id: int, chunk: Optional[Chunk] = None) -> bool:
+        """Delete a student by ID. Passing the student's chunk (from append)
+        skips the scan over the other chunks."""
+        chunk, slot = self._locate(student_id, chunk)
+        if chunk is None:
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'unrolledlist.delete', f"Student with ID {student_id} not found for deletion", student_id=student_id, deleted=False)
+            return False
+        chunk.remove(slot)
+        self.size_count -= 1
+        if not chunk.live:
+            self._unlink(chunk)
+        elif chunk.live * 2 < len(chunk.students):
+            chunk.compact()
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'unrolledlist.delete', f"Deleted student with ID {student_id}", student_id=student_id, deleted=True)
+        return True
+
+    def __iter__(self) -> Iterator[Student]:
+        """Lazily yield students in insertion order."""
+        chunk = self.head
+        while chunk:
+            next_chunk = chunk.next
+            for student in chunk.students:
+                if student is not None:
+                    yield student
+            chunk = next_chunk
+
+    def __reversed__(self) -> Iterator[Student]:
+        """Lazily yield students from the most recently inserted backwards."""
+        chunk = self.tail
+        while chunk:
+            prev_chunk = chunk.prev
+            for student in reversed(chunk.students):
+                if student is not None:
+                    yield student
+            chunk = prev_chunk
+
+    def __len__(self):
+        return self.size_count
+
+    def get_all_students(self) -> List[Student]:
+        """Get all students in insertion order."""
+        return list(self)
+
+    def size(self) -> int:
+        """Get the number of students in the list."""
+        return self.size_count
+
+    def is_empty(self) -> bool:
+        """Check if the list is empty."""
+        return self.size_count == 0
+
+    def clear(self):
+        """Clear all students from the list."""
+        self.head = None
+        self.tail = None
+        self.size_count = 0
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'unrolledlist.clear', "Cleared all students from unrolled list")
+
+    def update_student(self, student_id: int, new_name: str = None, new_age: int = None) -> bool:
+        """Update student information."""
+        chunk, slot = self._locate(student_id, None)
+        if chunk is None:
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'unrolledlist.update', f"Student with ID {student_id} not found for update", student_id=student_id, updated=False)
+            return False
+        student = chunk.students[slot]
+        if new_name is not None:
+            student.name = new_name
+        if new_age is not None:
+            student.age = new_age
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'unrolledlist.update', f"Updated student with ID {student_id}", student_id=student_id, updated=True)
+        return True
+
+    def replace_student(self, student: Student, chunk: Optional[Chunk] = None) -> bool:
+        """Replace the stored student that has the same ID with student,
+        without mutating the old Student object. Passing the student's
+        chunk (from append) skips the scan over the other chunks."""
+        chunk, slot = self._locate(student.id, chunk)
+        if chunk is None:
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'unrolledlist.replace', f"Student with ID {student.id} not found for update", student_id=student.id, replaced=False)
+            return False
+        chunk.students[slot] = student
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'unrolledlist.replace', f"Replaced student with ID {student.id}", student_id=student.id, replaced=True)
+        return True
@@ -0,0 +1,283 @@
+"""
+asyncio front end for StudentService and processing tasks.
+
+AsyncStudentService wraps a concurrent StudentService so that an asyncio
+application (e.g. an HTTP gateway) can await its methods. Calls run on a
+thread pool, so a write waiting for the service's lock never stalls the
+event loop. The exception is get_student, an O(1) lookup that runs
+directly on the loop whenever the read lock is free, since the hop to a
+thread costs far more than the lookup itself.
+
+AsyncTaskQueue is an asyncio-native priority queue of ProcessingTasks:
+await put() waits while the queue is full, which pushes back on the
+producers, and await get() waits for work. AsyncTaskExecutor drains it
+with a fixed number of worker coroutines. Coroutine handlers are awaited
+on the loop; plain functions run on a thread pool.
+
+    async with AsyncStudentService() as service:
+        await service.add_student("Alice", 20)
+        queue = AsyncTaskQueue(maxsize=1000)
+        async with AsyncTaskExecutor(queue, handlers={'add': send_welcome_email}):
+            await queue.put(ProcessingTask('add', await service.get_student(1), 1))
+"""
+import asyncio
+import functools
+import inspect
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import count
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+from ..models.student import Student
+from ..datastructures.queue import ProcessingTask
+from ..tracing import tracer, DEBUG, INFO, ERROR
+from .student_service import StudentService
+from .task_executor import LatencyStats
+
+AsyncHandler = Callable[[ProcessingTask], Union[Any, Awaitable[Any]]]
+
+class AsyncStudentService:
+    """Awaitable wrapper around a StudentService(concurrent=True)."""
+
+    def __init__(self, service: Optional[StudentService] = None, executor: Optional[Executor] = None,
+                 max_workers: Optional[int] = None):
+        if service is None:
+            service = StudentService(concurrent=True)
+        elif not service.concurrent:
+            # Calls run on several threads at once and need the service's lock
+            raise ValueError("AsyncStudentService needs a StudentService(concurrent=True)")
+        self.service = service
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='AsyncStudentService')
+
+    async def _run(self, method: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
+
+    async def add_student(self, name: str, age: int, student_id: int = None) -> bool:
+        return await self._run(self.service.add_student, name, age, student_id)
+
+    async def bulk_load(self, records: Iterable[Any]) -> bool:
+        return await self._run(self.service.bulk_load, records)
+
+    async def get_student(self, student_id: int) -> Optional[Student]:
+        lock = self.service._lock
+        if lock.try_acquire_read():
+            try:
+                return self.service.get_student(student_id)
+            finally:
+                lock.release_read()
+        return await self._run(self.service.get_student, student_id)
+
+    async def update_student(self, student_id: int, name: str = None, age: int = None) -> bool:
+        return await self._run(self.service.update_student, student_id, name, age)
+
+    async def delete_student(self, student_id: int) -> bool:
+        return await self._run(self.service.delete_student, student_id)
+
+    async def get_all_students(self) -> List[Student]:
+        return await self._run(self.service.get_all_students)
+
+    async def get_students_page(self, offset: int = 0, limit: int = 50) -> List[Student]:
+        return await self._run(self.service.get_students_page, offset, limit)
+
+    async def search_students_by_name(self, name: str) -> List[Student]:
+        return await self._run(self.service.search_students_by_name, name)
+
+    async def search_students_by_prefix(self, prefix: str, limit: int = 50) -> List[Student]:
+        return await self._run(self.service.search_students_by_prefix, prefix, limit)
+
+    async def query(self, **criteria) -> List[Student]:
+        """Run StudentService.query with the same keyword arguments."""
+        return await self._run(self.service.query, **criteria)
+
+    async def undo_last_operation(self) -> bool:
+        return await self._run(self.service.undo_last_operation)
+
+    async def undo(self, n: int = 1) -> int:
+        return await self._run(self.service.undo, n)
+
+    async def redo(self, n: int = 1) -> int:
+        return await self._run(self.service.redo, n)
+
+    async def schedule_task(self, task_type: str, student: Student, run_at: Optional[float] = None,
+                            delay: Optional[float] = None, priority: int = 0) -> bool:
+        return await self._run(self.service.schedule_task, task_type, student, run_at, delay, priority)
+
+    async def process_next_task(self) -> Optional[Dict[str, Any]]:
+        return await self._run(self.service.process_next_task)
+
+    async def get_pending_tasks(self) -> List[Dict[str, Any]]:
+        return await self._run(self.service.get_pending_tasks)
+
+    async def get_statistics(self) -> Dict[str, Any]:
+        return await self._run(self.service.get_statistics)
+
+    def close(self) -> None:
+        """Shut down the thread pool if this wrapper created it."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> 'AsyncStudentService':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+class AsyncTaskQueue:
+    """asyncio priority queue of ProcessingTasks, highest priority first
+    and FIFO among equal priorities. With maxsize set, put waits for room.
+    Like asyncio.Queue, it must be used from a single event loop."""
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        # (-priority, sequence, task): the sequence keeps ties in FIFO
+        # order and means tasks are never compared
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize)
+        self._counter = count()
+
+    def _entry(self, task: ProcessingTask) -> tuple:
+        return (-task.priority, next(self._counter), task)
+
+    async def put(self, task: ProcessingTask) -> None:
+        """Add a task, waiting while the queue is full."""
+        await self._queue.put(self._entry(task))
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'async_queue.put', f"Enqueued task: {task.task_type} for student ID {task.student.id}", task_type=task.task_type, student_id=task.student.id)
+
+    def put_nowait(self, task: ProcessingTask) -> bool:
+        """Add a task if there is room. Returns False when the queue is full."""
+        try:
+            self._queue.put_nowait(self._entry(task))
+            return True
+        except asyncio.QueueFull:
+            if tracer.debug_enabled:
+                tracer.emit(DEBUG, 'async_queue.full', f"Queue is full ({self.maxsize} items)", max_size=self.maxsize)
+            return False
+
+    async def enqueue_task(self, task_type: str, student: Student, priority: int = 0) -> None:
+        """Create a processing task and add it, waiting for room."""
+        await self.put(ProcessingTask(task_type, student, priority))
+
+    async def get(self) -> ProcessingTask:
+        """Remove and return the highest priority task, waiting for one."""
+        return (await self._queue.get())[2]
+
+    def get_nowait(self) -> Optional[ProcessingTask]:
+        """Remove and return the highest priority task, or None if empty."""
+        try:
+            return self._queue.get_nowait()[2]
+        except asyncio.QueueEmpty:
+            return None
+
+    def task_done(self) -> None:
+        """Mark a task returned by get as processed (see join)."""
+        self._queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every task put on the queue has been marked done."""
+        await self._queue.join()
+
+    def size(self) -> int:
+        return self._queue.qsize()
+
+    def is_empty(self) -> bool:
+        return self._queue.empty()
+
+    def is_full(self) -> bool:
+        return self._queue.full()
+
+class AsyncTaskExecutor:
+    """Drain an AsyncTaskQueue with worker coroutines."""
+
+    def __init__(self, queue: AsyncTaskQueue, workers: int = 4, handlers: Optional[Dict[str, AsyncHandler]] = None,
+                 executor: Optional[Executor] = None):
+        self.queue = queue
+        self.workers = workers
+        self._handlers: Dict[str, AsyncHandler] = dict(handlers or {})
+        self._executor = executor  # None: the loop's default thread pool
+        self._tasks: List[asyncio.Task] = []
+        self._completed = 0
+        self._failed = 0
+        self._unhandled = 0
+        self._in_flight = 0
+        self._queue_wait = LatencyStats()
+        self._run_time = LatencyStats()
+
+    def register_handler(self, task_type: str, handler: AsyncHandler) -> None:
+        """Run handler(task) for every task of task_type: awaited if it is a
+        coroutine function, otherwise run on the thread pool."""
+        self._handlers[task_type] = handler
+
+    def start(self) -> 'AsyncTaskExecutor':
+        """Start the worker coroutines on the running loop."""
+        if self._tasks:
+            raise RuntimeError("AsyncTaskExecutor already started")
+        self._tasks = [asyncio.create_task(self._work(), name=f'AsyncTaskExecutor-{i}') for i in range(self.workers)]
+        if tracer.info_enabled:
+            tracer.emit(INFO, 'async_executor.start', f"Started {self.workers} async workers", workers=self.workers)
+        return self
+
+    async def shutdown(self, drain: bool = True) -> None:
+        """Stop the workers, after processing every queued task if drain.
+        Tasks already running on the thread pool are allowed to finish."""
+        if drain:
+            await self.queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if tracer.info_enabled:
+            tracer.emit(INFO, 'async_executor.stop', f"Stopped after {self._completed} tasks", completed=self._completed, failed=self._failed)
+
+    async def __aenter__(self) -> 'AsyncTaskExecutor':
+        return self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.shutdown()
+        return False
+
+    async def _work(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            task = await self.queue.get()
+            self._in_flight += 1
+            self._queue_wait.add(time.monotonic() - task.enqueued_at)
+            try:
+                await self._run(loop, task)
+            finally:
+                self._in_flight -= 1
+                self.queue.task_done()
+
+    async def _run(self, loop: asyncio.AbstractEventLoop, task: ProcessingTask) -> None:
+        handler = self._handlers.get(task.task_type)
+        if handler is None:
+            self._unhandled += 1
+            return
+        start = time.perf_counter()
+        try:
+            if inspect.iscoroutinefunction(handler):
+                await handler(task)
+            else:
+                # Keep slow synchronous handlers off the event loop
+                await loop.run_in_executor(self._executor, handler, task)
+            self._completed += 1
+        except Exception as e:
+            self._failed += 1
+            tracer.emit(ERROR, 'async_executor.task_failed', f"Task {task.task_type} for student ID {task.student.id} failed: {e}",
+                        task_type=task.task_type, student_id=task.student.id)
+        finally:
+            self._run_time.add(time.perf_counter() - start)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get task counts and latency statistics (in seconds), as for
+        TaskExecutor.metrics."""
+        return {
+            'completed': self._completed,
+            'failed': self._failed,
+            'unhandled': self._unhandled,
+            'in_flight': self._in_flight,
+            'pending': self.queue.size(),
+            'queue_wait': self._queue_wait.summary(),
+            'run_time': self._run_time.summary(),
+        }
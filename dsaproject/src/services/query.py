@@ -0,0 +1,133 @@
+"""
+Small query planner over the StudentService indexes.
+
+Each criterion passed to StudentService.query becomes an AccessPath: an
+index that can estimate how many students match without fetching them,
+produce the matching IDs, and re-check a fetched student. The planner
+drives the query from the path with the smallest estimate, intersects the
+IDs of paths whose estimates are close to it, and applies everything else
+as a cheap residual filter on the fetched students.
+"""
+import heapq
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from ..models.student import Student
+
+# Paths whose estimate is within this factor of the driver's are
+# intersected as ID sets; larger ones are checked row by row instead.
+INTERSECT_RATIO = 2
+
+ORDER_FIELDS = ('id', 'name', 'age')
+
+class AccessPath:
+    """One criterion answered by one index."""
+    __slots__ = ('criterion', 'index', 'estimate', 'ids', 'matches', 'order')
+
+    def __init__(self, criterion: str, index: str, estimate: int,
+                 ids: Callable[[], Iterable[int]], matches: Callable[[Student], bool],
+                 order: Optional[str] = None):
+        self.criterion = criterion
+        self.index = index
+        self.estimate = estimate
+        self.ids = ids  # Produces the matching IDs lazily
+        self.matches = matches  # Re-checks one fetched student
+        self.order = order  # Field the IDs come out sorted by, if any
+
+def _order_key(field: str) -> Callable[[Student], Any]:
+    if field == 'name':
+        return lambda student: student.name.casefold()
+    if field == 'age':
+        return lambda student: student.age
+    return lambda student: student.id
+
+class QueryPlan:
+    """The chosen driver, intersections and residual filters for a query."""
+
+    def __init__(self, paths: List[AccessPath], order_by: Optional[str], limit: Optional[int]):
+        paths = sorted(paths, key=lambda path: path.estimate)
+        self.driver = paths[0]
+        self.intersect = [path for path in paths[1:] if path.estimate <= INTERSECT_RATIO * self.driver.estimate]
+        self.residual = [path for path in paths[1:] if path not in self.intersect]
+        self.paths = paths
+        self.descending = bool(order_by) and order_by.startswith('-')
+        self.order_field = order_by.lstrip('-') if order_by else None
+        if self.order_field is not None and self.order_field not in ORDER_FIELDS:
+            raise ValueError(f"Cannot order by {order_by!r} (expected one of {', '.join(ORDER_FIELDS)})")
+        self.limit = limit
+        # The driver already yields rows in the requested order
+        self.presorted = self.order_field is None or (self.order_field == self.driver.order and not self.descending)
+
+    def execute(self, students: Dict[int, Student]) -> List[Student]:
+        if self.driver.estimate == 0 or self.limit == 0:
+            return []
+        id_sets = [set(path.ids()) for path in self.intersect]
+        residual = [path.matches for path in self.residual]
+        rows = (students[student_id] for student_id in self.driver.ids()
+                if all(student_id in id_set for id_set in id_sets))
+        if residual:
+            rows = (student for student in rows if all(match(student) for match in residual))
+        if self.presorted:
+            return list(islice(rows, self.limit))
+        key = _order_key(self.order_field)
+        if self.limit is None:
+            return sorted(rows, key=key, reverse=self.descending)
+        select = heapq.nlargest if self.descending else heapq.nsmallest
+        return select(self.limit, rows, key=key)
+
+    def explain(self) -> Dict[str, Any]:
+        return {
+            'index': self.driver.index,
+            'driver': self.driver.criterion,
+            'estimated_rows': self.driver.estimate,
+            'estimates': {path.criterion: path.estimate for path in self.paths},
+            'intersect': [path.criterion for path in self.intersect],
+            'residual': [path.criterion for path in self.residual],
+            'order_by': (('-' if self.descending else '') + self.order_field) if self.order_field else None,
+            'presorted': self.presorted,
+            'limit': self.limit,
+        }
+
+def plan_query(service, name: Optional[str] = None, name_prefix: Optional[str] = None,
+               age: Optional[int] = None, age_between: Optional[Tuple[int, int]] = None,
+               id_range: Optional[Tuple[int, int]] = None, order_by: Optional[str] = None,
+               limit: Optional[int] = None) -> QueryPlan:
+    """Build a QueryPlan over service's indexes for the given criteria."""
+    bst = service.bst
+    paths = []
+    if id_range is not None:
+        lo_id, hi_id = id_range
+        paths.append(AccessPath(
+            'id_range', 'bst', bst.count_range(lo_id, hi_id),
+            lambda: (student.id for student in bst.iter_range(lo_id, hi_id)),
+            lambda student: lo_id <= student.id <= hi_id, order='id'))
+    if name is not None:
+        key = name.casefold()
+        bucket = service._names.get(key, {})
+        paths.append(AccessPath(
+            'name', 'name', len(bucket), lambda: iter(bucket),
+            lambda student: student.name.casefold() == key, order='name'))
+    if name_prefix is not None:
+        prefix = name_prefix.casefold()
+        trie = service._name_trie
+        paths.append(AccessPath(
+            'name_prefix', 'name_trie', trie.count_prefix(prefix),
+            lambda: trie.iter_prefix(prefix),
+            lambda student: student.name.casefold().startswith(prefix), order='name'))
+    ages = service.age_index
+    if age is not None:
+        paths.append(AccessPath(
+            'age', 'age', ages.count(age),
+            lambda: (student.id for student in ages.get(age)),
+            lambda student: student.age == age, order='age'))
+    if age_between is not None:
+        min_age, max_age = age_between
+        paths.append(AccessPath(
+            'age_between', 'age', ages.count_range(min_age, max_age),
+            lambda: (student.id for student in ages.iter_range(min_age, max_age)),
+            lambda student: min_age <= student.age <= max_age, order='age'))
+    if not paths:
+        # No criteria: scan the primary index in ID order
+        paths.append(AccessPath(
+            'all', 'bst', bst.size(), lambda: (student.id for student in bst),
+            lambda student: True, order='id'))
+    return QueryPlan(paths, order_by, limit)
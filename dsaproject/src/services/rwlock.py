@@ -0,0 +1,121 @@
+import threading
+
+class _Guard:
+    """Context manager that acquires and releases one side of a lock."""
+    __slots__ = ('_acquire', '_release')
+
+    def __init__(self, acquire, release):
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self):
+        self._acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._release()
+        return False
+
+class ReadWriteLock:
+    """Writer-preferring reader/writer lock.
+
+    Any number of threads may hold the read side at once; the write side is
+    exclusive. Waiting writers block new readers so a steady stream of
+    reads cannot starve them. Both sides are reentrant for the owning
+    thread, and a thread holding the write side may also take the read
+    side. Upgrading a read lock to a write lock is not supported (it would
+    deadlock against another upgrading reader) and raises RuntimeError.
+
+    Use the guards as context managers:
+
+        with lock.reader:
+            ...
+        with lock.writer:
+            ...
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._write_depth = 0
+        self._writers_waiting = 0
+        self._local = threading.local()
+        self.reader = _Guard(self.acquire_read, self.release_read)
+        self.writer = _Guard(self.acquire_write, self.release_write)
+
+    def acquire_read(self) -> None:
+        local = self._local
+        depth = getattr(local, 'read_depth', 0)
+        if depth:
+            local.read_depth = depth + 1
+            return
+        if self._writer == threading.get_ident():
+            # Reading under our own write lock: nothing else to wait for
+            local.read_depth = 1
+            local.counted = False
+            return
+        with self._cond:
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        local.read_depth = 1
+        local.counted = True
+
+    def try_acquire_read(self) -> bool:
+        """Take the read side only if that needs no waiting. Returns
+        whether it was taken (then release it with release_read)."""
+        local = self._local
+        if getattr(local, 'read_depth', 0) or self._writer == threading.get_ident():
+            self.acquire_read()
+            return True
+        with self._cond:
+            if self._writer is not None or self._writers_waiting:
+                return False
+            self._readers += 1
+        local.read_depth = 1
+        local.counted = True
+        return True
+
+    def release_read(self) -> None:
+        local = self._local
+        local.read_depth -= 1
+        if local.read_depth == 0 and local.counted:
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        me = threading.get_ident()
+        if self._writer == me:
+            self._write_depth += 1
+            return
+        if getattr(self._local, 'read_depth', 0):
+            raise RuntimeError("Cannot upgrade a read lock to a write lock")
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self) -> None:
+        self._write_depth -= 1
+        if self._write_depth == 0:
+            with self._cond:
+                self._writer = None
+                self._cond.notify_all()
+
+class NullLock:
+    """Drop-in stand-in for ReadWriteLock that does no locking at all."""
+
+    def __init__(self):
+        self.reader = self.writer = _Guard(self._noop, self._noop)
+
+    @staticmethod
+    def _noop() -> None:
+        pass
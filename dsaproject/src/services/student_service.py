@@ -1,29 +1,195 @@
-from typing import List, Optional, Dict, Any
+import threading
+import time
+from collections import deque
+from functools import wraps
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple
 from ..models.student import Student
-from ..datastructures.bst import BinarySearchTree
+from ..tracing import tracer, INFO, ERROR
+from ..datastructures.bst import BinarySearchTree, BSTSnapshot
 from ..datastructures.linkedlist import LinkedList
+from ..datastructures.trie import NameTrie
+from ..datastructures.secondary_index import SecondaryIndex, AgeIndex
 from ..datastructures.stack import UndoStack, Operation
-from ..datastructures.queue import PriorityQueue, ProcessingTask
+from ..datastructures.queue import BlockingPriorityQueue, ProcessingTask
+from .rwlock import ReadWriteLock, NullLock
+from .query import plan_query
+
+def _reads(method):
+    """Run a StudentService method under the service's read lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock.reader:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def _writes(method):
+    """Run a StudentService method under the service's write lock, making it
+    atomic across every data structure it touches. Tasks that found the
+    bounded task queue full are queued after the lock is released, so
+    workers that read the service can keep draining it meanwhile."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        local = self._local
+        local.write_depth = getattr(local, 'write_depth', 0) + 1
+        try:
+            with self._lock.writer:
+                return method(self, *args, **kwargs)
+        finally:
+            local.write_depth -= 1
+            if not local.write_depth and getattr(local, 'deferred', False):
+                local.deferred = False
+                self._flush_deferred_tasks()
+    return wrapper
 
 class StudentService:
     """Service class that manages student data using various data structures"""
     
-    def __init__(self):
-        # Primary storage using BST for efficient search by ID
-        self.bst = BinarySearchTree()
+    def __init__(self, index_class: type = BinarySearchTree, concurrent: bool = False,
+                 list_class: type = LinkedList, task_queue_size: Optional[int] = None,
+                 coalesce_tasks: bool = True):
+        # With concurrent=True every public method takes a reader/writer lock:
+        # reads run in parallel, writes are serialized and atomic across the
+        # BST, LinkedList, UndoStack and PriorityQueue. Iterators returned by
+        # iter_* methods are not protected; iterate over snapshot() instead.
+        self.concurrent = concurrent
+        self._lock = ReadWriteLock() if concurrent else NullLock()
+        self._local = threading.local()
+        # Tasks that found the bounded task queue full, in write order. Any
+        # writer's task goes here while it is non-empty, so a later write can
+        # never overtake an earlier one; _flush_lock lets one thread at a
+        # time hand them to the queue.
+        self._deferred: deque = deque()
+        self._flush_lock = threading.Lock()
         
-        # LinkedList for maintaining insertion order and alternative searching
-        self.linked_list = LinkedList()
+        # Primary storage using BST for efficient search by ID. Any class with
+        # the BinarySearchTree API can be used instead, e.g. SortedArrayIndex
+        # for large rosters.
+        self.index_class = index_class
+        self.bst = index_class()
         
-        # Stack for undo operations
+        # LinkedList for maintaining insertion order and alternative searching.
+        # UnrolledLinkedList has the same API and stores students in chunks,
+        # which iterates faster and uses less memory for large rosters.
+        self.list_class = list_class
+        self.linked_list = list_class()
+        
+        # Stack for undo operations (and the redo list), plus named
+        # checkpoints: checkpoint name -> UndoStack position
         self.undo_stack = UndoStack(max_size=100)
+        self._checkpoints: Dict[str, int] = {}
+        
+        # Queue for processing tasks. It is thread-safe so a TaskExecutor can
+        # drain it in the background; with task_queue_size set, writes wait
+        # for room once that many tasks are pending. With coalesce_tasks the
+        # queue holds at most one add/update/delete task per student (e.g. an
+        # add followed by a delete leaves nothing to process).
+        self.processing_queue = BlockingPriorityQueue(max_size=task_queue_size, coalesce=coalesce_tasks)
+        
+        # Hash indexes for O(1) point lookups: ID -> Student and ID -> its
+        # handle in the insertion-order list (a Node, or a Chunk for
+        # UnrolledLinkedList). The BST is only needed for ordered access.
+        self._students: Dict[int, Student] = {}
+        self._nodes: Dict[int, Any] = {}
         
-        # Queue for processing tasks
-        self.processing_queue = PriorityQueue()
+        # Inverted name index: casefolded name -> IDs with that name. The
+        # inner dict is used as an insertion-ordered set.
+        self._names: Dict[str, Dict[int, None]] = {}
+        # Trie over the same names for prefix, substring and fuzzy search
+        self._name_trie = NameTrie()
+        
+        # Pluggable secondary indexes by name, kept in step with every write.
+        # The age index is always present and feeds get_statistics.
+        self._indexes: Dict[str, SecondaryIndex] = {}
+        self.age_index = AgeIndex()
+        self._indexes['age'] = self.age_index
         
         # ID counter for auto-generating student IDs
         self.next_id = 1
     
+    def _enqueue_task(self, task_type: str, student: Student, priority: int) -> None:
+        """Queue a processing task without blocking under the write lock."""
+        task = ProcessingTask(task_type, student, priority)
+        if self._deferred or not self.processing_queue.enqueue(task, block=False):
+            # The queue is full, or earlier tasks are still waiting for room:
+            # _writes hands the task over once the lock is released
+            self._deferred.append(task)
+            self._local.deferred = True
+    
+    def _flush_deferred_tasks(self) -> None:
+        """Queue every deferred task in write order, waiting for room. The
+        front task is only removed once queued, so concurrent writers keep
+        deferring behind it until the backlog is gone."""
+        deferred = self._deferred
+        with self._flush_lock:
+            while deferred:
+                self.processing_queue.enqueue(deferred[0])
+                deferred.popleft()
+    
+    def _store(self, student: Student) -> bool:
+        """Add a new student to the BST, the LinkedList and the lookup indexes."""
+        if not self.bst.insert(student):
+            return False
+        node = self.linked_list.append(student)
+        if node is None:
+            # Rollback BST insertion if LinkedList fails
+            self.bst.delete(student.id)
+            return False
+        self._students[student.id] = student
+        self._nodes[student.id] = node
+        self._index_name(student)
+        for index in self._indexes.values():
+            index.add(student)
+        return True
+    
+    def _index_name(self, student: Student) -> None:
+        self._names.setdefault(student.name.casefold(), {})[student.id] = None
+        self._name_trie.insert(student.name, student.id)
+    
+    def _unindex_name(self, student: Student) -> None:
+        key = student.name.casefold()
+        ids = self._names[key]
+        del ids[student.id]
+        if not ids:
+            del self._names[key]
+        self._name_trie.remove(student.name, student.id)
+    
+    def _replace(self, student: Student) -> bool:
+        """Swap the stored record for student.id with student everywhere."""
+        old_student = self._students[student.id]
+        if not self.bst.insert(student):  # BST insert updates if ID exists
+            return False
+        # Replace rather than mutate, so snapshots holding the old Student
+        # object stay consistent
+        if not self.linked_list.replace_student(student, self._nodes[student.id]):
+            # Rollback BST update
+            self.bst.insert(old_student)
+            return False
+        self._students[student.id] = student
+        if old_student.name.casefold() != student.name.casefold():
+            self._unindex_name(old_student)
+            self._index_name(student)
+        for index in self._indexes.values():
+            index.replace(old_student, student)
+        return True
+    
+    def _remove(self, student_id: int) -> bool:
+        """Remove a stored student from every structure."""
+        student = self._students[student_id]
+        if not self.bst.delete(student_id):
+            return False
+        if not self.linked_list.delete_by_id(student_id, self._nodes[student_id]):
+            # Rollback BST deletion
+            self.bst.insert(student)
+            return False
+        del self._students[student_id]
+        del self._nodes[student_id]
+        self._unindex_name(student)
+        for index in self._indexes.values():
+            index.remove(student)
+        return True
+    
+    @_writes
     def add_student(self, name: str, age: int, student_id: int = None) -> bool:
         """Add a new student to the system."""
         try:
@@ -33,9 +199,9 @@ class StudentService:
                 self.next_id += 1
             else:
                 # Check if ID already exists
-                existing = self.bst.search(student_id)
-                if existing:
-                    print(f"Student with ID {student_id} already exists")
+                if student_id in self._students:
+                    if tracer.info_enabled:
+                        tracer.emit(INFO, 'service.add_rejected', f"Student with ID {student_id} already exists", student_id=student_id)
                     return False
                 
                 # Update next_id if provided ID is higher
@@ -45,45 +211,117 @@ class StudentService:
             # Create student object
             student = Student(id=student_id, name=name, age=age)
             
-            # Add to BST (primary storage)
-            if not self.bst.insert(student):
-                return False
-            
-            # Add to LinkedList (for insertion order)
-            if not self.linked_list.insert_at_tail(student):
-                # Rollback BST insertion if LinkedList fails
-                self.bst.delete(student_id)
+            # Add to BST (primary storage), LinkedList (insertion order) and
+            # the lookup indexes
+            if not self._store(student):
                 return False
             
             # Record operation for undo
             self.undo_stack.push_operation('add', student)
             
             # Add to processing queue (low priority for new additions)
-            self.processing_queue.enqueue_task('add', student, priority=1)
+            self._enqueue_task('add', student, priority=1)
             
-            print(f"Successfully added student: {student}")
+            if tracer.info_enabled:
+                tracer.emit(INFO, 'service.add', f"Successfully added student: {student}", student_id=student.id)
             return True
             
         except Exception as e:
-            print(f"Error adding student: {e}")
+            tracer.emit(ERROR, 'service.add_failed', f"Error adding student: {e}")
             return False
     
+    @_writes
+    def bulk_load(self, records: Iterable[Any]) -> bool:
+        """Load many students in one pass, e.g. when restoring a roster.
+        
+        Each record is a Student or a (name, age) / (name, age, student_id)
+        tuple like the arguments of add_student; records without an ID get
+        auto-generated ones in order. Input already sorted by ID loads in
+        O(n + existing); otherwise it is sorted first. The load is
+        all-or-nothing and is not queued for task processing. It cannot be
+        undone, and a successful load clears the undo and redo history and
+        the checkpoints, which could otherwise overwrite loaded students.
+        """
+        try:
+            students = []
+            next_id = self.next_id
+            for record in records:
+                if not isinstance(record, Student):
+                    name, age, *rest = record
+                    student_id = rest[0] if rest and rest[0] is not None else None
+                    if student_id is None:
+                        student_id = next_id
+                        next_id += 1
+                    record = Student(id=student_id, name=name, age=age)
+                if record.id >= next_id:
+                    next_id = record.id + 1
+                students.append(record)
+            
+            # The LinkedList keeps record order; the BST needs ID order
+            ordered = students
+            if any(students[i - 1].id >= students[i].id for i in range(1, len(students))):
+                ordered = sorted(students, key=lambda student: student.id)
+            
+            # Merge with the students already stored, rejecting duplicate IDs
+            merged = []
+            existing = self.bst.get_all_students()
+            i = j = 0
+            while i < len(existing) and j < len(ordered):
+                if existing[i].id < ordered[j].id:
+                    merged.append(existing[i])
+                    i += 1
+                else:
+                    merged.append(ordered[j])
+                    j += 1
+            merged.extend(existing[i:])
+            merged.extend(ordered[j:])
+            
+            # from_sorted rejects duplicate IDs before anything is modified
+            bst = self.index_class.from_sorted(merged)
+            self.bst = bst
+            nodes = self.linked_list.extend(students)
+            for student, node in zip(students, nodes):
+                self._students[student.id] = student
+                self._nodes[student.id] = node
+                self._index_name(student)
+                for index in self._indexes.values():
+                    index.add(student)
+            self.next_id = next_id
+            self.undo_stack.clear()
+            self._checkpoints = {}
+            
+            if tracer.info_enabled:
+                tracer.emit(INFO, 'service.bulk_load', f"Successfully bulk loaded {len(students)} students", count=len(students))
+            return True
+            
+        except Exception as e:
+            tracer.emit(ERROR, 'service.bulk_load_failed', f"Error bulk loading students: {e}")
+            return False
+    
+    @_reads
     def get_student(self, student_id: int) -> Optional[Student]:
         """Get a student by ID."""
         try:
-            # Use BST for efficient search
-            return self.bst.search(student_id)
+            # O(1) hash lookup; the BST is only needed for ordered access
+            return self._students.get(student_id)
         except Exception as e:
-            print(f"Error getting student: {e}")
+            tracer.emit(ERROR, 'service.get_failed', f"Error getting student: {e}")
             return None
     
+    @_reads
+    def has_student(self, student_id: int) -> bool:
+        """Check whether a student with this ID exists."""
+        return student_id in self._students
+    
+    @_writes
     def update_student(self, student_id: int, name: str = None, age: int = None) -> bool:
         """Update an existing student."""
         try:
             # Find existing student
-            existing_student = self.bst.search(student_id)
+            existing_student = self._students.get(student_id)
             if not existing_student:
-                print(f"Student with ID {student_id} not found")
+                if tracer.info_enabled:
+                    tracer.emit(INFO, 'service.not_found', f"Student with ID {student_id} not found", student_id=student_id)
                 return False
             
             # Store old data for undo
@@ -100,61 +338,54 @@ class StudentService:
                 age=age if age is not None else existing_student.age
             )
             
-            # Update in BST
-            if not self.bst.insert(updated_student):  # BST insert updates if ID exists
-                return False
-            
-            # Update in LinkedList
-            if not self.linked_list.update_student(student_id, updated_student.name, updated_student.age):
-                # Rollback BST update
-                self.bst.insert(old_student)
+            # Update in BST, LinkedList and the lookup indexes
+            if not self._replace(updated_student):
                 return False
             
             # Record operation for undo
             self.undo_stack.push_operation('update', updated_student, old_student)
             
             # Add to processing queue (medium priority for updates)
-            self.processing_queue.enqueue_task('update', updated_student, priority=2)
+            self._enqueue_task('update', updated_student, priority=2)
             
-            print(f"Successfully updated student: {updated_student}")
+            if tracer.info_enabled:
+                tracer.emit(INFO, 'service.update', f"Successfully updated student: {updated_student}", student_id=student_id)
             return True
             
         except Exception as e:
-            print(f"Error updating student: {e}")
+            tracer.emit(ERROR, 'service.update_failed', f"Error updating student: {e}")
             return False
     
+    @_writes
     def delete_student(self, student_id: int) -> bool:
         """Delete a student by ID."""
         try:
             # Find existing student
-            existing_student = self.bst.search(student_id)
+            existing_student = self._students.get(student_id)
             if not existing_student:
-                print(f"Student with ID {student_id} not found")
-                return False
-            
-            # Delete from BST
-            if not self.bst.delete(student_id):
+                if tracer.info_enabled:
+                    tracer.emit(INFO, 'service.not_found', f"Student with ID {student_id} not found", student_id=student_id)
                 return False
             
-            # Delete from LinkedList
-            if not self.linked_list.delete_by_id(student_id):
-                # Rollback BST deletion
-                self.bst.insert(existing_student)
+            # Delete from BST, LinkedList and the lookup indexes
+            if not self._remove(student_id):
                 return False
             
             # Record operation for undo
             self.undo_stack.push_operation('delete', existing_student)
             
             # Add to processing queue (high priority for deletions)
-            self.processing_queue.enqueue_task('delete', existing_student, priority=3)
+            self._enqueue_task('delete', existing_student, priority=3)
             
-            print(f"Successfully deleted student: {existing_student}")
+            if tracer.info_enabled:
+                tracer.emit(INFO, 'service.delete', f"Successfully deleted student: {existing_student}", student_id=student_id)
             return True
             
         except Exception as e:
-            print(f"Error deleting student: {e}")
+            tracer.emit(ERROR, 'service.delete_failed', f"Error deleting student: {e}")
             return False
     
+    @_reads
     def get_all_students(self, sorted_by_id: bool = True) -> List[Student]:
         """Get all students. If sorted_by_id is True, returns sorted by ID, otherwise by insertion order."""
         if sorted_by_id:
@@ -162,60 +393,307 @@ class StudentService:
         else:
             return self.linked_list.get_all_students()
     
+    def iter_students(self, order: str = 'id', reverse: bool = False) -> Iterator[Student]:
+        """Lazily yield all students by ID (order='id', from the BST) or in
+        insertion order (order='insertion', from the LinkedList). With
+        reverse=True the order is descending or newest-first. Nothing is
+        copied, so the extra memory is constant; use snapshot() for a view
+        that does not change while it is being consumed."""
+        if order == 'id':
+            source = self.bst
+        elif order == 'insertion':
+            source = self.linked_list
+        else:
+            raise ValueError(f"Unknown order {order!r} (expected 'id' or 'insertion')")
+        return reversed(source) if reverse else iter(source)
+    
+    @_reads
+    def get_students_page(self, offset: int = 0, limit: int = 50) -> List[Student]:
+        """Get up to limit students in ID order, starting at position offset."""
+        return list(islice(self.bst.iter_inorder(max(offset, 0)), max(limit, 0)))
+    
+    @_reads
+    def get_student_at(self, position: int) -> Optional[Student]:
+        """Get the student at a 0-based position in ID order."""
+        return self.bst.select(position)
+    
+    @_reads
+    def get_student_position(self, student_id: int) -> int:
+        """Get how many students have a smaller ID than student_id."""
+        return self.bst.rank(student_id)
+    
+    @_reads
+    def get_students_in_range(self, lo_id: int, hi_id: int) -> List[Student]:
+        """Get students with lo_id <= ID <= hi_id, sorted by ID."""
+        return self.bst.range(lo_id, hi_id)
+    
+    def iter_students_in_range(self, lo_id: int, hi_id: int) -> Iterator[Student]:
+        """Lazily yield students with lo_id <= ID <= hi_id, sorted by ID."""
+        return self.bst.iter_range(lo_id, hi_id)
+    
+    @_reads
+    def count_students_in_range(self, lo_id: int, hi_id: int) -> int:
+        """Count students with lo_id <= ID <= hi_id."""
+        return self.bst.count_range(lo_id, hi_id)
+    
+    @_reads
+    def get_next_student(self, student_id: int) -> Optional[Student]:
+        """Get the student with the next higher ID."""
+        return self.bst.successor(student_id)
+    
+    @_reads
+    def get_previous_student(self, student_id: int) -> Optional[Student]:
+        """Get the student with the next lower ID."""
+        return self.bst.predecessor(student_id)
+    
+    @_reads
+    def get_floor_student(self, student_id: int) -> Optional[Student]:
+        """Get the student with the largest ID <= student_id."""
+        return self.bst.floor(student_id)
+    
+    @_reads
+    def get_ceiling_student(self, student_id: int) -> Optional[Student]:
+        """Get the student with the smallest ID >= student_id."""
+        return self.bst.ceiling(student_id)
+    
+    @_reads
     def search_students_by_name(self, name: str) -> List[Student]:
-        """Search students by name using LinkedList."""
-        return self.linked_list.search_by_name(name)
+        """Search students by name (case-insensitive) using the name index.
+        Matches come back in the order they were added under that name."""
+        ids = self._names.get(name.casefold())
+        if not ids:
+            return []
+        students = self._students
+        return [students[student_id] for student_id in ids]
+    
+    @_reads
+    def search_students_by_prefix(self, prefix: str, limit: int = 50) -> List[Student]:
+        """Get up to limit students whose name starts with prefix
+        (case-insensitive), in alphabetical order of name."""
+        students = self._students
+        return [students[student_id] for student_id in islice(self._name_trie.iter_prefix(prefix), limit)]
+    
+    @_reads
+    def search_students_containing(self, text: str, limit: int = 50) -> List[Student]:
+        """Get up to limit students whose name contains text (case-insensitive)."""
+        students = self._students
+        return [students[student_id] for student_id in islice(self._name_trie.iter_contains(text), limit)]
+    
+    @_reads
+    def search_students_fuzzy(self, name: str, max_distance: int = 2, limit: int = 50) -> List[Student]:
+        """Get up to limit students whose name is within max_distance edits
+        of name (case-insensitive), closest matches first."""
+        students = self._students
+        matches = islice(self._name_trie.iter_fuzzy(name, max_distance), limit)
+        return [students[student_id] for student_id, _ in matches]
+    
+    @_writes
+    def register_index(self, name: str, index: SecondaryIndex) -> bool:
+        """Register a secondary index under name and fill it from the
+        current students. It is then maintained on every write."""
+        if name in self._indexes:
+            if tracer.info_enabled:
+                tracer.emit(INFO, 'service.index_rejected', f"Index '{name}' is already registered", index=name)
+            return False
+        for student in self._students.values():
+            index.add(student)
+        self._indexes[name] = index
+        return True
+    
+    @_reads
+    def get_index(self, name: str) -> Optional[SecondaryIndex]:
+        """Get a registered secondary index by name."""
+        return self._indexes.get(name)
+    
+    @_reads
+    def get_students_by_age(self, age: int) -> List[Student]:
+        """Get all students of exactly age."""
+        return self.age_index.get(age)
+    
+    @_reads
+    def get_students_in_age_range(self, min_age: int, max_age: int) -> List[Student]:
+        """Get students with min_age <= age <= max_age, ordered by age."""
+        return self.age_index.range(min_age, max_age)
+    
+    @_reads
+    def count_students_in_age_range(self, min_age: int, max_age: int) -> int:
+        """Count students with min_age <= age <= max_age."""
+        return self.age_index.count_range(min_age, max_age)
+    
+    @_reads
+    def count_students_by_age(self) -> Dict[int, int]:
+        """Get the number of students per age, ordered by age."""
+        return self.age_index.counts()
+    
+    @_reads
+    def query(self, name: Optional[str] = None, name_prefix: Optional[str] = None,
+              age: Optional[int] = None, age_between: Optional[Tuple[int, int]] = None,
+              id_range: Optional[Tuple[int, int]] = None, order_by: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Student]:
+        """Find students matching every given criterion.
+        
+        name is an exact and name_prefix a leading match (both
+        case-insensitive); age_between and id_range are inclusive (lo, hi)
+        pairs. order_by is 'id', 'name' or 'age', prefixed with '-' for
+        descending order. The query is driven from the index with the
+        fewest estimated matches; see explain() for the chosen plan.
+        """
+        plan = plan_query(self, name=name, name_prefix=name_prefix, age=age, age_between=age_between,
+                          id_range=id_range, order_by=order_by, limit=limit)
+        return plan.execute(self._students)
+    
+    @_reads
+    def explain(self, name: Optional[str] = None, name_prefix: Optional[str] = None,
+                age: Optional[int] = None, age_between: Optional[Tuple[int, int]] = None,
+                id_range: Optional[Tuple[int, int]] = None, order_by: Optional[str] = None,
+                limit: Optional[int] = None) -> Dict[str, Any]:
+        """Describe how query() would run with the same arguments: the
+        driving index and its row estimate, the estimate for every
+        criterion, which ones are intersected as ID sets and which are
+        checked per row, and whether a sort is needed."""
+        plan = plan_query(self, name=name, name_prefix=name_prefix, age=age, age_between=age_between,
+                          id_range=id_range, order_by=order_by, limit=limit)
+        return plan.explain()
     
+    @_reads
     def get_student_count(self) -> int:
         """Get total number of students."""
         return self.bst.size()
     
+    @_reads
     def get_min_max_students(self) -> tuple[Optional[Student], Optional[Student]]:
         """Get students with minimum and maximum IDs."""
         return self.bst.get_min_student(), self.bst.get_max_student()
     
+    @_writes
     def undo_last_operation(self) -> bool:
         """Undo the last operation."""
+        return self.undo(1) == 1
+    
+    @_writes
+    def undo(self, n: int = 1) -> int:
+        """Undo up to the last n operations as one batch and return how many
+        were undone. They can be redone until the next write."""
         try:
-            operation = self.undo_stack.undo_last_operation()
-            if not operation:
-                return False
-            
-            if operation.operation_type == 'add':
-                # Undo add by deleting
-                self.bst.delete(operation.student.id)
-                self.linked_list.delete_by_id(operation.student.id)
-                print(f"Undid add operation for student ID {operation.student.id}")
-                
-            elif operation.operation_type == 'delete':
-                # Undo delete by adding back
-                self.bst.insert(operation.student)
-                self.linked_list.insert_at_tail(operation.student)
-                print(f"Undid delete operation for student ID {operation.student.id}")
-                
-            elif operation.operation_type == 'update':
-                # Undo update by restoring old data
-                if operation.old_data:
-                    self.bst.insert(operation.old_data)
-                    self.linked_list.update_student(
-                        operation.old_data.id,
-                        operation.old_data.name,
-                        operation.old_data.age
-                    )
-                    print(f"Undid update operation for student ID {operation.student.id}")
-            
-            return True
-            
+            operations = self.undo_stack.undo_operations(n)
+            if not operations:
+                return 0
+            # Newest first: each student ends up as before its earliest operation
+            students = self._apply_states({op.student.id: op.state_before() for op in operations})
+            if tracer.info_enabled:
+                tracer.emit(INFO, 'service.undo', f"Undid {len(operations)} operation(s) affecting {students} student(s)",
+                            operations=len(operations), students=students)
+            return len(operations)
+        except Exception as e:
+            tracer.emit(ERROR, 'service.undo_failed', f"Error undoing operation: {e}")
+            return 0
+    
+    @_writes
+    def redo(self, n: int = 1) -> int:
+        """Redo up to the last n undone operations as one batch and return
+        how many were redone."""
+        try:
+            operations = self.undo_stack.redo_operations(n)
+            if not operations:
+                return 0
+            # Oldest first: each student ends up as after its latest operation
+            students = self._apply_states({op.student.id: op.state_after() for op in operations})
+            if tracer.info_enabled:
+                tracer.emit(INFO, 'service.redo', f"Redid {len(operations)} operation(s) affecting {students} student(s)",
+                            operations=len(operations), students=students)
+            return len(operations)
         except Exception as e:
-            print(f"Error undoing operation: {e}")
+            tracer.emit(ERROR, 'service.redo_failed', f"Error redoing operation: {e}")
+            return 0
+    
+    def _apply_states(self, states: Dict[int, Optional[Student]]) -> int:
+        """Bring each student to its target record (None: absent) with at
+        most one store, replace or remove, however many operations were
+        folded into the target. Returns the number of students changed;
+        raises RuntimeError if a change fails."""
+        changed = 0
+        for student_id, target in states.items():
+            current = self._students.get(student_id)
+            if target is None:
+                if current is None:
+                    continue
+                done = self._remove(student_id)
+            elif current is None:
+                done = self._store(target)
+            elif current is not target:
+                done = self._replace(target)
+            else:
+                continue
+            if not done:
+                raise RuntimeError(f"could not restore student ID {student_id}")
+            changed += 1
+        return changed
+    
+    @_writes
+    def create_checkpoint(self, name: str) -> None:
+        """Name the current point in the undo history (replacing any
+        checkpoint of the same name)."""
+        self._checkpoints[name] = self.undo_stack.position()
+    
+    @_writes
+    def undo_to_checkpoint(self, name: str) -> bool:
+        """Undo every operation since checkpoint name, as one batch. Fails if
+        the checkpoint is unknown or no longer reachable: operations after
+        it were evicted from the undo history, or it was undone and then
+        replaced by new writes."""
+        seq = self._checkpoints.get(name)
+        count = self.undo_stack.count_since(seq) if seq is not None else None
+        if count is None:
+            if tracer.info_enabled:
+                tracer.emit(INFO, 'service.checkpoint_unavailable', f"Cannot undo to checkpoint '{name}'", checkpoint=name)
             return False
+        return self.undo(count) == count
     
-    def get_operation_history(self) -> List[str]:
-        """Get a history of operations."""
-        operations = self.undo_stack.get_operation_history()
+    @_reads
+    def snapshot(self) -> BinarySearchTree:
+        """Get an immutable, point-in-time view of the students ordered by ID.
+        
+        With index_class=PersistentBinarySearchTree this is O(1) and shares
+        structure with the live tree; other indexes are copied in O(n).
+        Later writes (including clear_all_data) never affect the snapshot, so
+        long scans and exports can run on it without locking.
+        """
+        if hasattr(self.bst, 'snapshot'):
+            return self.bst.snapshot()
+        return BSTSnapshot.from_sorted(self.bst.get_all_students())
+    
+    @_reads
+    def get_operation_history(self, limit: Optional[int] = None) -> List[str]:
+        """Get a history of operations, oldest first. With limit, only the
+        most recent limit operations."""
+        operations = self.undo_stack.get_operation_history(limit)
         return [f"{op.operation_type.capitalize()} student ID {op.student.id} ({op.student.name})" 
                 for op in operations]
     
+    def schedule_task(self, task_type: str, student: Student, run_at: Optional[float] = None,
+                      delay: Optional[float] = None, priority: int = 0) -> bool:
+        """Queue a processing task that is not handed out before run_at (a
+        time.time() timestamp) or until delay seconds from now. With neither
+        it is due at once.
+        
+        Only the thread-safe task queue is touched, so this takes no service
+        lock and may wait for room in a bounded queue.
+        """
+        if run_at is not None and delay is not None:
+            raise ValueError("Pass either run_at or delay, not both")
+        if run_at is not None:
+            # The queue runs on the monotonic clock, which wall-clock
+            # adjustments cannot move
+            delay = run_at - time.time()
+        due = time.monotonic() + delay if delay is not None else None
+        if not self.processing_queue.enqueue(ProcessingTask(task_type, student, priority, run_at=due)):
+            return False
+        if tracer.info_enabled:
+            tracer.emit(INFO, 'service.schedule', f"Scheduled {task_type} for student ID {student.id} in {max(0.0, delay or 0.0):.3f}s",
+                        task_type=task_type, student_id=student.id, delay=delay)
+        return True
+    
+    @_writes
     def process_next_task(self) -> Optional[Dict[str, Any]]:
         """Process the next task in the queue."""
         task = self.processing_queue.process_next_task()
@@ -227,28 +705,44 @@ class StudentService:
             }
         return None
     
+    @_reads
     def get_pending_tasks(self) -> List[Dict[str, Any]]:
         """Get all pending tasks."""
         tasks = self.processing_queue.get_all_tasks()
         return [{'task_type': task.task_type, 'student': task.student, 'priority': task.priority} 
                 for task in tasks]
     
+    @_writes
     def clear_all_data(self):
         """Clear all data from all data structures."""
-        self.bst = BinarySearchTree()
-        self.linked_list = LinkedList()
+        self.bst = self.index_class()
+        self.linked_list = self.list_class()
+        self._students = {}
+        self._nodes = {}
+        self._names = {}
+        self._name_trie = NameTrie()
+        for index in self._indexes.values():
+            index.clear()
         self.undo_stack.clear()
+        self._checkpoints = {}
         self.processing_queue.clear()
         self.next_id = 1
-        print("Cleared all student data")
+        if tracer.info_enabled:
+            tracer.emit(INFO, 'service.clear', "Cleared all student data")
     
+    @_reads
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about the data structures."""
         return {
             'total_students': self.bst.size(),
             'pending_tasks': self.processing_queue.size(),
             'undo_operations_available': self.undo_stack.size(),
+            'redo_operations_available': self.undo_stack.redo_size(),
             'min_student': self.bst.get_min_student(),
             'max_student': self.bst.get_max_student(),
-            'next_available_id': self.next_id
+            'next_available_id': self.next_id,
+            'min_age': self.age_index.min_key(),
+            'max_age': self.age_index.max_key(),
+            'average_age': self.age_index.average(),
+            'students_per_age': self.age_index.counts()
         }
@@ -0,0 +1,249 @@
+"""
+Background execution of the ProcessingTask queue.
+
+A TaskExecutor runs a dispatcher thread that pulls batches of tasks from a
+BlockingPriorityQueue (highest priority first) and hands them to a thread
+or process pool, where each task is passed to the handler registered for
+its task_type. Only a bounded number of batches is in flight at a time, so
+when the workers fall behind the queue fills up and a bounded queue pushes
+back on the producers. The dispatcher sleeps until a task is due (delayed
+tasks included) or shutdown wakes it; it never polls.
+
+With retries=N a failed task is put back on the queue, delayed by
+retry_backoff * 2**attempt seconds, up to N times before it counts as
+failed.
+
+    executor = TaskExecutor(service.processing_queue, workers=4, batch_size=32)
+    executor.register_handler('add', send_welcome_email)
+    executor.start()
+    ...
+    executor.shutdown()  # drains the queue, then stops the workers
+    print(executor.metrics())
+
+Process pools pickle the handlers and tasks, so handlers must be
+module-level functions there.
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..datastructures.queue import BlockingPriorityQueue, ProcessingTask
+from ..tracing import tracer, DEBUG, INFO, ERROR
+
+Handler = Callable[[ProcessingTask], Any]
+
+def _run_batch(handlers: Dict[str, Handler], tasks: List[ProcessingTask]) -> List[Tuple[Optional[bool], float, Optional[str]]]:
+    """Run each task with its handler and return (ok, run_time, error) per
+    task; ok is None when no handler is registered. Module level so that
+    process pools can pickle it."""
+    results = []
+    for task in tasks:
+        handler = handlers.get(task.task_type)
+        if handler is None:
+            results.append((None, 0.0, f"No handler for task type '{task.task_type}'"))
+            continue
+        start = time.perf_counter()
+        try:
+            handler(task)
+            results.append((True, time.perf_counter() - start, None))
+        except Exception as e:
+            results.append((False, time.perf_counter() - start, str(e)))
+    return results
+
+class LatencyStats:
+    """Running count/average/max plus percentiles over recent samples."""
+
+    def __init__(self, window: int = 10000):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self._recent.append(seconds)
+
+    def summary(self) -> Dict[str, float]:
+        recent = sorted(self._recent)
+        if not recent:
+            return {'count': 0, 'avg': 0.0, 'max': 0.0, 'p50': 0.0, 'p95': 0.0}
+        return {
+            'count': self.count,
+            'avg': self.total / self.count,
+            'max': self.max,
+            'p50': recent[len(recent) // 2],
+            'p95': recent[min(len(recent) - 1, int(len(recent) * 0.95))],
+        }
+
+class TaskExecutor:
+    """Drain a BlockingPriorityQueue on a thread or process pool."""
+
+    def __init__(self, queue: BlockingPriorityQueue, workers: int = 4, mode: str = 'thread',
+                 batch_size: int = 1, handlers: Optional[Dict[str, Handler]] = None,
+                 retries: int = 0, retry_backoff: float = 0.1):
+        if mode not in ('thread', 'process'):
+            raise ValueError(f"Unknown executor mode {mode!r} (expected 'thread' or 'process')")
+        self.queue = queue
+        self.workers = workers
+        self.mode = mode
+        self.batch_size = batch_size
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self._handlers: Dict[str, Handler] = dict(handlers or {})
+        self._pool = None
+        self._dispatcher: Optional[threading.Thread] = None
+        # Bound the batches handed to the pool so unprocessed work stays in
+        # the (possibly bounded) queue rather than the pool's own backlog
+        self._slots = threading.Semaphore(2 * workers)
+        self._stopping = threading.Event()
+        self._drain = True
+        self._metrics_lock = threading.Lock()
+        self._completed = 0
+        self._failed = 0
+        self._unhandled = 0
+        self._retried = 0
+        self._in_flight = 0
+        self._by_type: Dict[str, int] = {}
+        self._queue_wait = LatencyStats()
+        self._run_time = LatencyStats()
+
+    def register_handler(self, task_type: str, handler: Handler) -> None:
+        """Run handler(task) for every task of task_type."""
+        self._handlers[task_type] = handler
+
+    def start(self) -> 'TaskExecutor':
+        """Start the worker pool and the dispatcher thread."""
+        if self._dispatcher is not None:
+            raise RuntimeError("TaskExecutor already started")
+        pool_class = ThreadPoolExecutor if self.mode == 'thread' else ProcessPoolExecutor
+        self._pool = pool_class(max_workers=self.workers)
+        self._dispatcher = threading.Thread(target=self._dispatch, name='TaskExecutor-dispatcher', daemon=True)
+        self._dispatcher.start()
+        if tracer.info_enabled:
+            tracer.emit(INFO, 'executor.start', f"Started {self.workers} {self.mode} workers", workers=self.workers, mode=self.mode)
+        return self
+
+    def shutdown(self, wait: bool = True, drain: bool = True) -> None:
+        """Stop the executor. With drain=True the tasks that are due are
+        processed first; otherwise they are left in the queue (a later
+        call cannot turn draining back on). Delayed tasks and retries that
+        are not yet due once the rest is done stay queued either way, so a
+        task scheduled an hour ahead does not hold up shutdown. With
+        wait=True this returns once every dispatched task has finished."""
+        if not drain:
+            self._drain = False
+        self._stopping.set()
+        self.queue.wake()
+        if wait and self._dispatcher is not None:
+            self._dispatcher.join()
+
+    def __enter__(self) -> 'TaskExecutor':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+        return False
+
+    def _should_stop(self) -> bool:
+        # When draining, in-flight tasks may still put retries on the queue,
+        # which are kept for later if not due by the time the rest is done
+        return self._stopping.is_set() and (not self._drain or (not self.queue.ready_size() and not self._in_flight))
+
+    def _dispatch(self) -> None:
+        try:
+            while True:
+                # Check for shutdown only once a slot is free, since waiting
+                # for one can take as long as a whole batch
+                self._slots.acquire()
+                if self._should_stop():
+                    self._slots.release()
+                    break
+                batch = self.queue.get_batch(self.batch_size, cancel=self._should_stop)
+                if not batch:
+                    self._slots.release()
+                    continue
+                dispatched_at = time.monotonic()
+                with self._metrics_lock:
+                    self._in_flight += len(batch)
+                try:
+                    future = self._pool.submit(_run_batch, self._handlers, batch)
+                except Exception as e:
+                    self._finish_batch(batch, dispatched_at, None, e)
+                    continue
+                future.add_done_callback(
+                    lambda future, batch=batch, dispatched_at=dispatched_at:
+                        self._finish_batch(batch, dispatched_at, future, None))
+        finally:
+            self._pool.shutdown(wait=True)
+            if tracer.info_enabled:
+                tracer.emit(INFO, 'executor.stop', f"Stopped after {self._completed} tasks", completed=self._completed, failed=self._failed)
+
+    def _finish_batch(self, batch: List[ProcessingTask], dispatched_at: float, future, error: Optional[Exception]) -> None:
+        if error is None:
+            try:
+                results = future.result()
+            except Exception as e:  # e.g. a handler that cannot be pickled
+                error = e
+        if error is not None:
+            tracer.emit(ERROR, 'executor.batch_failed', f"Error running task batch: {error}", size=len(batch))
+            results = [(False, 0.0, str(error))] * len(batch)
+        # A delayed task starts waiting when it falls due
+        waits = [max(0.0, dispatched_at - max(task.enqueued_at, task.run_at or 0.0)) for task in batch]
+        # Re-queue retries before in_flight drops, so a draining shutdown
+        # waits for them. Never block here: that could stall the workers
+        # the dispatcher needs to make room.
+        retried = set()
+        for task, (ok, _, _) in zip(batch, results):
+            if ok is False and task.attempts < self.retries:
+                task.attempts += 1
+                delay = self.retry_backoff * 2 ** (task.attempts - 1)
+                task.run_at = time.monotonic() + delay
+                if self.queue.enqueue(task, block=False):
+                    retried.add(id(task))
+                    if tracer.debug_enabled:
+                        tracer.emit(DEBUG, 'executor.retry', f"Retrying {task.task_type} for student ID {task.student.id} in {delay:.3f}s",
+                                    task_type=task.task_type, student_id=task.student.id, attempt=task.attempts)
+        with self._metrics_lock:
+            self._in_flight -= len(batch)
+            for task, wait, (ok, run_time, message) in zip(batch, waits, results):
+                self._queue_wait.add(wait)
+                self._by_type[task.task_type] = self._by_type.get(task.task_type, 0) + 1
+                if ok is None:
+                    self._unhandled += 1
+                    continue
+                self._run_time.add(run_time)
+                if ok:
+                    self._completed += 1
+                elif id(task) in retried:
+                    self._retried += 1
+                else:
+                    self._failed += 1
+                    if error is None:
+                        tracer.emit(ERROR, 'executor.task_failed', f"Task {task.task_type} for student ID {task.student.id} failed: {message}",
+                                    task_type=task.task_type, student_id=task.student.id)
+        if tracer.debug_enabled:
+            tracer.emit(DEBUG, 'executor.batch', f"Finished batch of {len(batch)} tasks", size=len(batch))
+        self._slots.release()
+        if self._stopping.is_set():
+            self.queue.wake()  # A draining dispatcher may be waiting on in_flight
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get task counts and latency statistics (in seconds): queue_wait
+        is enqueue (or falling due) to dispatch, run_time is time spent in
+        the handler. retried counts failed runs that were queued again."""
+        with self._metrics_lock:
+            return {
+                'completed': self._completed,
+                'failed': self._failed,
+                'unhandled': self._unhandled,
+                'retried': self._retried,
+                'in_flight': self._in_flight,
+                'pending': self.queue.size(),
+                'by_type': dict(self._by_type),
+                'queue_wait': self._queue_wait.summary(),
+                'run_time': self._run_time.summary(),
+            }
@@ -0,0 +1,138 @@
+"""
+Lightweight structured tracing for the data structures and services.
+
+Hot paths guard every event with a plain attribute check, so a disabled
+level costs one attribute load and the message is never formatted:
+
+    if tracer.debug_enabled:
+        tracer.emit(DEBUG, 'bst.insert', f"Inserted {student}", student_id=student.id)
+
+By default only WARNING and above are emitted, to the 'dsaproject' logger.
+Turn on the full trace while debugging with trace_to_console() or capture
+it in memory with a RingBufferSink.
+"""
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+_LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARNING: 'WARNING', ERROR: 'ERROR'}
+
+class TraceEvent:
+    """A single structured trace event."""
+    __slots__ = ('timestamp', 'level', 'name', 'message', 'fields')
+
+    def __init__(self, level: int, name: str, message: str, fields: Dict[str, Any]):
+        self.timestamp = time.time()
+        self.level = level
+        self.name = name  # Dotted event name, e.g. 'bst.insert'
+        self.message = message
+        self.fields = fields
+
+    def __str__(self):
+        return f"[{_LEVEL_NAMES.get(self.level, self.level)}] {self.name}: {self.message}"
+
+    def __repr__(self):
+        return f"TraceEvent({self.name!r}, level={self.level}, fields={self.fields!r})"
+
+class PrintSink:
+    """Write event messages to stdout, like the original print() calls."""
+
+    def __call__(self, event: TraceEvent) -> None:
+        print(event.message)
+
+class LoggingSink:
+    """Forward events to a standard library logger."""
+
+    def __init__(self, logger_name: str = 'dsaproject'):
+        self.logger = logging.getLogger(logger_name)
+
+    def __call__(self, event: TraceEvent) -> None:
+        self.logger.log(event.level, "%s: %s", event.name, event.message)
+
+class RingBufferSink:
+    """Keep the most recent events in memory (oldest are dropped)."""
+
+    def __init__(self, capacity: int = 1000):
+        self._events = deque(maxlen=capacity)
+
+    def __call__(self, event: TraceEvent) -> None:
+        self._events.append(event)
+
+    def events(self, name: Optional[str] = None) -> List[TraceEvent]:
+        """Get buffered events, optionally only those with the given name."""
+        if name is None:
+            return list(self._events)
+        return [event for event in self._events if event.name == name]
+
+    def clear(self) -> None:
+        self._events.clear()
+
+    def __len__(self):
+        return len(self._events)
+
+class Tracer:
+    """Dispatches events at or above a level to a set of sinks."""
+
+    def __init__(self, level: int = WARNING, sinks: Optional[List[Callable[[TraceEvent], None]]] = None):
+        self._sinks = list(sinks) if sinks else []
+        self.set_level(level)
+
+    def set_level(self, level: int) -> None:
+        self.level = level
+        self._refresh()
+
+    def add_sink(self, sink: Callable[[TraceEvent], None]) -> None:
+        self._sinks.append(sink)
+        self._refresh()
+
+    def remove_sink(self, sink: Callable[[TraceEvent], None]) -> None:
+        self._sinks.remove(sink)
+        self._refresh()
+
+    def _refresh(self) -> None:
+        # Precomputed flags so call sites can skip disabled events cheaply
+        active = bool(self._sinks)
+        self.debug_enabled = active and self.level <= DEBUG
+        self.info_enabled = active and self.level <= INFO
+
+    def enabled(self, level: int) -> bool:
+        return bool(self._sinks) and level >= self.level
+
+    def emit(self, level: int, name: str, message: str = '', **fields: Any) -> None:
+        """Send an event to every sink if level is enabled."""
+        if level < self.level or not self._sinks:
+            return
+        event = TraceEvent(level, name, message, fields)
+        for sink in self._sinks:
+            sink(event)
+
+    @contextmanager
+    def capture(self, level: int = DEBUG, capacity: int = 1000) -> Iterator[RingBufferSink]:
+        """Temporarily record events at level and above into a ring buffer."""
+        sink = RingBufferSink(capacity)
+        old_level = self.level
+        self.add_sink(sink)
+        self.set_level(min(level, old_level))
+        try:
+            yield sink
+        finally:
+            self.remove_sink(sink)
+            self.set_level(old_level)
+
+# Shared tracer used by every module in the project
+tracer = Tracer(level=WARNING, sinks=[LoggingSink()])
+
+def trace_to_console(level: int = DEBUG) -> PrintSink:
+    """Print every event at level and above to stdout. Returns the sink so
+    it can be removed again with tracer.remove_sink()."""
+    sink = PrintSink()
+    tracer.add_sink(sink)
+    tracer.set_level(level)
+    return sink
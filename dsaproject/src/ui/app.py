@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox
 from typing import List
 from ..services.student_service import StudentService
 from ..models.student import Student
@@ -76,8 +76,9 @@ class StudentManagerApp:
         
         ttk.Button(advanced_frame, text="Search by Name", command=self.search_by_name).grid(row=0, column=0, padx=(0, 5))
         ttk.Button(advanced_frame, text="Undo Last Operation", command=self.undo_operation).grid(row=0, column=1, padx=(0, 5))
-        ttk.Button(advanced_frame, text="Show Statistics", command=self.show_statistics).grid(row=0, column=2, padx=(0, 5))
-        ttk.Button(advanced_frame, text="Clear All Data", command=self.clear_all_data).grid(row=0, column=3, padx=(0, 5))
+        ttk.Button(advanced_frame, text="Redo", command=self.redo_operation).grid(row=0, column=2, padx=(0, 5))
+        ttk.Button(advanced_frame, text="Show Statistics", command=self.show_statistics).grid(row=0, column=3, padx=(0, 5))
+        ttk.Button(advanced_frame, text="Clear All Data", command=self.clear_all_data).grid(row=0, column=4, padx=(0, 5))
         
         # Display frame
         display_frame = ttk.LabelFrame(main_frame, text="Students", padding="10")
@@ -145,11 +146,9 @@ class StudentManagerApp:
         for item in self.tree.get_children():
             self.tree.delete(item)
         
-        # Get students
-        students = self.student_service.get_all_students(sorted_by_id=sorted_by_id)
-        
-        # Add students to treeview
-        for student in students:
+        # Stream students into the treeview without building a list
+        order = 'id' if sorted_by_id else 'insertion'
+        for student in self.student_service.iter_students(order=order):
             self.tree.insert('', tk.END, values=(student.id, student.name, student.age))
         
         # Update status
@@ -279,25 +278,70 @@ class StudentManagerApp:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
     
     def search_by_name(self):
-        """Search students by name."""
-        try:
-            name = simpledialog.askstring("Search by Name", "Enter name to search:")
+        """Open the name search dialog (exact, prefix, contains or fuzzy)."""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Search by Name")
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        
+        frame = ttk.Frame(dialog, padding="10")
+        frame.grid(row=0, column=0)
+        
+        ttk.Label(frame, text="Enter name to search:").grid(row=0, column=0, columnspan=4, sticky=tk.W)
+        query_var = tk.StringVar()
+        query_entry = ttk.Entry(frame, textvariable=query_var, width=40)
+        query_entry.grid(row=1, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=(5, 10))
+        
+        mode_var = tk.StringVar(value="exact")
+        for column, (label, mode) in enumerate([("Exact", "exact"), ("Prefix", "prefix"),
+                                                ("Contains", "contains"), ("Fuzzy", "fuzzy")]):
+            ttk.Radiobutton(frame, text=label, variable=mode_var, value=mode).grid(row=2, column=column, sticky=tk.W)
+        
+        def run_search(event=None):
+            name = query_var.get().strip()
             if name:
+                dialog.destroy()
+                self.show_search_results(name, mode_var.get())
+        
+        buttons_frame = ttk.Frame(frame)
+        buttons_frame.grid(row=3, column=0, columnspan=4, pady=(10, 0))
+        ttk.Button(buttons_frame, text="Search", command=run_search).grid(row=0, column=0, padx=(0, 5))
+        ttk.Button(buttons_frame, text="Cancel", command=dialog.destroy).grid(row=0, column=1)
+        
+        query_entry.bind('<Return>', run_search)
+        dialog.bind('<Escape>', lambda event: dialog.destroy())
+        query_entry.focus_set()
+        dialog.grab_set()
+    
+    def show_search_results(self, name: str, mode: str):
+        """Run a name search in the given mode and show the matches."""
+        try:
+            if mode == "prefix":
+                students = self.student_service.search_students_by_prefix(name)
+                description = f"starting with '{name}'"
+            elif mode == "contains":
+                students = self.student_service.search_students_containing(name)
+                description = f"containing '{name}'"
+            elif mode == "fuzzy":
+                students = self.student_service.search_students_fuzzy(name)
+                description = f"similar to '{name}'"
+            else:
                 students = self.student_service.search_students_by_name(name)
+                description = f"with name '{name}'"
+            
+            if students:
+                # Clear and show search results
+                for item in self.tree.get_children():
+                    self.tree.delete(item)
                 
-                if students:
-                    # Clear and show search results
-                    for item in self.tree.get_children():
-                        self.tree.delete(item)
-                    
-                    for student in students:
-                        self.tree.insert('', tk.END, values=(student.id, student.name, student.age))
-                    
-                    self.status_var.set(f"Found {len(students)} student(s) with name '{name}'")
-                    messagebox.showinfo("Search Results", f"Found {len(students)} student(s) with name '{name}'")
-                else:
-                    messagebox.showinfo("Search Results", f"No students found with name '{name}'")
-                    self.refresh_display()
+                for student in students:
+                    self.tree.insert('', tk.END, values=(student.id, student.name, student.age))
+                
+                self.status_var.set(f"Found {len(students)} student(s) {description}")
+                messagebox.showinfo("Search Results", f"Found {len(students)} student(s) {description}")
+            else:
+                messagebox.showinfo("Search Results", f"No students found {description}")
+                self.refresh_display()
         
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred during search: {str(e)}")
@@ -315,23 +359,41 @@ class StudentManagerApp:
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred during undo: {str(e)}")
     
+    def redo_operation(self):
+        """Redo the last undone operation."""
+        try:
+            if self.student_service.redo() == 1:
+                messagebox.showinfo("Redo", "Operation redone successfully!")
+                self.refresh_display()
+            else:
+                messagebox.showinfo("Redo", "No operations to redo!")
+        
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred during redo: {str(e)}")
+    
     def show_statistics(self):
         """Show statistics about the data structures."""
         try:
             stats = self.student_service.get_statistics()
+            average_age = f"{stats['average_age']:.1f}" if stats['average_age'] is not None else 'None'
             
             stats_text = f"""Data Structure Statistics:
             
 Total Students: {stats['total_students']}
 Pending Tasks: {stats['pending_tasks']}
 Undo Operations Available: {stats['undo_operations_available']}
+Redo Operations Available: {stats['redo_operations_available']}
 Next Available ID: {stats['next_available_id']}
 
 Student with Min ID: {stats['min_student'] if stats['min_student'] else 'None'}
 Student with Max ID: {stats['max_student'] if stats['max_student'] else 'None'}
 
+Youngest Age: {stats['min_age']}
+Oldest Age: {stats['max_age']}
+Average Age: {average_age}
+
 Operation History:
-{chr(10).join(self.student_service.get_operation_history()[-10:])}"""  # Last 10 operations
+{chr(10).join(self.student_service.get_operation_history(limit=10))}"""  # Last 10 operations
             
             messagebox.showinfo("Statistics", stats_text)
         
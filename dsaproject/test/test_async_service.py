@@ -0,0 +1,145 @@
+import sys
+import os
+import asyncio
+import threading
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.async_service import AsyncStudentService, AsyncTaskQueue, AsyncTaskExecutor
+from src.services.student_service import StudentService
+from src.datastructures.queue import ProcessingTask
+from src.models.student import Student
+
+def test_async_student_service():
+    """Test awaitable CRUD on top of a concurrent StudentService."""
+    async def scenario():
+        async with AsyncStudentService(max_workers=4) as service:
+            results = await asyncio.gather(*(service.add_student(f"Student{i}", 20 + i % 5) for i in range(50)))
+            assert all(results)
+            assert len(await service.get_all_students()) == 50
+            
+            student = await service.get_student(1)
+            assert student is not None and student.name.startswith("Student")
+            assert await service.update_student(1, name="Alice") == True
+            assert [s.id for s in await service.search_students_by_name("alice")] == [1]
+            assert [s.id for s in await service.search_students_by_prefix("ali")] == [1]
+            assert len(await service.query(age=20)) == 10
+            assert len(await service.get_students_page(0, 10)) == 10
+            
+            assert await service.delete_student(1) == True
+            assert await service.get_student(1) is None
+            assert await service.undo_last_operation() == True
+            assert (await service.get_student(1)).name == "Alice"
+            
+            stats = await service.get_statistics()
+            assert stats['total_students'] == 50
+            assert await service.schedule_task('audit', student, delay=60) == True
+            assert any(task['task_type'] == 'audit' for task in await service.get_pending_tasks())
+            assert (await service.process_next_task()) is not None
+    
+    asyncio.run(scenario())
+    
+    # get_student runs on the loop unless a writer holds the lock, in which
+    # case it waits on the thread pool instead of blocking the loop
+    service = StudentService(concurrent=True)
+    service.add_student("Alice", 20)
+    release = threading.Event()
+    def hold_write_lock():
+        with service._lock.writer:
+            release.wait(5)
+    writer = threading.Thread(target=hold_write_lock)
+    writer.start()
+    time.sleep(0.02)
+    
+    async def contended():
+        async with AsyncStudentService(service) as wrapper:
+            lookup = asyncio.create_task(wrapper.get_student(1))
+            await asyncio.sleep(0.05)
+            assert not lookup.done()  # The loop kept running meanwhile
+            release.set()
+            return await lookup
+    
+    assert asyncio.run(contended()).name == "Alice"
+    writer.join(5)
+    
+    # Calls run on several threads, so the service must be concurrent
+    try:
+        AsyncStudentService(StudentService())
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    
+    print("AsyncStudentService test passed!")
+
+def test_async_task_queue():
+    """Test priority order and backpressure in the asyncio task queue."""
+    async def scenario():
+        queue = AsyncTaskQueue(maxsize=2)
+        student = Student(id=1, name="Alice", age=20)
+        assert queue.get_nowait() is None
+        
+        await queue.enqueue_task('add', student, priority=1)
+        await queue.put(ProcessingTask('delete', student, 3))
+        assert queue.is_full() and queue.size() == 2
+        assert queue.put_nowait(ProcessingTask('update', student, 2)) == False
+        
+        # A producer waits for room until a consumer takes a task
+        producer = asyncio.create_task(queue.put(ProcessingTask('update', student, 2)))
+        await asyncio.sleep(0.01)
+        assert not producer.done()
+        assert (await queue.get()).task_type == 'delete'
+        await asyncio.wait_for(producer, timeout=1)
+        
+        assert [queue.get_nowait().task_type, queue.get_nowait().task_type] == ['update', 'add']
+        assert queue.is_empty()
+    
+    asyncio.run(scenario())
+    print("AsyncTaskQueue test passed!")
+
+def test_async_task_executor():
+    """Test coroutine and thread-pool handlers, failures and draining."""
+    loop_thread = []
+    handler_threads = set()
+    seen = []
+    
+    def slow_sync(task):
+        handler_threads.add(threading.get_ident())
+        time.sleep(0.02)  # Would stall every coroutine if run on the loop
+        seen.append(task.student.id)
+    
+    async def fast_async(task):
+        seen.append(task.student.id)
+    
+    def failing(task):
+        raise RuntimeError("boom")
+    
+    async def scenario():
+        loop_thread.append(threading.get_ident())
+        queue = AsyncTaskQueue(maxsize=4)
+        executor = AsyncTaskExecutor(queue, workers=4, handlers={'add': slow_sync, 'update': fast_async})
+        executor.register_handler('delete', failing)
+        start = time.monotonic()
+        async with executor:
+            for i in range(1, 21):
+                await queue.enqueue_task('add', Student(id=i, name=f"S{i}", age=20), priority=1)
+            await queue.enqueue_task('update', Student(id=21, name="U", age=20), priority=2)
+            await queue.enqueue_task('delete', Student(id=22, name="D", age=20), priority=3)
+            await queue.enqueue_task('search', Student(id=23, name="X", age=20))
+        elapsed = time.monotonic() - start
+        
+        # 20 slow tasks on 4 workers overlap instead of running back to back
+        assert elapsed < 20 * 0.02
+        metrics = executor.metrics()
+        assert metrics['completed'] == 21 and metrics['failed'] == 1 and metrics['unhandled'] == 1
+        assert metrics['in_flight'] == 0 and metrics['pending'] == 0
+        assert metrics['queue_wait']['count'] == 23
+    
+    asyncio.run(scenario())
+    assert sorted(seen) == list(range(1, 22))
+    assert loop_thread[0] not in handler_threads
+    print("AsyncTaskExecutor test passed!")
+
+if __name__ == "__main__":
+    test_async_student_service()
+    test_async_task_queue()
+    test_async_task_executor()
@@ -1,8 +1,9 @@
 import sys
 import os
+import math
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.datastructures.bst import BinarySearchTree
+from src.datastructures.bst import BinarySearchTree, PersistentBinarySearchTree
 from src.models.student import Student
 
 def test_bst_operations():
@@ -69,6 +70,217 @@ def test_bst_update():
     
     print("BST update test passed!")
 
+def test_bst_balanced_sequential_ids():
+    """Test that sequential IDs keep the balanced tree logarithmic."""
+    bst = BinarySearchTree()
+    count = 5000
+    for student_id in range(1, count + 1):
+        assert bst.insert(Student(id=student_id, name=f"Student {student_id}", age=20)) == True
+    
+    # AVL height bound: 1.44 * log2(n + 2)
+    assert bst.height() <= 1.45 * math.log2(count + 2)
+    assert bst.size() == count
+    
+    # Deleting half the keys keeps the tree balanced and ordered
+    for student_id in range(1, count + 1, 2):
+        assert bst.delete(student_id) == True
+    remaining = bst.get_all_students()
+    assert [s.id for s in remaining] == list(range(2, count + 1, 2))
+    assert bst.height() <= 1.45 * math.log2(len(remaining) + 2)
+    
+    print("BST balanced sequential IDs test passed!")
+
+def test_bst_unbalanced_mode():
+    """Test that balanced=False keeps the plain BST shape."""
+    bst = BinarySearchTree(balanced=False)
+    for student_id in range(1, 11):
+        bst.insert(Student(id=student_id, name="Alice", age=20))
+    
+    assert bst.height() == 10  # Sequential IDs form a right-leaning chain
+    assert [s.id for s in bst.get_all_students()] == list(range(1, 11))
+    
+    print("BST unbalanced mode test passed!")
+
+def test_bst_deep_tree_iterative():
+    """Test that a deep unbalanced tree works without recursion."""
+    bst = BinarySearchTree(balanced=False)
+    count = sys.getrecursionlimit() + 200
+    for student_id in range(1, count + 1):
+        bst.insert(Student(id=student_id, name="Alice", age=20))
+    
+    assert bst.height() == count
+    assert bst.size() == count
+    assert bst.search(count).id == count
+    assert len(bst.get_all_students()) == count
+    assert bst.delete(1) == True
+    assert bst.delete(count) == True
+    assert bst.get_min_student().id == 2
+    assert bst.get_max_student().id == count - 1
+    
+    print("BST deep tree iterative test passed!")
+
+def test_bst_iter_inorder():
+    """Test lazy in-order iteration."""
+    bst = BinarySearchTree()
+    for student_id in [50, 20, 80, 10, 30, 70, 90]:
+        bst.insert(Student(id=student_id, name="Alice", age=20))
+    
+    iterator = bst.iter_inorder()
+    assert next(iterator).id == 10
+    assert next(iterator).id == 20
+    assert [s.id for s in iterator] == [30, 50, 70, 80, 90]
+    assert list(BinarySearchTree().iter_inorder()) == []
+    
+    print("BST iter_inorder test passed!")
+
+def test_bst_order_statistics():
+    """Test O(1) size plus select/rank order statistics."""
+    bst = BinarySearchTree()
+    ids = [50, 20, 80, 10, 30, 70, 90, 60]
+    for student_id in ids:
+        bst.insert(Student(id=student_id, name="Alice", age=20))
+    sorted_ids = sorted(ids)
+    
+    assert bst.size() == len(ids)
+    assert bst.root.size == len(ids)
+    for position, student_id in enumerate(sorted_ids):
+        assert bst.select(position).id == student_id
+        assert bst.rank(student_id) == position
+    assert bst.select(-1) is None
+    assert bst.select(len(ids)) is None
+    assert bst.rank(55) == 4  # 10, 20, 30 and 50
+    assert bst.rank(1000) == len(ids)
+    
+    # Sizes stay correct through updates and deletions
+    bst.insert(Student(id=30, name="Alice Smith", age=21))
+    assert bst.size() == len(ids)
+    bst.delete(20)
+    assert bst.size() == len(ids) - 1
+    assert bst.select(1).id == 30
+    
+    # Iteration can start from any position
+    assert [s.id for s in bst.iter_inorder(3)] == [60, 70, 80, 90]
+    assert list(bst.iter_inorder(100)) == []
+    
+    print("BST order statistics test passed!")
+
+def test_bst_range_queries():
+    """Test range, floor, ceiling, successor and predecessor."""
+    bst = BinarySearchTree()
+    for student_id in [50, 20, 80, 10, 30, 70, 90, 60]:
+        bst.insert(Student(id=student_id, name="Alice", age=20))
+    
+    assert [s.id for s in bst.range(25, 70)] == [30, 50, 60, 70]
+    assert [s.id for s in bst.range(10, 10)] == [10]
+    assert bst.range(91, 100) == []
+    assert bst.range(70, 25) == []
+    assert bst.count_range(25, 70) == 4
+    assert bst.count_range(0, 1000) == 8
+    
+    assert bst.floor(55).id == 50
+    assert bst.floor(50).id == 50
+    assert bst.floor(5) is None
+    assert bst.ceiling(55).id == 60
+    assert bst.ceiling(60).id == 60
+    assert bst.ceiling(95) is None
+    
+    assert bst.successor(50).id == 60
+    assert bst.successor(90) is None
+    assert bst.predecessor(50).id == 30
+    assert bst.predecessor(10) is None
+    
+    print("BST range queries test passed!")
+
+def test_bst_from_sorted():
+    """Test building a balanced tree from sorted students."""
+    count = 1000
+    students = [Student(id=i, name=f"Student {i}", age=20) for i in range(1, count + 1)]
+    bst = BinarySearchTree.from_sorted(students)
+    
+    assert bst.size() == count
+    assert bst.height() == math.ceil(math.log2(count + 1))
+    assert [s.id for s in bst.get_all_students()] == list(range(1, count + 1))
+    assert bst.select(499).id == 500
+    
+    # The bulk-built tree keeps working as a normal tree
+    assert bst.insert(Student(id=count + 1, name="Alice", age=20)) == True
+    assert bst.delete(1) == True
+    assert bst.size() == count
+    
+    assert BinarySearchTree.from_sorted([]).size() == 0
+    try:
+        BinarySearchTree.from_sorted([students[1], students[0]])
+        assert False, "Unsorted input should be rejected"
+    except ValueError:
+        pass
+    
+    print("BST from_sorted test passed!")
+
+def test_persistent_bst_snapshots():
+    """Test that snapshots of a persistent BST never change."""
+    bst = PersistentBinarySearchTree()
+    for student_id in range(1, 101):
+        bst.insert(Student(id=student_id, name="Alice", age=20))
+    
+    before = bst.snapshot()
+    old_root = bst.root
+    
+    # Writes after the snapshot: update, delete (with two children) and insert
+    bst.insert(Student(id=50, name="Bob", age=22))
+    assert bst.delete(64) == True
+    assert bst.delete(1) == True
+    bst.insert(Student(id=500, name="Charlie", age=19))
+    
+    assert bst.root is not old_root
+    assert bst.size() == 99
+    assert bst.search(50).name == "Bob"
+    assert bst.search(64) is None
+    assert bst.height() <= 1.45 * math.log2(bst.size() + 2)
+    
+    # The snapshot still sees the original version
+    assert before.size() == 100
+    assert before.search(50).name == "Alice"
+    assert before.search(64) is not None
+    assert before.search(500) is None
+    assert [s.id for s in before.get_all_students()] == list(range(1, 101))
+    
+    try:
+        before.insert(Student(id=999, name="Dave", age=20))
+        assert False, "Snapshots should be read-only"
+    except TypeError:
+        pass
+    
+    print("Persistent BST snapshot test passed!")
+
+def test_bst_iteration_protocol():
+    """Test iter(), reversed() and len() on the tree and its snapshots."""
+    for balanced in (True, False):
+        bst = PersistentBinarySearchTree(balanced=balanced)
+        assert list(bst) == [] and list(reversed(bst)) == [] and len(bst) == 0
+        ids = [50, 30, 70, 20, 40, 60, 80, 35, 65]
+        for student_id in ids:
+            bst.insert(Student(id=student_id, name=f"Student {student_id}", age=20))
+        assert [s.id for s in bst] == sorted(ids)
+        assert [s.id for s in reversed(bst)] == sorted(ids, reverse=True)
+        assert len(bst) == len(ids)
+        
+        # Snapshots iterate the frozen version
+        snapshot = bst.snapshot()
+        bst.delete(50)
+        assert len(snapshot) == len(ids) and len(bst) == len(ids) - 1
+        assert [s.id for s in reversed(snapshot)] == sorted(ids, reverse=True)
+        assert 50 not in [s.id for s in bst]
+    
+    print("BST iteration protocol test passed!")
+
 if __name__ == "__main__":
     test_bst_operations()
-    test_bst_update()
\ No newline at end of file
+    test_bst_update()
+    test_bst_balanced_sequential_ids()
+    test_bst_unbalanced_mode()
+    test_bst_deep_tree_iterative()
+    test_bst_iter_inorder()
+    test_bst_order_statistics()
+    test_bst_range_queries()
+    test_bst_from_sorted()
+    test_persistent_bst_snapshots()
\ No newline at end of file
@@ -79,6 +79,68 @@ def test_linkedlist_order():
     
     print("LinkedList order test passed!")
 
+def test_linkedlist_node_handles():
+    """Test O(1) append and unlink through node handles and the tail pointer."""
+    ll = LinkedList()
+    
+    nodes = [ll.append(Student(id=i, name=f"Student{i}", age=20)) for i in range(1, 6)]
+    assert ll.tail is nodes[-1]
+    assert ll.size() == 5
+    
+    # Unlink middle, head and tail nodes through their handles
+    assert ll.delete_by_id(3, nodes[2]) == True
+    assert ll.delete_by_id(1, nodes[0]) == True
+    assert ll.delete_by_id(5, nodes[4]) == True
+    assert [s.id for s in ll.get_all_students()] == [2, 4]
+    assert ll.head is nodes[1] and ll.tail is nodes[3]
+    assert ll.head.prev is None and ll.tail.next is None
+    assert ll.head.next is nodes[3] and nodes[3].prev is nodes[1]
+    assert ll.size() == 2
+    
+    # A stale handle is not trusted: the call falls back to a scan
+    assert ll.delete_by_id(3, nodes[2]) == False
+    assert ll.replace_student(Student(id=1, name="Ghost", age=1), nodes[0]) == False
+    assert ll.size() == 2
+    
+    # Appending after deletions links onto the current tail
+    node6 = ll.append(Student(id=6, name="Student6", age=20))
+    assert ll.replace_student(Student(id=6, name="Frank", age=21), node6) == True
+    assert [s.id for s in ll.get_all_students()] == [2, 4, 6]
+    assert ll.tail.student.name == "Frank"
+    
+    # Emptying the list resets both ends
+    for node in (nodes[1], nodes[3], node6):
+        assert ll.delete_by_id(node.student.id, node) == True
+    assert ll.head is None and ll.tail is None
+    assert ll.is_empty() == True
+    
+    # insert_at_head on an empty list sets the tail as well
+    ll.insert_at_head(Student(id=7, name="Grace", age=22))
+    ll.extend([Student(id=8, name="Heidi", age=23)])
+    assert [s.id for s in ll.get_all_students()] == [7, 8]
+    assert ll.tail.prev is ll.head
+    
+    print("LinkedList node handle test passed!")
+
+def test_linkedlist_iteration_protocol():
+    """Test iter(), reversed() and len() on the linked list."""
+    ll = LinkedList()
+    assert list(ll) == [] and list(reversed(ll)) == [] and len(ll) == 0
+    nodes = {i: ll.append(Student(id=i, name=f"Student{i}", age=20)) for i in (3, 1, 2, 5)}
+    assert [s.id for s in ll] == [3, 1, 2, 5]
+    assert [s.id for s in reversed(ll)] == [5, 2, 1, 3]
+    assert len(ll) == 4
+    
+    # Deleting the current student while iterating keeps the walk going
+    seen = []
+    for student in ll:
+        seen.append(student.id)
+        ll.delete_by_id(student.id, nodes[student.id])
+    assert seen == [3, 1, 2, 5]
+    assert len(ll) == 0
+    
+    print("LinkedList iteration protocol test passed!")
+
 if __name__ == "__main__":
     test_linkedlist_operations()
     test_linkedlist_order()
\ No newline at end of file
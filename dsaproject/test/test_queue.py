@@ -1,8 +1,11 @@
 import sys
 import os
+import random
+import threading
+import time
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.datastructures.queue import Queue, PriorityQueue, ProcessingTask
+from src.datastructures.queue import Queue, PriorityQueue, BlockingPriorityQueue, ProcessingTask
 from src.models.student import Student
 
 def test_queue_enqueue_dequeue():
@@ -102,8 +105,319 @@ def test_queue_with_students():
     
     print("Queue with students test passed!")
 
+def test_priority_queue_fifo_ties():
+    """Test that equal priorities come out in FIFO order from the heap."""
+    random.seed(3)
+    pq = PriorityQueue()
+    
+    tasks = []
+    for i in range(500):
+        student = Student(id=i + 1, name=f"Student{i}", age=20)
+        priority = random.randint(1, 3)
+        tasks.append((priority, i, student))
+        assert pq.enqueue_task('add', student, priority=priority) == True
+    
+    expected = [student.id for _, _, student in sorted(tasks, key=lambda t: (-t[0], t[1]))]
+    assert [task.student.id for task in pq.get_all_tasks()] == expected
+    assert pq.get_next_task().student.id == expected[0]
+    assert pq.size() == 500  # get_all_tasks and peeking do not consume
+    
+    processed = []
+    while not pq.is_empty():
+        processed.append(pq.process_next_task().student.id)
+    assert processed == expected
+    assert pq.process_next_task() is None
+    assert pq.front() is None
+    
+    # Plain items get priority 0 and queue behind higher priority tasks
+    pq.enqueue('plain')
+    pq.enqueue_task('delete', Student(id=1, name="Alice", age=20), priority=1)
+    assert pq.dequeue().task_type == 'delete'
+    assert pq.dequeue() == 'plain'
+    
+    pq.enqueue_task('add', Student(id=2, name="Bob", age=21), priority=2)
+    pq.clear()
+    assert pq.is_empty() and pq.get_all_tasks() == []
+    
+    print("PriorityQueue FIFO ties test passed!")
+
+def test_queue_batch_operations():
+    """Test enqueue_many/dequeue_many on the FIFO and priority queues."""
+    q = Queue()
+    assert q.enqueue_many(range(5)) == 5
+    assert q.enqueue('tail') == True
+    assert q.front() == 0
+    assert q.dequeue_many(3) == [0, 1, 2]
+    assert q.dequeue() == 3
+    assert q.dequeue_many(10) == [4, 'tail']
+    assert q.dequeue_many(10) == []
+    assert q.is_empty()
+    
+    # Large FIFO runs stay in order
+    assert q.enqueue_many(i for i in range(100000)) == 100000
+    assert q.dequeue_many(50000)[-1] == 49999
+    assert q.size() == 50000
+    assert q.front() == 50000
+    q.clear()
+    assert q.size() == 0
+    
+    pq = PriorityQueue()
+    students = [Student(id=i, name=f"Student{i}", age=20) for i in range(1, 5)]
+    tasks = [ProcessingTask('add', students[0], 1), ProcessingTask('delete', students[1], 3),
+             ProcessingTask('update', students[2], 2), ProcessingTask('delete', students[3], 3)]
+    assert pq.enqueue_many(tasks) == 4
+    assert [task.student.id for task in pq.dequeue_many(3)] == [2, 4, 3]
+    assert pq.size() == 1
+    assert pq.dequeue_many(5)[0].student.id == 1
+    
+    print("Queue batch operations test passed!")
+
+def test_blocking_priority_queue():
+    """Test waiting consumers and backpressure on a bounded queue."""
+    bq = BlockingPriorityQueue(max_size=2)
+    student = Student(id=1, name="Alice", age=20)
+    
+    # Consumers time out on an empty queue
+    assert bq.get(timeout=0.01) is None
+    assert bq.get_batch(5, timeout=0.01) == []
+    
+    assert bq.enqueue_task('add', student, priority=1) == True
+    assert bq.enqueue_task('delete', student, priority=3) == True
+    
+    # Full: non-blocking and timed-out enqueues are refused
+    assert bq.enqueue(ProcessingTask('update', student, 2), block=False) == False
+    assert bq.enqueue(ProcessingTask('update', student, 2), timeout=0.01) == False
+    assert bq.size() == 2
+    
+    # A blocked producer resumes as soon as a consumer makes room
+    results = []
+    producer = threading.Thread(target=lambda: results.append(bq.enqueue(ProcessingTask('update', student, 2))))
+    producer.start()
+    time.sleep(0.05)
+    assert producer.is_alive() and results == []
+    assert bq.get().task_type == 'delete'
+    producer.join(timeout=2)
+    assert results == [True]
+    
+    assert [task.task_type for task in bq.get_batch(5)] == ['update', 'add']
+    assert bq.is_empty()
+    
+    # A waiting consumer wakes up when work arrives
+    got = []
+    consumer = threading.Thread(target=lambda: got.append(bq.get(timeout=2)))
+    consumer.start()
+    time.sleep(0.02)
+    bq.enqueue('work')
+    consumer.join(timeout=2)
+    assert got == ['work']
+    
+    print("BlockingPriorityQueue test passed!")
+
+def test_priority_queue_coalescing():
+    """Test merging and cancelling pending tasks for the same student."""
+    pq = PriorityQueue(coalesce=True)
+    alice = Student(id=1, name="Alice", age=20)
+    bob = Student(id=2, name="Bob", age=21)
+    carol = Student(id=3, name="Carol", age=22)
+    
+    # add + update -> add of the latest data
+    pq.enqueue_task('add', alice, priority=1)
+    pq.enqueue_task('update', Student(id=1, name="Alice", age=30), priority=2)
+    # update + update -> latest update, keeping its place in line
+    pq.enqueue_task('update', bob, priority=2)
+    pq.enqueue_task('update', carol, priority=2)
+    pq.enqueue_task('update', Student(id=2, name="Robert", age=21), priority=2)
+    assert pq.size() == 3
+    tasks = pq.get_all_tasks()
+    assert [(task.task_type, task.student.id) for task in tasks] == [('add', 1), ('update', 2), ('update', 3)]
+    assert tasks[0].student.age == 30 and tasks[0].priority == 2
+    assert tasks[1].student.name == "Robert"
+    
+    # add + delete cancels both; update + delete -> delete
+    pq.enqueue_task('delete', alice, priority=3)
+    pq.enqueue_task('delete', carol, priority=3)
+    assert pq.size() == 2
+    assert pq.front().task_type == 'delete' and pq.front().student.id == 3
+    assert [(task.task_type, task.student.id) for task in pq.dequeue_many(5)] == [('delete', 3), ('update', 2)]
+    assert pq.is_empty() and pq.dequeue() is None
+    
+    # delete + add -> update; a dequeued task no longer absorbs new ones
+    pq.enqueue_task('delete', alice, priority=3)
+    pq.enqueue_task('add', alice, priority=1)
+    assert [task.task_type for task in pq.get_all_tasks()] == ['update']
+    assert pq.dequeue().task_type == 'update'
+    pq.enqueue_task('update', alice, priority=2)
+    pq.enqueue_task('search', alice)  # Not coalesced
+    assert pq.size() == 2
+    pq.clear()
+    assert pq.is_empty() and pq.front() is None
+    
+    # Heavy churn stays proportional to the distinct students
+    for i in range(1000):
+        student = Student(id=i % 10, name="S", age=20)
+        pq.enqueue_task('add', student, priority=1)
+        pq.enqueue_task('delete', student, priority=3)
+    assert pq.is_empty() and len(pq._container) <= 20
+    
+    # Without coalescing every task is kept
+    plain = PriorityQueue()
+    plain.enqueue_task('add', alice, priority=1)
+    plain.enqueue_task('delete', alice, priority=3)
+    assert plain.size() == 2
+    
+    print("PriorityQueue coalescing test passed!")
+
+def test_blocking_queue_coalescing():
+    """Test that coalesced tasks take no room in a full bounded queue."""
+    bq = BlockingPriorityQueue(max_size=1, coalesce=True)
+    student = Student(id=1, name="Alice", age=20)
+    assert bq.enqueue(ProcessingTask('add', student, 1)) == True
+    
+    # Full, but these merge into the pending task instead of waiting
+    assert bq.enqueue(ProcessingTask('update', student, 2), block=False) == True
+    assert bq.enqueue(ProcessingTask('add', Student(id=2, name="Bob", age=20), 1), block=False) == False
+    assert bq.size() == 1
+    
+    # Cancelling the pending task makes room for a blocked producer
+    results = []
+    producer = threading.Thread(target=lambda: results.append(bq.enqueue(ProcessingTask('add', Student(id=2, name="Bob", age=20), 1))))
+    producer.start()
+    time.sleep(0.05)
+    assert producer.is_alive()
+    bq.enqueue(ProcessingTask('delete', student, 3))
+    producer.join(timeout=2)
+    assert results == [True]
+    assert bq.get(timeout=1).student.name == "Bob"
+    assert bq.get(timeout=0.01) is None
+    
+    # Delayed tasks do not merge until due, so they count against max_size
+    bq = BlockingPriorityQueue(max_size=2, coalesce=True)
+    bq.enqueue(ProcessingTask('add', student, 1))
+    bq.enqueue(ProcessingTask('add', Student(id=2, name="Bob", age=20), 1))
+    later = [bq.enqueue(ProcessingTask('update', student, 2, run_at=time.monotonic() + 60), block=False)
+             for _ in range(3)]
+    assert later == [False, False, False]
+    assert bq.size() == 2
+    
+    # A delayed task that falls due and cancels a pending one wakes a
+    # producer waiting for room
+    bq = BlockingPriorityQueue(max_size=2, coalesce=True)
+    bq.enqueue_task('add', student, 1, delay=0.05)
+    bq.enqueue_task('delete', student, 3)
+    results = []
+    producer = threading.Thread(target=lambda: results.append(bq.enqueue(ProcessingTask('add', Student(id=2, name="Bob", age=20), 1), timeout=2)))
+    producer.start()
+    time.sleep(0.07)  # Past the deadline, but nothing has promoted the add
+    assert producer.is_alive()
+    start = time.monotonic()
+    assert bq.get(timeout=2).student.name == "Bob"
+    producer.join(timeout=2)
+    assert results == [True] and time.monotonic() - start < 0.5
+    assert bq.is_empty()
+    
+    print("BlockingPriorityQueue coalescing test passed!")
+
+def test_priority_queue_delayed_tasks():
+    """Test that tasks with a future run_at wait until they are due."""
+    pq = PriorityQueue()
+    alice = Student(id=1, name="Alice", age=20)
+    bob = Student(id=2, name="Bob", age=21)
+    
+    assert pq.next_due() is None
+    assert pq.enqueue_task('delete', alice, priority=3, delay=0.05) == True
+    assert pq.enqueue_task('add', bob, priority=1) == True
+    
+    # Delayed tasks count as pending but are not handed out early
+    assert pq.size() == 2 and not pq.is_empty()
+    assert 0 < pq.next_due() <= 0.05
+    assert [task.task_type for task in pq.get_all_tasks()] == ['add', 'delete']
+    assert pq.dequeue().task_type == 'add'
+    assert pq.front() is None and pq.dequeue() is None and pq.dequeue_many(5) == []
+    assert pq.size() == 1
+    
+    # Once due it competes on priority as usual
+    time.sleep(0.06)
+    assert pq.next_due() == 0.0
+    pq.enqueue_task('update', bob, priority=2)
+    assert [task.task_type for task in pq.dequeue_many(5)] == ['delete', 'update']
+    assert pq.is_empty() and pq.next_due() is None
+    
+    # A run_at in the past is due at once
+    pq.enqueue(ProcessingTask('add', alice, 1, run_at=time.monotonic() - 1))
+    assert pq.dequeue().student is alice
+    pq.enqueue_task('add', alice, delay=10)
+    pq.clear()
+    assert pq.is_empty()
+    
+    # Consumers sleep until the earliest deadline, and an earlier task
+    # arriving meanwhile wakes them
+    bq = BlockingPriorityQueue()
+    bq.enqueue_task('add', alice, delay=5)
+    got = []
+    consumer = threading.Thread(target=lambda: got.append(bq.get(timeout=2)))
+    consumer.start()
+    time.sleep(0.02)
+    start = time.monotonic()
+    bq.enqueue_task('add', bob, delay=0.05)
+    consumer.join(timeout=2)
+    assert got[0].student is bob and time.monotonic() - start < 1
+    assert bq.get(timeout=0.01) is None and bq.size() == 1
+    
+    # cancel() is re-checked when wake() is called
+    stop = threading.Event()
+    got = []
+    consumer = threading.Thread(target=lambda: got.append(bq.get_batch(5, cancel=stop.is_set)))
+    consumer.start()
+    time.sleep(0.02)
+    stop.set()
+    bq.wake()
+    consumer.join(timeout=2)
+    assert got == [[]]
+    
+    print("PriorityQueue delayed tasks test passed!")
+
+def test_coalescing_delayed_tasks():
+    """Test that a task falling due late merges as the older change."""
+    pq = PriorityQueue(coalesce=True)
+    student = Student(id=1, name="Alice", age=20)
+    
+    # A delayed update followed by an immediate delete: still a delete
+    pq.enqueue_task('update', student, 2, delay=0.03)
+    pq.enqueue_task('delete', student, 3)
+    time.sleep(0.04)
+    assert [task.task_type for task in pq.get_all_tasks()] == ['delete']
+    assert pq.dequeue().task_type == 'delete' and pq.is_empty()
+    
+    # A retried add that falls due after a newer delete cancels with it
+    add = ProcessingTask('add', student, 1)
+    pq.enqueue(add)
+    assert pq.dequeue() is add
+    add.run_at = time.monotonic() + 0.03  # As TaskExecutor does for a retry
+    pq.enqueue(add)
+    pq.enqueue_task('delete', student, 3)
+    time.sleep(0.04)
+    assert pq.get_all_tasks() == [] and pq.is_empty()
+    
+    # ... and one that falls due after a newer update keeps the newer data
+    renamed = Student(id=1, name="Alicia", age=20)
+    add.run_at = time.monotonic() + 0.03
+    pq.enqueue(add)
+    pq.enqueue_task('update', renamed, 2)
+    time.sleep(0.04)
+    tasks = pq.get_all_tasks()
+    assert [task.task_type for task in tasks] == ['add'] and tasks[0].student is renamed
+    
+    print("Coalescing delayed tasks test passed!")
+
 if __name__ == "__main__":
     test_queue_enqueue_dequeue()
     test_priority_queue()
     test_processing_task()
-    test_queue_with_students()
\ No newline at end of file
+    test_queue_with_students()
+    test_priority_queue_fifo_ties()
+    test_queue_batch_operations()
+    test_blocking_priority_queue()
+    test_priority_queue_coalescing()
+    test_blocking_queue_coalescing()
+    test_priority_queue_delayed_tasks()
+    test_coalescing_delayed_tasks()
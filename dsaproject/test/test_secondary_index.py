@@ -0,0 +1,95 @@
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.datastructures.secondary_index import SecondaryIndex, OrderedIndex, AgeIndex
+from src.models.student import Student
+
+def test_age_index_operations():
+    """Test AgeIndex buckets, range queries and aggregates."""
+    index = AgeIndex()
+    assert index.min_key() is None and index.max_key() is None
+    assert index.average() is None
+    
+    students = [Student(id=i, name=f"Student{i}", age=age) for i, age in enumerate([20, 18, 22, 20, 25, 18], 1)]
+    for student in students:
+        index.add(student)
+    assert len(index) == 6
+    assert index.min_key() == 18 and index.max_key() == 25
+    assert index.average() == 123 / 6
+    assert index.counts() == {18: 2, 20: 2, 22: 1, 25: 1}
+    assert index.count(20) == 2 and index.count(30) == 0
+    assert [s.id for s in index.get(18)] == [2, 6]
+    
+    # Range queries are inclusive and ordered by age
+    assert [s.id for s in index.range(18, 21)] == [2, 6, 1, 4]
+    assert index.count_range(19, 24) == 3
+    assert index.range(26, 40) == [] and index.count_range(23, 21) == 0
+    
+    # Replacing keeps the running aggregates right
+    index.replace(students[4], Student(id=5, name="Student5", age=19))
+    assert index.max_key() == 22 and index.counts()[19] == 1
+    assert index.average() == 117 / 6
+    renamed = Student(id=3, name="Renamed", age=22)
+    index.replace(students[2], renamed)
+    assert index.get(22)[0] is renamed
+    
+    # Removing the last student of an age drops that key
+    index.remove(renamed)
+    assert 22 not in index.counts() and index.max_key() == 20
+    
+    index.clear()
+    assert len(index) == 0 and index.counts() == {}
+    assert index.average() is None
+    
+    print("AgeIndex operations test passed!")
+
+def test_ordered_index_random():
+    """Test OrderedIndex on another attribute against a brute-force scan."""
+    random.seed(5)
+    index = OrderedIndex('name')
+    students = {}
+    for i in range(1, 400):
+        student = Student(id=i, name=random.choice("abcdefgh"), age=20)
+        students[i] = student
+        index.add(student)
+        if random.random() < 0.3:
+            removed = students.pop(random.choice(list(students)))
+            index.remove(removed)
+    for lo, hi in [("a", "c"), ("c", "c"), ("d", "z"), ("0", "a")]:
+        expected = sorted(s.id for s in students.values() if lo <= s.name <= hi)
+        assert sorted(s.id for s in index.range(lo, hi)) == expected
+        assert index.count_range(lo, hi) == len(expected)
+    assert sum(index.counts().values()) == len(index) == len(students)
+    assert list(index.counts()) == sorted(index.counts())
+    
+    print("OrderedIndex random test passed!")
+
+def test_secondary_index_abstract():
+    """Test that an index must implement add, remove and clear."""
+    class AddOnlyIndex(SecondaryIndex):
+        def add(self, student):
+            pass
+    
+    try:
+        AddOnlyIndex('name')
+        assert False, "Expected TypeError"
+    except TypeError:
+        pass
+    
+    class NameSetIndex(AddOnlyIndex):
+        def remove(self, student):
+            pass
+        
+        def clear(self):
+            pass
+    
+    assert NameSetIndex('name').key(Student(id=1, name="Alice", age=20)) == "Alice"
+    
+    print("SecondaryIndex abstract methods test passed!")
+
+if __name__ == "__main__":
+    test_age_index_operations()
+    test_ordered_index_random()
+    test_secondary_index_abstract()
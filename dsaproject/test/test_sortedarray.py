@@ -0,0 +1,90 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.datastructures.sortedarray import SortedArrayIndex
+from src.models.student import Student
+
+def test_sorted_array_operations():
+    """Test SortedArrayIndex operations with Student objects."""
+    index = SortedArrayIndex(load=4)
+    
+    # Insert enough students to force block splits
+    ids = [50, 20, 80, 10, 30, 70, 90, 60, 40, 5, 15, 25]
+    for student_id in ids:
+        assert index.insert(Student(id=student_id, name=f"Student {student_id}", age=20)) == True
+    assert index.size() == len(ids)
+    assert len(index._keys) > 1
+    
+    # Test search
+    assert index.search(30).name == "Student 30"
+    assert index.search(35) is None
+    assert index.search(1000) is None
+    
+    # Test update through insert
+    assert index.insert(Student(id=30, name="Alice", age=21)) == True
+    assert index.search(30).name == "Alice"
+    assert index.size() == len(ids)
+    
+    # Test sorted order, min and max
+    assert [s.id for s in index.get_all_students()] == sorted(ids)
+    assert index.get_min_student().id == 5
+    assert index.get_max_student().id == 90
+    
+    # Test deletion, including merging underfull blocks
+    for student_id in [5, 10, 15, 20, 25]:
+        assert index.delete(student_id) == True
+    assert index.delete(5) == False
+    assert [s.id for s in index.get_all_students()] == [30, 40, 50, 60, 70, 80, 90]
+    
+    print("SortedArrayIndex operations test passed!")
+
+def test_sorted_array_ordered_queries():
+    """Test order statistics and range queries."""
+    students = [Student(id=i * 10, name="Alice", age=20) for i in range(1, 101)]
+    index = SortedArrayIndex.from_sorted(students, load=8)
+    
+    assert index.size() == 100
+    assert index.select(0).id == 10
+    assert index.select(99).id == 1000
+    assert index.select(100) is None
+    assert index.rank(55) == 5
+    assert index.rank(5000) == 100
+    
+    assert [s.id for s in index.range(95, 150)] == [100, 110, 120, 130, 140, 150]
+    assert index.count_range(95, 150) == 6
+    assert [s.id for s in index.iter_inorder(97)] == [980, 990, 1000]
+    
+    assert index.floor(55).id == 50
+    assert index.floor(5) is None
+    assert index.ceiling(55).id == 60
+    assert index.ceiling(1001) is None
+    assert index.successor(10).id == 20
+    assert index.predecessor(10) is None
+    
+    try:
+        SortedArrayIndex.from_sorted([students[1], students[0]])
+        assert False, "Unsorted input should be rejected"
+    except ValueError:
+        pass
+    
+    print("SortedArrayIndex ordered queries test passed!")
+
+def test_sorted_array_iteration_protocol():
+    """Test iter(), reversed() and len() across several blocks."""
+    index = SortedArrayIndex(load=4)
+    assert list(index) == [] and list(reversed(index)) == [] and len(index) == 0
+    ids = list(range(1, 40, 3))
+    for student_id in reversed(ids):
+        index.insert(Student(id=student_id, name=f"Student {student_id}", age=20))
+    assert len(index._keys) > 1
+    assert [s.id for s in index] == ids
+    assert [s.id for s in reversed(index)] == ids[::-1]
+    assert len(index) == len(ids)
+    
+    print("SortedArrayIndex iteration protocol test passed!")
+
+if __name__ == "__main__":
+    test_sorted_array_operations()
+    test_sorted_array_ordered_queries()
+    test_sorted_array_iteration_protocol()
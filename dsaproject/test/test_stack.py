@@ -87,7 +87,82 @@ def test_operation_types():
     
     print("Operation types test passed!")
 
+def test_undo_stack_ring_buffer():
+    """Test eviction, wrap-around and limited history in the ring buffer."""
+    undo_stack = UndoStack(max_size=4)
+    students = [Student(id=i, name=f"Student{i}", age=20) for i in range(1, 11)]
+    
+    # Ten pushes into four slots keep the newest four, oldest first
+    for student in students:
+        undo_stack.push_operation('add', student)
+    assert undo_stack.size() == 4
+    assert [op.student.id for op in undo_stack.get_operation_history()] == [7, 8, 9, 10]
+    assert [op.student.id for op in undo_stack.get_operation_history(limit=2)] == [9, 10]
+    assert [op.student.id for op in undo_stack.get_operation_history(limit=10)] == [7, 8, 9, 10]
+    assert undo_stack.get_operation_history(limit=0) == []
+    
+    # Popping and pushing across the wrap-around point
+    assert undo_stack.undo_last_operation().student.id == 10
+    assert undo_stack.undo_last_operation().student.id == 9
+    undo_stack.push_operation('delete', students[0])
+    assert [op.student.id for op in undo_stack.get_operation_history()] == [7, 8, 1]
+    assert undo_stack.peek().operation_type == 'delete'
+    while not undo_stack.is_empty():
+        undo_stack.pop()
+    assert undo_stack.pop() is None and undo_stack.peek() is None
+    assert undo_stack.get_operation_history() == []
+    
+    undo_stack.push_operation('add', students[1])
+    undo_stack.clear()
+    assert undo_stack.size() == 0 and undo_stack.get_last_operation() is None
+    
+    try:
+        UndoStack(max_size=0)
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    
+    print("UndoStack ring buffer test passed!")
+
+def test_undo_stack_redo_and_positions():
+    """Test the redo list and checkpoint positions."""
+    undo_stack = UndoStack(max_size=3)
+    students = [Student(id=i, name=f"Student{i}", age=20) for i in range(1, 6)]
+    assert undo_stack.position() == 0
+    
+    for student in students[:3]:
+        undo_stack.push_operation('add', student)
+    assert undo_stack.position() == 3
+    assert [op.seq for op in undo_stack.get_operation_history()] == [1, 2, 3]
+    
+    # Undone operations can be redone, oldest first
+    assert [op.seq for op in undo_stack.undo_operations(2)] == [3, 2]
+    assert undo_stack.redo_size() == 2 and undo_stack.position() == 1
+    assert [op.seq for op in undo_stack.redo_operations(5)] == [2, 3]
+    assert undo_stack.redo_size() == 0 and undo_stack.position() == 3
+    
+    # A new operation clears the redo list
+    undo_stack.undo_last_operation()
+    undo_stack.push_operation('add', students[3])
+    assert undo_stack.redo_size() == 0
+    assert [op.seq for op in undo_stack.get_operation_history()] == [1, 2, 4]
+    
+    # count_since: undos back to a position, None if unreachable
+    assert undo_stack.count_since(4) == 0
+    assert undo_stack.count_since(1) == 2
+    assert undo_stack.count_since(0) == 3
+    assert undo_stack.count_since(3) is None  # Undone and replaced
+    undo_stack.push_operation('add', students[4])  # Evicts seq 1
+    assert undo_stack.count_since(1) == 3 and undo_stack.count_since(0) is None
+    
+    undo_stack.undo_operations(3)
+    assert undo_stack.position() == 1 and undo_stack.undo_operations(1) == []
+    
+    print("UndoStack redo and positions test passed!")
+
 if __name__ == "__main__":
     test_stack_push_pop()
     test_undo_stack()
-    test_operation_types()
\ No newline at end of file
+    test_operation_types()
+    test_undo_stack_ring_buffer()
+    test_undo_stack_redo_and_positions()
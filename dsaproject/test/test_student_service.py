@@ -1,9 +1,19 @@
 import sys
 import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.services.student_service import StudentService
+from src.services.rwlock import ReadWriteLock
+from src.datastructures.sortedarray import SortedArrayIndex
+from src.datastructures.unrolledlist import UnrolledLinkedList
+from src.datastructures.secondary_index import OrderedIndex
+from src.datastructures.bst import PersistentBinarySearchTree
 from src.models.student import Student
+from src.tracing import tracer, INFO
 
 def test_student_service_crud():
     """Test basic CRUD operations in StudentService."""
@@ -199,6 +209,655 @@ def test_data_structure_integration():
     
     print("Data structure integration test passed!")
 
+def test_student_service_paging():
+    """Test paging through students by offset."""
+    service = StudentService()
+    for i in range(25):
+        service.add_student(f"Student {i}", 20)
+    
+    page = service.get_students_page(offset=10, limit=5)
+    assert [s.id for s in page] == [11, 12, 13, 14, 15]
+    assert len(service.get_students_page(offset=20, limit=10)) == 5
+    assert service.get_students_page(offset=30) == []
+    
+    assert service.get_student_at(0).id == 1
+    assert service.get_student_at(25) is None
+    assert service.get_student_position(11) == 10
+    
+    print("Student service paging test passed!")
+
+def test_student_service_id_window():
+    """Test ID-window scans through the service."""
+    service = StudentService()
+    for student_id in [5, 10, 15, 20, 25]:
+        service.add_student(f"Student {student_id}", 20, student_id=student_id)
+    
+    assert [s.id for s in service.get_students_in_range(8, 20)] == [10, 15, 20]
+    assert [s.id for s in service.iter_students_in_range(0, 6)] == [5]
+    assert service.count_students_in_range(8, 20) == 3
+    assert service.get_next_student(10).id == 15
+    assert service.get_previous_student(10).id == 5
+    assert service.get_floor_student(12).id == 10
+    assert service.get_ceiling_student(12).id == 15
+    assert service.get_next_student(25) is None
+    
+    print("Student service ID window test passed!")
+
+def test_student_service_bulk_load():
+    """Test bulk loading records into every structure."""
+    service = StudentService()
+    service.add_student("Existing", 30, student_id=2)
+    
+    records = [("Alice", 20), ("Bob", 22, 10), Student(id=5, name="Charlie", age=19)]
+    assert service.bulk_load(records) == True
+    
+    # Auto IDs continue from next_id; explicit IDs are kept
+    assert [s.id for s in service.get_all_students()] == [2, 3, 5, 10]
+    assert [s.name for s in service.get_all_students(sorted_by_id=False)] == ["Existing", "Alice", "Bob", "Charlie"]
+    assert service.get_student(5).name == "Charlie"
+    assert service.get_student_count() == 4
+    assert service.next_id == 11
+    
+    # Duplicate IDs reject the whole batch
+    assert service.bulk_load([("Dave", 20, 12), ("Eve", 21, 5)]) == False
+    assert service.get_student_count() == 4
+    assert service.get_student(12) is None
+    
+    print("Student service bulk load test passed!")
+
+def test_student_service_sorted_array_index():
+    """Test StudentService backed by SortedArrayIndex instead of the BST."""
+    service = StudentService(index_class=SortedArrayIndex)
+    
+    service.add_student("Alice", 20)
+    service.add_student("Bob", 22)
+    service.add_student("Charlie", 19, student_id=10)
+    assert isinstance(service.bst, SortedArrayIndex)
+    assert service.get_student(10).name == "Charlie"
+    
+    assert service.update_student(1, "Alice Smith", 21) == True
+    assert service.delete_student(2) == True
+    assert service.undo_last_operation() == True
+    assert [s.id for s in service.get_all_students()] == [1, 2, 10]
+    
+    assert service.bulk_load([("Dave", 23), ("Eve", 24)]) == True
+    assert [s.id for s in service.get_students_in_range(2, 12)] == [2, 10, 11, 12]
+    
+    service.clear_all_data()
+    assert isinstance(service.bst, SortedArrayIndex)
+    assert service.get_student_count() == 0
+    
+    print("Student service SortedArrayIndex test passed!")
+
+def test_student_service_snapshot():
+    """Test that snapshots stay consistent while the service is modified."""
+    for index_class in (PersistentBinarySearchTree, SortedArrayIndex):
+        service = StudentService(index_class=index_class)
+        service.add_student("Alice", 20)
+        service.add_student("Bob", 22)
+        
+        snapshot = service.snapshot()
+        service.update_student(1, "Alice Smith", 21)
+        service.delete_student(2)
+        service.add_student("Charlie", 19)
+        
+        assert [(s.id, s.name) for s in snapshot.get_all_students()] == [(1, "Alice"), (2, "Bob")]
+        assert snapshot.search(1).age == 20
+        assert service.get_student(1).name == "Alice Smith"
+        
+        # Clearing swaps the live tree but not the snapshot
+        service.clear_all_data()
+        assert snapshot.size() == 2
+    
+    print("Student service snapshot test passed!")
+
+def test_read_write_lock():
+    """Test that readers share the lock and writers exclude them."""
+    lock = ReadWriteLock()
+    both_reading = threading.Barrier(2, timeout=5)
+    
+    def reader():
+        with lock.reader:
+            both_reading.wait()  # Only passes if two readers hold the lock together
+    
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    # Reentrant write, and reading under our own write lock
+    with lock.writer:
+        with lock.writer:
+            with lock.reader:
+                pass
+        blocked = threading.Event()
+        def blocked_reader():
+            with lock.reader:
+                blocked.set()
+        thread = threading.Thread(target=blocked_reader)
+        thread.start()
+        assert not blocked.wait(0.1)  # Writer still holds the lock
+    thread.join(5)
+    assert blocked.is_set()
+    
+    # Upgrading a read lock would deadlock, so it is refused
+    with lock.reader:
+        try:
+            lock.acquire_write()
+            assert False, "Upgrade should be refused"
+        except RuntimeError:
+            pass
+    
+    # try_acquire_read never waits: it fails while another thread writes
+    assert lock.try_acquire_read() == True
+    lock.release_read()
+    writing = threading.Event()
+    done = threading.Event()
+    def writer():
+        with lock.writer:
+            writing.set()
+            done.wait(5)
+    thread = threading.Thread(target=writer)
+    thread.start()
+    writing.wait(5)
+    assert lock.try_acquire_read() == False
+    done.set()
+    thread.join(5)
+    assert lock.try_acquire_read() == True
+    lock.release_read()
+    
+    print("Read/write lock test passed!")
+
+def test_concurrent_service_stress():
+    """Hammer a concurrent StudentService from a thread pool and check invariants."""
+    service = StudentService(concurrent=True)
+    for i in range(50):
+        service.add_student(f"Student {i}", 20)
+    errors = []
+    
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(150):
+            student_id = rng.randint(1, 80)
+            action = rng.random()
+            if action < 0.2:
+                service.add_student(f"Student {student_id}", rng.randint(18, 25), student_id=student_id)
+            elif action < 0.35:
+                service.update_student(student_id, f"Student {student_id}", rng.randint(18, 25))
+            elif action < 0.5:
+                service.delete_student(student_id)
+            elif action < 0.55:
+                service.undo_last_operation()
+            else:
+                # Readers must never see a half-applied write
+                with service._lock.reader:
+                    in_bst = service.bst.search(student_id)
+                    in_list = service.linked_list.search_by_id(student_id)
+                    if (in_bst is None) != (in_list is None):
+                        errors.append(student_id)
+                service.get_student(student_id)
+                service.search_students_by_name(f"Student {student_id}")
+                service.get_statistics()
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(16)))
+    
+    assert errors == []
+    bst_students = service.get_all_students(sorted_by_id=True)
+    list_students = service.get_all_students(sorted_by_id=False)
+    assert service.get_student_count() == len(bst_students) == len(list_students)
+    assert sorted(s.id for s in list_students) == [s.id for s in bst_students]
+    by_id = {s.id: s for s in list_students}
+    for student in bst_students:
+        assert by_id[student.id] is student  # Both structures hold the same record
+    assert all(s.id < service.next_id for s in bst_students)
+    
+    print("Concurrent service stress test passed!")
+
+def test_student_service_id_index():
+    """Test that the ID hash index stays in step with the BST and LinkedList."""
+    service = StudentService()
+    
+    def check_index():
+        bst_students = service.bst.get_all_students()
+        assert sorted(service._students) == [s.id for s in bst_students]
+        for student in bst_students:
+            assert service.get_student(student.id) is student
+            assert service._nodes[student.id].student is student
+    
+    service.add_student("Alice", 20)
+    service.add_student("Bob", 22)
+    service.add_student("Charlie", 21)
+    check_index()
+    assert service.has_student(2) == True
+    assert service.has_student(99) == False
+    
+    service.update_student(2, name="Robert")
+    check_index()
+    assert service.get_student(2).name == "Robert"
+    
+    service.delete_student(1)
+    check_index()
+    assert service.has_student(1) == False
+    
+    # Undo delete, update and add in turn
+    service.undo_last_operation()
+    check_index()
+    assert service.get_student(1).name == "Alice"
+    service.undo_last_operation()
+    check_index()
+    assert service.get_student(2).name == "Bob"
+    service.undo_last_operation()
+    check_index()
+    assert service.has_student(3) == False
+    
+    assert service.bulk_load([("Dave", 23), ("Eve", 24, 10)]) == True
+    check_index()
+    assert service.get_student(10).name == "Eve"
+    
+    # Existing IDs are rejected through the index
+    assert service.add_student("Mallory", 30, student_id=10) == False
+    
+    service.clear_all_data()
+    check_index()
+    assert service.has_student(10) == False
+    
+    print("StudentService ID index test passed!")
+
+def test_student_service_name_index():
+    """Test that exact-name search is served by the casefolded name index."""
+    service = StudentService()
+    
+    def check_index():
+        # The index must agree with a full scan of the LinkedList
+        for student in service.get_all_students():
+            expected = service.linked_list.search_by_name(student.name)
+            assert sorted(s.id for s in service.search_students_by_name(student.name)) == sorted(s.id for s in expected)
+        assert sum(len(ids) for ids in service._names.values()) == service.get_student_count()
+    
+    service.add_student("Alice", 20)
+    service.add_student("Bob", 22)
+    service.add_student("ALICE", 21)
+    check_index()
+    assert [s.id for s in service.search_students_by_name("alice")] == [1, 3]
+    
+    # Renaming moves the student between buckets; an age change does not
+    service.update_student(3, name="Carol")
+    service.update_student(1, age=25)
+    check_index()
+    assert [s.id for s in service.search_students_by_name("Alice")] == [1]
+    assert service.search_students_by_name("Alice")[0].age == 25
+    assert [s.id for s in service.search_students_by_name("carol")] == [3]
+    
+    service.delete_student(1)
+    check_index()
+    assert service.search_students_by_name("Alice") == []
+    assert "alice" not in service._names  # Empty buckets are dropped
+    
+    # Undo the delete and the age change, then the rename
+    service.undo_last_operation()
+    service.undo_last_operation()
+    check_index()
+    assert [s.id for s in service.search_students_by_name("alice")] == [1]
+    assert service.search_students_by_name("alice")[0].age == 20
+    service.undo_last_operation()
+    check_index()
+    assert sorted(s.id for s in service.search_students_by_name("alice")) == [1, 3]
+    
+    assert service.bulk_load([("Dave", 23), ("dave", 24)]) == True
+    check_index()
+    assert len(service.search_students_by_name("DAVE")) == 2
+    
+    service.clear_all_data()
+    assert service.search_students_by_name("Dave") == []
+    assert service._names == {}
+    
+    print("StudentService name index test passed!")
+
+def test_student_service_name_search_modes():
+    """Test prefix, contains and fuzzy name search through the service."""
+    service = StudentService()
+    for name, age in [("Alice Johnson", 20), ("Bob Smith", 22), ("Alice Brown", 19), ("Alicia Keys", 21)]:
+        service.add_student(name, age)
+    
+    # Prefix search is case-insensitive, alphabetical and limited
+    assert [s.id for s in service.search_students_by_prefix("alice")] == [3, 1]
+    assert [s.id for s in service.search_students_by_prefix("ALI", limit=2)] == [3, 1]
+    assert service.search_students_by_prefix("z") == []
+    
+    # Contains search matches anywhere in the name
+    assert sorted(s.id for s in service.search_students_containing("SMITH")) == [2]
+    assert sorted(s.id for s in service.search_students_containing("o")) == [1, 2, 3]
+    
+    # Fuzzy search tolerates typos, closest first
+    assert [s.id for s in service.search_students_fuzzy("Bob Smyth")] == [2]
+    assert [s.id for s in service.search_students_fuzzy("alice brwn", max_distance=1)] == [3]
+    assert service.search_students_fuzzy("alice brwn", max_distance=0) == []
+    
+    # The trie follows updates, deletes and undo
+    service.update_student(2, name="Robert Smith")
+    assert service.search_students_by_prefix("bob") == []
+    assert [s.id for s in service.search_students_by_prefix("rob")] == [2]
+    service.delete_student(1)
+    assert [s.id for s in service.search_students_by_prefix("alice")] == [3]
+    service.undo_last_operation()
+    service.undo_last_operation()
+    assert [s.id for s in service.search_students_by_prefix("bob")] == [2]
+    assert [s.id for s in service.search_students_by_prefix("alice")] == [3, 1]
+    
+    service.clear_all_data()
+    assert service.search_students_containing("") == []
+    
+    print("StudentService name search modes test passed!")
+
+def test_student_service_iter_students():
+    """Test streaming students by ID or insertion order."""
+    service = StudentService()
+    for name, age, student_id in [("Carol", 21, 30), ("Alice", 20, 10), ("Bob", 22, 20)]:
+        service.add_student(name, age, student_id=student_id)
+    
+    assert [s.id for s in service.iter_students()] == [10, 20, 30]
+    assert [s.id for s in service.iter_students(reverse=True)] == [30, 20, 10]
+    assert [s.id for s in service.iter_students(order='insertion')] == [30, 10, 20]
+    assert [s.id for s in service.iter_students(order='insertion', reverse=True)] == [20, 10, 30]
+    assert list(service.iter_students()) == service.get_all_students()
+    assert list(service.iter_students(order='insertion')) == service.get_all_students(sorted_by_id=False)
+    
+    try:
+        service.iter_students(order='name')
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    
+    print("StudentService iter_students test passed!")
+
+def test_student_service_unrolled_list():
+    """Test StudentService backed by UnrolledLinkedList instead of LinkedList."""
+    service = StudentService(list_class=UnrolledLinkedList)
+    
+    for i in range(100):
+        service.add_student(f"Student {i}", 20)
+    assert isinstance(service.linked_list, UnrolledLinkedList)
+    
+    assert service.update_student(5, "Alice Smith", 21) == True
+    for student_id in range(10, 60):
+        assert service.delete_student(student_id) == True
+    assert service.undo_last_operation() == True
+    assert service.get_student_count() == 51
+    assert [s.id for s in service.get_all_students(sorted_by_id=False)] == list(range(1, 10)) + list(range(60, 101)) + [59]
+    assert service.get_all_students(sorted_by_id=False)[4].name == "Alice Smith"
+    
+    assert service.bulk_load([("Dave", 23), ("Eve", 24)]) == True
+    assert [s.id for s in service.iter_students(order='insertion', reverse=True)][:2] == [102, 101]
+    
+    service.clear_all_data()
+    assert isinstance(service.linked_list, UnrolledLinkedList)
+    assert service.get_all_students(sorted_by_id=False) == []
+    
+    print("Student service UnrolledLinkedList test passed!")
+
+def test_student_service_age_index():
+    """Test age queries and that secondary indexes follow every write."""
+    service = StudentService()
+    for name, age in [("Alice", 20), ("Bob", 18), ("Charlie", 22), ("Diana", 20)]:
+        service.add_student(name, age)
+    
+    assert [s.id for s in service.get_students_in_age_range(18, 20)] == [2, 1, 4]
+    assert service.count_students_in_age_range(19, 22) == 3
+    assert [s.id for s in service.get_students_by_age(20)] == [1, 4]
+    assert service.count_students_by_age() == {18: 1, 20: 2, 22: 1}
+    
+    stats = service.get_statistics()
+    assert stats['min_age'] == 18 and stats['max_age'] == 22
+    assert stats['average_age'] == 20
+    assert stats['students_per_age'] == {18: 1, 20: 2, 22: 1}
+    
+    # A custom index is filled from the current roster and then maintained
+    name_index = OrderedIndex('name')
+    assert service.register_index('name', name_index) == True
+    assert service.register_index('name', OrderedIndex('name')) == False
+    assert service.get_index('name') is name_index
+    assert [s.id for s in name_index.range("B", "C~")] == [2, 3]
+    
+    def check_indexes():
+        students = service.get_all_students()
+        for attribute in ('age', 'name'):
+            index = service.get_index(attribute)
+            assert len(index) == len(students)
+            for student in students:
+                assert student in index.get(getattr(student, attribute))
+    
+    service.update_student(2, age=30)
+    service.update_student(3, name="Carl")
+    check_indexes()
+    assert service.get_statistics()['max_age'] == 30
+    service.delete_student(1)
+    check_indexes()
+    assert service.count_students_by_age() == {20: 1, 22: 1, 30: 1}
+    
+    # Undo restores every index
+    for _ in range(3):
+        service.undo_last_operation()
+        check_indexes()
+    assert service.count_students_by_age() == {18: 1, 20: 2, 22: 1}
+    assert [s.id for s in name_index.get("Charlie")] == [3]
+    
+    service.bulk_load([("Eve", 40), ("Frank", 18)])
+    check_indexes()
+    assert service.count_students_in_age_range(18, 18) == 2
+    
+    service.clear_all_data()
+    stats = service.get_statistics()
+    assert stats['min_age'] is None and stats['average_age'] is None
+    assert len(name_index) == 0
+    
+    print("StudentService age index test passed!")
+
+def test_student_service_query():
+    """Test the query planner's choice of index and its results."""
+    service = StudentService()
+    names = ["Alice", "Alicia", "Bob", "Bobby", "Carol", "Dave", "Eve", "Alan"]
+    for i in range(200):
+        service.add_student(f"{names[i % len(names)]} {i}", 18 + i % 10)
+    service.add_student("Zed", 50)
+    
+    # Each criterion is estimated from its own index
+    plan = service.explain(name_prefix="ali", age_between=(20, 21), id_range=(1, 100))
+    assert plan['estimates'] == {'id_range': 100, 'name_prefix': 50, 'age_between': 40}
+    assert plan['index'] == 'age' and plan['driver'] == 'age_between'
+    assert plan['estimated_rows'] == 40
+    assert plan['intersect'] == ['name_prefix']
+    assert plan['residual'] == ['id_range']
+    
+    # A very selective criterion drives the query on its own
+    plan = service.explain(name="zed", age_between=(18, 60))
+    assert plan['index'] == 'name' and plan['estimated_rows'] == 1
+    assert plan['residual'] == ['age_between']
+    assert service.query(name="zed", age_between=(18, 60))[0].id == 201
+    assert service.explain(name_prefix="alan")['index'] == 'name_trie'
+    assert service.explain(id_range=(5, 6))['index'] == 'bst'
+    assert service.explain()['driver'] == 'all'
+    
+    # Results match a brute-force scan for any combination
+    everyone = service.get_all_students()
+    criteria = [
+        {'name_prefix': "ali", 'age_between': (20, 21), 'id_range': (1, 100)},
+        {'name_prefix': "bob", 'age': 19},
+        {'name': "Zed"},
+        {'age_between': (25, 27), 'id_range': (150, 199)},
+        {'name_prefix': "nobody"},
+        {},
+    ]
+    for kwargs in criteria:
+        expected = [s for s in everyone
+                    if ('name' not in kwargs or s.name.casefold() == kwargs['name'].casefold())
+                    and ('name_prefix' not in kwargs or s.name.casefold().startswith(kwargs['name_prefix']))
+                    and ('age' not in kwargs or s.age == kwargs['age'])
+                    and ('age_between' not in kwargs or kwargs['age_between'][0] <= s.age <= kwargs['age_between'][1])
+                    and ('id_range' not in kwargs or kwargs['id_range'][0] <= s.id <= kwargs['id_range'][1])]
+        assert sorted(s.id for s in service.query(**kwargs)) == [s.id for s in expected]
+        assert service.query(order_by='id', **kwargs) == expected
+        assert service.query(order_by='-age', limit=5, **kwargs) == sorted(expected, key=lambda s: s.age, reverse=True)[:5]
+        assert [s.name for s in service.query(order_by='name', **kwargs)] == sorted((s.name for s in expected), key=str.casefold)
+    
+    # Rows already in index order are streamed and cut off at the limit
+    plan = service.explain(age_between=(18, 19), order_by='age', limit=3)
+    assert plan['presorted'] == True
+    assert [s.age for s in service.query(age_between=(18, 19), order_by='age', limit=3)] == [18, 18, 18]
+    assert service.explain(age_between=(18, 19), order_by='id')['presorted'] == False
+    
+    try:
+        service.query(age=20, order_by='height')
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    
+    print("StudentService query test passed!")
+
+def test_student_service_task_coalescing():
+    """Test that pending tasks scale with distinct students, not writes."""
+    service = StudentService()
+    service.add_student("Alice", 20)
+    service.add_student("Bob", 21)
+    for age in range(22, 32):
+        service.update_student(1, age=age)
+    service.delete_student(2)
+    
+    # Bob's add and delete cancelled; Alice's updates folded into her add
+    tasks = service.get_pending_tasks()
+    assert len(tasks) == 1
+    assert tasks[0]['task_type'] == 'add' and tasks[0]['student'].age == 31
+    assert service.get_statistics()['pending_tasks'] == 1
+    
+    # Coalescing can be turned off
+    service = StudentService(coalesce_tasks=False)
+    service.add_student("Alice", 20)
+    service.update_student(1, age=21)
+    assert len(service.get_pending_tasks()) == 2
+    
+    print("Task coalescing test passed!")
+
+def test_student_service_schedule_task():
+    """Test scheduling processing tasks for later."""
+    service = StudentService()
+    service.add_student("Alice", 20)
+    alice = service.get_student(1)
+    service.process_next_task()
+    
+    assert service.schedule_task('reindex', alice, delay=0.05, priority=5) == True
+    assert service.schedule_task('audit', alice, run_at=time.time() + 60) == True
+    assert service.get_statistics()['pending_tasks'] == 2
+    assert service.process_next_task() is None
+    
+    time.sleep(0.06)
+    task = service.process_next_task()
+    assert task['task_type'] == 'reindex' and task['priority'] == 5
+    assert [task['task_type'] for task in service.get_pending_tasks()] == ['audit']
+    
+    # Without a delay the task is due at once
+    service.schedule_task('audit', alice)
+    assert service.process_next_task()['task_type'] == 'audit'
+    
+    try:
+        service.schedule_task('audit', alice, run_at=time.time(), delay=1)
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    
+    print("Schedule task test passed!")
+
+def test_student_service_undo_redo():
+    """Test multi-step undo and redo applied as net changes per student."""
+    service = StudentService()
+    for name in ("Alice", "Bob", "Charlie"):
+        service.add_student(name, 20)
+    for age in range(21, 31):
+        service.update_student(1, age=age)
+    service.delete_student(2)
+    
+    # 11 operations touch two students, so only two changes are applied
+    with tracer.capture(INFO) as sink:
+        assert service.undo(11) == 11
+    assert sink.events('service.undo')[0].fields == {'operations': 11, 'students': 2}
+    assert service.get_student(1).age == 20
+    assert service.get_student(2).name == "Bob"
+    assert service.search_students_by_name("bob")[0].id == 2
+    assert service.get_statistics()['redo_operations_available'] == 11
+    
+    # Redo replays in order; undo(n) stops at the start of the history
+    assert service.redo(5) == 5
+    assert service.get_student(1).age == 25
+    assert service.redo(100) == 6
+    assert service.get_student(1).age == 30 and service.get_student(2) is None
+    assert service.redo() == 0
+    assert service.undo(100) == 14
+    assert service.get_student_count() == 0 and service.bst.size() == 0 and len(service.linked_list) == 0
+    assert service.undo() == 0 and service.undo_last_operation() == False
+    
+    # A new write clears the redo list
+    assert service.redo(3) == 3
+    service.add_student("Diana", 22)
+    assert service.redo() == 0
+    assert service.get_student_count() == 4
+    
+    # bulk_load clears the history, so an old redo cannot overwrite it
+    service = StudentService()
+    service.add_student("Alice", 20)
+    service.create_checkpoint("start")
+    assert service.undo() == 1
+    assert service.bulk_load([("Restored", 30, 1)]) == True
+    assert service.redo() == 0 and service.undo() == 0
+    assert service.undo_to_checkpoint("start") == False
+    assert service.get_student(1).name == "Restored"
+    
+    # A change that cannot be applied fails the batch instead of passing
+    service = StudentService()
+    service.add_student("Alice", 20)
+    service.bst.delete(1)  # Out of step with the lookup indexes
+    assert service.undo() == 0
+    assert service.get_student(1).name == "Alice"
+    
+    print("Undo/redo test passed!")
+
+def test_student_service_checkpoints():
+    """Test undoing back to named checkpoints."""
+    service = StudentService()
+    service.add_student("Alice", 20)
+    service.create_checkpoint('start')
+    service.add_student("Bob", 21)
+    service.update_student(1, name="Alicia")
+    service.create_checkpoint('middle')
+    service.delete_student(2)
+    
+    assert service.undo_to_checkpoint('middle') == True
+    assert service.get_student(2).name == "Bob"
+    assert service.undo_to_checkpoint('middle') == True  # Already there
+    assert service.undo_to_checkpoint('start') == True
+    assert service.get_student(1).name == "Alice" and service.get_student(2) is None
+    assert service.undo_to_checkpoint('missing') == False
+    
+    # 'middle' is now ahead of the current state and a new write replaced it
+    service.add_student("Eve", 23)
+    assert service.undo_to_checkpoint('middle') == False
+    
+    # A checkpoint is lost once operations after it are evicted
+    service = StudentService()
+    service.create_checkpoint('empty')
+    for i in range(100):
+        service.add_student(f"Student{i}", 20)
+    assert service.undo_to_checkpoint('empty') == True
+    assert service.get_student_count() == 0
+    service.redo(100)
+    service.add_student("Overflow", 20)
+    assert service.undo_to_checkpoint('empty') == False
+    assert service.get_student_count() == 101
+    
+    service.clear_all_data()
+    assert service.undo_to_checkpoint('empty') == False
+    
+    print("Checkpoint test passed!")
+
 if __name__ == "__main__":
     test_student_service_crud()
     test_student_service_search()
@@ -206,4 +865,22 @@ if __name__ == "__main__":
     test_student_service_statistics()
     test_student_service_edge_cases()
     test_data_structure_integration()
+    test_student_service_paging()
+    test_student_service_id_window()
+    test_student_service_bulk_load()
+    test_student_service_sorted_array_index()
+    test_student_service_snapshot()
+    test_read_write_lock()
+    test_concurrent_service_stress()
+    test_student_service_id_index()
+    test_student_service_name_index()
+    test_student_service_name_search_modes()
+    test_student_service_iter_students()
+    test_student_service_unrolled_list()
+    test_student_service_age_index()
+    test_student_service_query()
     print("\nAll StudentService tests passed!")
+    test_student_service_task_coalescing()
+    test_student_service_schedule_task()
+    test_student_service_undo_redo()
+    test_student_service_checkpoints()
@@ -0,0 +1,234 @@
+import sys
+import os
+import threading
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.task_executor import TaskExecutor
+from src.services.student_service import StudentService
+from src.datastructures.queue import BlockingPriorityQueue, ProcessingTask
+from src.models.student import Student
+
+def record_age(task):
+    """Module-level handler so process pools can pickle it."""
+    if task.student.age < 0:
+        raise ValueError("bad age")
+    return task.student.age
+
+def test_task_executor_threads():
+    """Test handlers, batching, failures and metrics on a thread pool."""
+    queue = BlockingPriorityQueue()
+    seen = []
+    lock = threading.Lock()
+    
+    def handle_add(task):
+        with lock:
+            seen.append(task.student.id)
+    
+    def handle_delete(task):
+        raise RuntimeError("delete failed")
+    
+    for i in range(1, 101):
+        queue.enqueue_task('add', Student(id=i, name=f"Student{i}", age=20), priority=1)
+    queue.enqueue_task('delete', Student(id=1, name="Student1", age=20), priority=3)
+    queue.enqueue_task('search', Student(id=2, name="Student2", age=20), priority=0)
+    
+    executor = TaskExecutor(queue, workers=4, batch_size=8, handlers={'add': handle_add})
+    executor.register_handler('delete', handle_delete)
+    with executor:
+        # Work enqueued while running is picked up too
+        queue.enqueue_task('add', Student(id=101, name="Late", age=20), priority=1)
+    
+    assert sorted(seen) == list(range(1, 102))
+    assert queue.is_empty()
+    metrics = executor.metrics()
+    assert metrics['completed'] == 101
+    assert metrics['failed'] == 1
+    assert metrics['unhandled'] == 1
+    assert metrics['in_flight'] == 0 and metrics['pending'] == 0
+    assert metrics['by_type'] == {'add': 101, 'delete': 1, 'search': 1}
+    assert metrics['queue_wait']['count'] == 103
+    assert metrics['run_time']['count'] == 102
+    assert 0 <= metrics['run_time']['p50'] <= metrics['run_time']['p95'] <= metrics['run_time']['max']
+    
+    print("TaskExecutor thread pool test passed!")
+
+def test_task_executor_processes():
+    """Test running batches on a process pool."""
+    queue = BlockingPriorityQueue()
+    for i in range(1, 21):
+        queue.enqueue_task('add', Student(id=i, name=f"Student{i}", age=20), priority=1)
+    queue.enqueue(ProcessingTask('add', Student(id=99, name="Bad", age=0), 1))
+    queue.get_all_tasks()[-1].student.age = -1  # Make the last task fail in the handler
+    
+    executor = TaskExecutor(queue, workers=2, mode='process', batch_size=5, handlers={'add': record_age})
+    executor.start()
+    executor.shutdown()
+    metrics = executor.metrics()
+    assert metrics['completed'] == 20
+    assert metrics['failed'] == 1
+    
+    try:
+        TaskExecutor(queue, mode='fiber')
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    
+    print("TaskExecutor process pool test passed!")
+
+def test_task_executor_shutdown_without_drain():
+    """Test that shutdown(drain=False) leaves queued tasks alone."""
+    queue = BlockingPriorityQueue()
+    started = threading.Event()
+    release = threading.Event()
+    
+    def slow(task):
+        started.set()
+        release.wait(timeout=2)
+    
+    for i in range(1, 11):
+        queue.enqueue_task('add', Student(id=i, name=f"Student{i}", age=20), priority=1)
+    executor = TaskExecutor(queue, workers=1, handlers={'add': slow}).start()
+    assert started.wait(timeout=2)
+    executor.shutdown(wait=False, drain=False)
+    release.set()
+    executor.shutdown()
+    
+    # Only what was already dispatched ran
+    assert executor.metrics()['completed'] <= 2
+    assert queue.size() >= 8
+    
+    print("TaskExecutor shutdown without drain test passed!")
+
+def test_service_bounded_task_queue():
+    """Test backpressure from a bounded task queue on a concurrent service."""
+    service = StudentService(concurrent=True, task_queue_size=4)
+    names = []
+    
+    def handle(task):
+        # Handlers may read the service while writers wait for queue room
+        student = service.get_student(task.student.id)
+        names.append(student.name if student else None)
+        time.sleep(0.001)
+    
+    executor = TaskExecutor(service.processing_queue, workers=2, handlers={'add': handle, 'update': handle})
+    executor.start()
+    for i in range(50):
+        assert service.add_student(f"Student{i}", 20) == True
+        assert service.processing_queue.size() <= 4
+    service.update_student(1, name="Renamed")
+    executor.shutdown()
+    
+    assert service.get_student_count() == 50
+    assert executor.metrics()['completed'] == 51
+    assert len(names) == 51 and None not in names
+    assert service.get_pending_tasks() == []
+    
+    # Without an executor a full queue still accepts the write, and the
+    # task is queued once there is room
+    service = StudentService(task_queue_size=1)
+    service.add_student("Alice", 20)
+    writer = threading.Thread(target=lambda: service.add_student("Bob", 21))
+    writer.start()
+    time.sleep(0.05)
+    assert service.get_student(2).name == "Bob"  # The write itself completed
+    assert service.process_next_task()['student'].name == "Alice"
+    writer.join(timeout=2)
+    assert service.process_next_task()['student'].name == "Bob"
+    
+    # A write on another thread never overtakes a task still waiting for room
+    service = StudentService(concurrent=True, task_queue_size=1, coalesce_tasks=False)
+    service.add_student("Filler", 20)
+    adder = threading.Thread(target=lambda: service.add_student("Alice", 20, student_id=2))
+    adder.start()
+    time.sleep(0.05)  # The add is deferred, waiting for room
+    assert service.process_next_task()['student'].name == "Filler"
+    deleter = threading.Thread(target=lambda: service.delete_student(2))
+    deleter.start()
+    deleter.join(timeout=0.05)
+    order = [service.processing_queue.get(timeout=2).task_type for _ in range(2)]
+    adder.join(timeout=2)
+    deleter.join(timeout=2)
+    assert order == ['add', 'delete']
+    
+    print("Service bounded task queue test passed!")
+
+def wait_for(condition, timeout=2.0):
+    """Poll until condition() is true or timeout seconds pass."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+def test_task_executor_delayed_and_retries():
+    """Test scheduled tasks, retry with backoff and prompt shutdown."""
+    queue = BlockingPriorityQueue()
+    ran_at = {}
+    attempts = []
+    
+    def handle(task):
+        ran_at[task.student.id] = time.monotonic()
+    
+    def flaky(task):
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise RuntimeError("try again")
+    
+    executor = TaskExecutor(queue, workers=2, handlers={'add': handle, 'update': flaky},
+                            retries=2, retry_backoff=0.02)
+    executor.start()
+    start = time.monotonic()
+    queue.enqueue_task('add', Student(id=1, name="Later", age=20), priority=1, delay=0.1)
+    queue.enqueue_task('add', Student(id=2, name="Now", age=20), priority=1)
+    queue.enqueue_task('update', Student(id=3, name="Flaky", age=20), priority=2)
+    time.sleep(0.05)
+    assert 2 in ran_at and 1 not in ran_at
+    assert wait_for(lambda: executor.metrics()['completed'] == 3)
+    executor.shutdown()
+    
+    assert ran_at[1] - start >= 0.1
+    assert len(attempts) == 3
+    # Backoff doubles: 0.02s, then 0.04s
+    assert attempts[1] - attempts[0] >= 0.02 and attempts[2] - attempts[1] >= 0.04
+    metrics = executor.metrics()
+    assert metrics['completed'] == 3 and metrics['retried'] == 2 and metrics['failed'] == 0
+    assert queue.is_empty()
+    
+    # Retries run out: the last failure counts as failed
+    executor = TaskExecutor(queue, handlers={'update': flaky}, retries=1, retry_backoff=0.01).start()
+    attempts.clear()  # flaky fails its first two runs again
+    queue.enqueue_task('update', Student(id=4, name="Doomed", age=20))
+    assert wait_for(lambda: executor.metrics()['failed'] == 1)
+    executor.shutdown()
+    assert executor.metrics()['retried'] == 1 and executor.metrics()['failed'] == 1
+    
+    # An idle dispatcher is woken by shutdown rather than a poll timer
+    executor = TaskExecutor(queue).start()
+    time.sleep(0.01)
+    start = time.monotonic()
+    executor.shutdown()
+    assert time.monotonic() - start < 0.5
+    
+    # Draining does not wait for tasks that are not yet due: they stay queued
+    executor = TaskExecutor(queue, handlers={'add': handle, 'update': flaky}, retries=1, retry_backoff=3600).start()
+    attempts.clear()
+    ran_at.clear()
+    queue.enqueue_task('add', Student(id=5, name="NextHour", age=20), delay=3600)
+    queue.enqueue_task('add', Student(id=6, name="Now", age=20))
+    queue.enqueue_task('update', Student(id=7, name="Retried", age=20))
+    start = time.monotonic()
+    executor.shutdown()
+    assert time.monotonic() - start < 0.5
+    assert 6 in ran_at and 5 not in ran_at
+    assert executor.metrics()['retried'] == 1
+    assert sorted(task.student.id for task in queue.get_all_tasks()) == [5, 7]
+    assert queue.size() == 2 and queue.ready_size() == 0
+    
+    print("TaskExecutor delayed tasks and retries test passed!")
+
+if __name__ == "__main__":
+    test_task_executor_threads()
+    test_task_executor_processes()
+    test_task_executor_shutdown_without_drain()
+    test_service_bounded_task_queue()
+    test_task_executor_delayed_and_retries()
@@ -0,0 +1,64 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.tracing import tracer, Tracer, RingBufferSink, DEBUG, INFO, WARNING, ERROR
+from src.services.student_service import StudentService
+
+def test_tracer_levels_and_sinks():
+    """Test level filtering and the ring buffer sink."""
+    sink = RingBufferSink(capacity=3)
+    trace = Tracer(level=INFO, sinks=[sink])
+    
+    assert trace.debug_enabled == False
+    assert trace.info_enabled == True
+    
+    trace.emit(DEBUG, 'test.debug', "hidden")
+    trace.emit(INFO, 'test.info', "shown", value=1)
+    assert len(sink) == 1
+    event = sink.events()[0]
+    assert event.name == 'test.info'
+    assert event.fields == {'value': 1}
+    assert str(event) == "[INFO] test.info: shown"
+    
+    # Ring buffer keeps only the most recent events
+    for i in range(5):
+        trace.emit(ERROR, 'test.error', f"error {i}")
+    assert [e.message for e in sink.events()] == ["error 2", "error 3", "error 4"]
+    
+    # No sinks means nothing is enabled
+    trace.remove_sink(sink)
+    trace.set_level(DEBUG)
+    assert trace.debug_enabled == False
+    
+    print("Tracer levels and sinks test passed!")
+
+def test_service_trace_capture():
+    """Test that service operations are silent by default and traceable on demand."""
+    assert tracer.level == WARNING
+    assert tracer.debug_enabled == False
+    
+    service = StudentService()
+    with tracer.capture(DEBUG) as sink:
+        service.add_student("Alice", 20)
+        service.get_student(1)
+    
+    names = [event.name for event in sink.events()]
+    assert 'bst.insert' in names
+    assert 'linkedlist.insert_at_tail' in names
+    assert 'stack.push' in names
+    assert 'queue.enqueue' in names
+    assert 'service.add' in names
+    assert sink.events('bst.insert')[0].fields == {'student_id': 1}
+    # Point lookups are served by the hash index and never reach the BST
+    assert sink.events('bst.search') == []
+    
+    # Capturing restores the previous configuration
+    assert tracer.level == WARNING
+    assert tracer.debug_enabled == False
+    
+    print("Service trace capture test passed!")
+
+if __name__ == "__main__":
+    test_tracer_levels_and_sinks()
+    test_service_trace_capture()
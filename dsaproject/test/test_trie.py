@@ -0,0 +1,96 @@
+import sys
+import os
+import random
+from itertools import islice
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.datastructures.trie import NameTrie
+
+def levenshtein(a, b):
+    row = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        prev, row[0] = row[0], i
+        for j, cb in enumerate(b, 1):
+            prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (ca != cb))
+    return row[-1]
+
+def test_trie_prefix_and_contains():
+    """Test NameTrie insertion, removal, prefix and substring search."""
+    trie = NameTrie()
+    names = {1: "Alice", 2: "Alicia", 3: "Bob", 4: "ALICE", 5: "Malice", 6: "Al"}
+    for student_id, name in names.items():
+        trie.insert(name, student_id)
+    assert len(trie) == 6
+    
+    # Exact lookups are case-insensitive
+    assert trie.get("alice") == [1, 4]
+    assert trie.get("Ali") == []
+    
+    # Prefix search is alphabetical and counted per node
+    assert list(trie.iter_prefix("al")) == [6, 1, 4, 2]
+    assert trie.count_prefix("AL") == 4
+    assert trie.count_prefix("ali") == 3
+    assert trie.count_prefix("x") == 0
+    assert list(trie.iter_prefix("")) == [6, 1, 4, 2, 3, 5]
+    
+    # Contains search finds the substring anywhere
+    assert list(trie.iter_contains("lic")) == [1, 4, 2, 5]
+    assert list(trie.iter_contains("LICE")) == [1, 4, 5]
+    assert list(trie.iter_contains("e")) == [1, 4, 5]
+    assert list(trie.iter_contains("zzz")) == []
+    assert list(trie.iter_contains("alicex")) == []
+    assert list(trie.iter_contains("")) == [6, 1, 4, 2, 3, 5]
+    
+    # Results are lazy, so a limit stops the walk early
+    assert list(islice(trie.iter_prefix("a"), 2)) == [6, 1]
+    
+    # Removing prunes empty branches and keeps counts right
+    assert trie.remove("Alicia", 2) == True
+    assert trie.remove("Alicia", 2) == False
+    assert trie.remove("Nobody", 1) == False
+    assert "i" not in trie._find("alic").children
+    assert trie.count_prefix("al") == 3
+    for student_id in (1, 4, 6, 5, 3):
+        assert trie.remove(names[student_id], student_id) == True
+    assert len(trie) == 0
+    assert trie.root.children == {}
+    assert trie._grams == {}
+    
+    print("NameTrie prefix and contains test passed!")
+
+def test_trie_fuzzy():
+    """Test bounded edit-distance search against a brute-force reference."""
+    trie = NameTrie()
+    trie.insert("Jon", 1)
+    trie.insert("John", 2)
+    trie.insert("Joan", 3)
+    trie.insert("Jonathan", 4)
+    
+    # Closest matches come first
+    assert list(trie.iter_fuzzy("jon", 1)) == [(1, 0), (3, 1), (2, 1)]
+    assert list(trie.iter_fuzzy("jhon", 0)) == []
+    assert list(trie.iter_fuzzy("jhon", 2)) == [(1, 1), (3, 2), (2, 2)]
+    
+    random.seed(7)
+    alphabet = "abc"
+    trie = NameTrie()
+    names = {}
+    for student_id in range(300):
+        names[student_id] = "".join(random.choice(alphabet) for _ in range(random.randint(1, 6)))
+        trie.insert(names[student_id], student_id)
+    for _ in range(30):
+        query = "".join(random.choice(alphabet) for _ in range(random.randint(0, 6)))
+        for max_distance in range(3):
+            expected = {student_id: levenshtein(query, name) for student_id, name in names.items()
+                        if levenshtein(query, name) <= max_distance}
+            found = list(trie.iter_fuzzy(query, max_distance))
+            assert dict(found) == expected
+            assert len(found) == len(expected)
+            distances = [distance for _, distance in found]
+            assert distances == sorted(distances)
+    
+    print("NameTrie fuzzy test passed!")
+
+if __name__ == "__main__":
+    test_trie_prefix_and_contains()
+    test_trie_fuzzy()
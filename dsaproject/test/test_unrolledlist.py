@@ -0,0 +1,92 @@
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.datastructures.unrolledlist import UnrolledLinkedList
+from src.datastructures.linkedlist import LinkedList
+from src.models.student import Student
+
+def test_unrolled_list_operations():
+    """Test UnrolledLinkedList operations with Student objects."""
+    ul = UnrolledLinkedList(chunk_size=4)
+    
+    handles = {}
+    for i in range(1, 11):
+        handles[i] = ul.append(Student(id=i, name=f"Student{i}", age=20))
+    assert ul.size() == 10
+    assert [s.id for s in ul] == list(range(1, 11))
+    assert [s.id for s in reversed(ul)] == list(range(10, 0, -1))
+    assert handles[1] is handles[4] and handles[5] is not handles[4]
+    
+    # Test insertion at head and search
+    assert ul.insert_at_head(Student(id=0, name="Zero", age=19)) == True
+    assert ul.get_all_students()[0].id == 0
+    assert ul.search_by_id(7).name == "Student7"
+    assert ul.search_by_id(99) is None
+    assert [s.id for s in ul.search_by_name("student3")] == [3]
+    
+    # Delete through handles leaves tombstones, then compacts the chunk
+    assert ul.delete_by_id(6, handles[6]) == True
+    assert handles[6].students.count(None) == 1
+    assert ul.delete_by_id(7, handles[7]) == True
+    assert ul.delete_by_id(8, handles[8]) == True
+    assert None not in handles[8].students
+    assert ul.delete_by_id(6, handles[6]) == False
+    
+    # Emptying a chunk unlinks it; its handle is no longer trusted
+    assert ul.delete_by_id(5, handles[5]) == True
+    assert handles[5].prev is None and handles[5] is not ul.head
+    assert ul.replace_student(Student(id=5, name="Ghost", age=1), handles[5]) == False
+    assert [s.id for s in ul] == [0, 1, 2, 3, 4, 9, 10]
+    assert ul.size() == 7
+    
+    # Replace and update find the student through the handle or a scan
+    assert ul.replace_student(Student(id=9, name="Nina", age=22), handles[9]) == True
+    assert ul.update_student(10, "Ten", 30) == True
+    assert ul.search_by_id(9).name == "Nina"
+    assert ul.search_by_id(10).age == 30
+    
+    ul.clear()
+    assert ul.is_empty() == True
+    assert list(ul) == [] and len(ul) == 0
+    
+    print("All UnrolledLinkedList tests passed!")
+
+def test_unrolled_list_matches_linked_list():
+    """Test UnrolledLinkedList against LinkedList under random operations."""
+    random.seed(11)
+    ul = UnrolledLinkedList(chunk_size=8)
+    ll = LinkedList()
+    handles = {}
+    next_id = 1
+    for _ in range(3000):
+        action = random.random()
+        if action < 0.5 or not handles:
+            student = Student(id=next_id, name=f"Student{next_id}", age=20)
+            handles[next_id] = (ul.append(student), ll.append(student))
+            next_id += 1
+        elif action < 0.9:
+            student_id = random.choice(list(handles))
+            chunk, node = handles.pop(student_id)
+            assert ul.delete_by_id(student_id, chunk) == ll.delete_by_id(student_id, node) == True
+        else:
+            students = [Student(id=next_id + i, name="Bulk", age=21) for i in range(random.randint(1, 20))]
+            for student, chunk, node in zip(students, ul.extend(students), ll.extend(students)):
+                handles[student.id] = (chunk, node)
+            next_id += len(students)
+        assert len(ul) == len(ll)
+    assert list(ul) == list(ll)
+    assert list(reversed(ul)) == list(reversed(ll))
+    
+    # Every live chunk holds at least one student and stays within capacity
+    chunk = ul.head
+    while chunk:
+        assert 0 < chunk.live <= len(chunk.students) <= 8
+        chunk = chunk.next
+    
+    print("UnrolledLinkedList matches LinkedList test passed!")
+
+if __name__ == "__main__":
+    test_unrolled_list_operations()
+    test_unrolled_list_matches_linked_list()
@@ -11,6 +11,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from dsaproject.src.ui.app import main
+from dsaproject.src.tracing import trace_to_console
 
 if __name__ == "__main__":
     print("Starting DSA Project - Student Management System")
@@ -20,4 +21,7 @@ if __name__ == "__main__":
     print("- Stack for undo operations")
     print("- Queue for task processing")
     print("-" * 50)
+    if os.environ.get("DSA_TRACE"):
+        # Print every data structure operation, e.g. DSA_TRACE=1 python main.py
+        trace_to_console()
     main()
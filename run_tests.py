@@ -43,10 +43,17 @@ def main():
     # List of test files
     test_files = [
         "test_bst.py",
+        "test_sortedarray.py",
         "test_linkedlist.py",
+        "test_unrolledlist.py",
+        "test_trie.py",
+        "test_secondary_index.py",
         "test_stack.py",
         "test_queue.py",
-        "test_student_service.py"
+        "test_student_service.py",
+        "test_task_executor.py",
+        "test_async_service.py",
+        "test_tracing.py"
     ]
     
     results = []